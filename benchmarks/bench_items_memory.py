@@ -0,0 +1,113 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+# Compares memory used by PropItems of loaded files against former, __dict__ based items.
+#
+# Usage:
+#   python -m benchmarks.bench_items_memory [LINES] [LANGUAGES]
+#
+# Defaults to reference file of 100k lines plus one translation.
+#
+"""
+
+import gc
+import random
+import string
+import sys
+import tracemalloc
+from typing import List, Optional
+
+from transtool.prop.items import Blank, Comment, PropItem, Translation
+
+
+class DictItem(object):
+    """
+    Former PropItem layout: per-instance __dict__, new object for each blank line, no interning.
+    """
+
+    def __init__(self, value: Optional[str] = None, key: Optional[str] = None):
+        self.value = value
+        self.key = key
+
+
+class DictTranslation(DictItem):
+    def __init__(self, key: str, value: str, separator: str = '='):
+        super().__init__(value, key)
+        self.separator = separator
+
+
+def generate_lines(count: int, seed: int = 0) -> List[str]:
+    rnd = random.Random(seed)
+    lines = []
+    for idx in range(count):
+        kind = rnd.choices(['translation', 'comment', 'blank'], [10, 3, 2])[0]
+        if kind == 'blank':
+            lines.append('')
+        elif kind == 'comment':
+            lines.append('# ' + ''.join(rnd.choices(string.ascii_letters + ' ', k=rnd.randint(10, 60))))
+        else:
+            key = f'section{idx % 100}.key{idx}'
+            value = ''.join(rnd.choices(string.ascii_letters + ' ', k=rnd.randint(5, 60)))
+            lines.append(f'{key} = {value}')
+    return lines
+
+
+def build_current(lines: List[str]) -> List[PropItem]:
+    items = []
+    for line in lines:
+        if not line:
+            items.append(Blank())
+        elif line[0] == '#':
+            items.append(Comment(line))
+        else:
+            # Slicing yields new key string object for each file, like reading each file does.
+            key, value = line.split(' = ', 1)
+            items.append(Translation(key, value, line[len(key) + 1]))
+    return items
+
+
+def build_dict_based(lines: List[str]) -> List[DictItem]:
+    items = []
+    for line in lines:
+        if not line:
+            items.append(DictItem())
+        elif line[0] == '#':
+            items.append(DictItem(line))
+        else:
+            key, value = line.split(' = ', 1)
+            items.append(DictTranslation(key, value, line[len(key) + 1]))
+    return items
+
+
+def measure(builder, lines: List[str], files: int) -> int:
+    gc.collect()
+    tracemalloc.start()
+    # Each file (reference and translations) is parsed separately and kept in memory.
+    loaded = [builder(lines) for _ in range(files)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del loaded
+    return current
+
+
+def main(line_cnt: int = 100_000, languages: int = 1) -> None:
+    lines = generate_lines(line_cnt)
+    files = languages + 1
+    # Source lines are generated up front and are not traced. Items and the key and value strings
+    # created while building them are.
+    before = measure(build_dict_based, lines, files)
+    after = measure(build_current, lines, files)
+
+    print(f'Lines: {line_cnt}, files: {files} (reference + {languages} translation(s))')
+    print(f'  __dict__ items   {before / 1024 / 1024:8.2f} MiB')
+    print(f'  compact items    {after / 1024 / 1024:8.2f} MiB  ({(1 - after / before) * 100:.0f}% less)')
+
+
+if __name__ == '__main__':
+    args = [int(arg) for arg in sys.argv[1:3]]
+    main(*args)
@@ -0,0 +1,93 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+# Compares Translation.parse_translation_line() against the escape-aware only separator scan.
+#
+# Usage:
+#   python -m benchmarks.bench_parse_translation_line [FILE.properties ...]
+#
+# If no file is given, synthetic bundle of 100k translations is used.
+#
+"""
+
+import random
+import string
+import sys
+import timeit
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from transtool.config.config import Config
+from transtool.prop.items import Translation
+
+
+def parse_escape_aware(line: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Parser using escape-aware separator scan for every line (pre fast-path behavior).
+    """
+    if len(line) < Translation.MIN_LINE_LENGTH:
+        return None
+    separator_pos = Translation.find_separator(line)
+    if separator_pos is None:
+        return None
+    key = line[:separator_pos].strip()
+    sep = line[separator_pos].strip()
+    val = line[separator_pos + 1:].lstrip()
+    if key == '' or sep == '':
+        return None
+    return key, sep, val
+
+
+def generate_lines(count: int, seed: int = 0) -> List[str]:
+    rnd = random.Random(seed)
+    lines = []
+    for idx in range(count):
+        key = '.'.join(''.join(rnd.choices(string.ascii_lowercase, k=rnd.randint(3, 10)))
+                       for _ in range(rnd.randint(2, 5)))
+        value = ' '.join(''.join(rnd.choices(string.ascii_letters, k=rnd.randint(2, 9)))
+                         for _ in range(rnd.randint(1, 15)))
+        if idx % 50 == 0:
+            # Some keys use escaped separators.
+            key = f'{key}\\:{idx}'
+        lines.append(f'{key} {rnd.choice(Config.ALLOWED_SEPARATORS)} {value}')
+    return lines
+
+
+def load_lines(files: List[str]) -> List[str]:
+    lines = []
+    for file in files:
+        with open(Path(file), 'r') as fh:
+            for line in fh:
+                line = line.rstrip('\r\n')
+                if line.strip() and line[0] not in Config.ALLOWED_COMMENT_MARKERS:
+                    lines.append(line)
+    return lines
+
+
+def main(files: List[str]) -> None:
+    lines = load_lines(files) if files else generate_lines(100_000)
+
+    for line in lines:
+        if parse_escape_aware(line) != Translation.parse_translation_line(line):
+            raise AssertionError(f'Results differ for: {line}')
+
+    repeat = 5
+    results = {}
+    for label, func in [('escape-aware scan', parse_escape_aware),
+                        ('fast path', Translation.parse_translation_line)]:
+        timer = timeit.Timer(lambda func=func: [func(line) for line in lines])
+        results[label] = min(timer.repeat(repeat=repeat, number=1))
+
+    print(f'Lines: {len(lines)}, best of {repeat}')
+    base = results['escape-aware scan']
+    for label, elapsed in results.items():
+        print(f'  {label:20} {elapsed * 1000:9.1f} ms  {len(lines) / elapsed:12,.0f} lines/s  x{base / elapsed:.2f}')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,198 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+# Benchmarks loading, each checker, updating and saving and end-to-end runs against synthetic
+# bundle (see benchmarks.generator), reporting throughput in keys per second.
+#
+# Usage:
+#   python -m benchmarks.bench_suite [--keys N] [--languages N] [--repeat N] [--json FILE] [--baseline FILE]
+#
+# Use --json to store results and --baseline to compare current results against stored ones.
+# See --help for all the options.
+#
+"""
+
+import argparse
+import io
+import json
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from benchmarks import generator
+from transtool.checks.base.engine import CheckEngine
+from transtool.checks.base.memo import ResultMemo
+from transtool.config.builder import ConfigBuilder
+from transtool.config.config import Config
+from transtool.main import TransTool
+from transtool.prop.file import PropFile
+
+
+class Suite(object):
+
+    def __init__(self, base_file: Path, languages: List[str], repeat: int):
+        self.base_file = base_file
+        self.languages = languages
+        self.repeat = repeat
+
+        self.config = Config()
+        self.config.color = False
+        ConfigBuilder._setup_checkers(self.config)  # noqa: WPS437
+        for checker_info in self.config.checks.values():
+            checker_info.prepare()
+
+        # Benchmark name -> (best time in seconds, number of keys processed).
+        self.results: Dict[str, Tuple[float, int]] = {}
+
+    def get_translation_file(self, lang: str) -> Path:
+        return TransTool._get_translation_path(self.base_file, lang)  # noqa: WPS437
+
+    def measure(self, name: str, func: Callable[[], int], setup: Optional[Callable[[], None]] = None) -> None:
+        """
+        Runs func() `repeat` times and records the best time. func() returns number of keys processed.
+        """
+        best = None
+        keys = 0
+        for _ in range(self.repeat):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            keys = func()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        self.results[name] = (best, keys)
+
+    def load(self, lang: Optional[str] = None) -> PropFile:
+        propfile = PropFile(self.config)
+        if lang is None:
+            propfile.load(self.base_file)
+        else:
+            propfile.load(self.get_translation_file(lang), lang)
+        return propfile
+
+    # #################################################################################################
+
+    def bench_load(self) -> None:
+        def load_all() -> int:
+            files = [self.load()] + [self.load(lang) for lang in self.languages]
+            return sum(len(propfile.keys) for propfile in files)
+
+        self.measure('load', load_all)
+
+    def bench_checkers(self) -> None:
+        reference = self.load().view()
+        translations = [self.load(lang).view() for lang in self.languages]
+        for checker_id, checker_info in self.config.checks.items():
+            engine = CheckEngine([checker_info.checker])
+
+            def check_all(engine: CheckEngine = engine) -> int:
+                for translation in translations:
+                    engine.run(translation, reference)
+                return sum(len(translation.keys) for translation in translations)
+
+            self.measure(f'check: {checker_id}', check_all)
+
+    def bench_update_save(self, target_dir: Path) -> None:
+        reference = self.load()
+        translations: List[PropFile] = []
+
+        def setup() -> None:
+            translations.clear()
+            for lang in self.languages:
+                translation = self.load(lang)
+                # Save into separate directory, to keep the bundle intact.
+                translation.file = target_dir / translation.file.name
+                translations.append(translation)
+            # Ensure files are written, not skipped as unchanged.
+            for file in target_dir.iterdir():
+                file.unlink()
+
+        def update_save() -> int:
+            with redirect_stdout(io.StringIO()):
+                for translation in translations:
+                    translation.update(reference)
+                    translation.save()
+            return sum(len(translation.keys) for translation in translations)
+
+        self.measure('update + save', update_save, setup)
+
+    def bench_start(self, name: str, args: List[str]) -> None:
+        keys = len(self.load().keys) + sum(len(self.load(lang).keys) for lang in self.languages)
+
+        def setup() -> None:
+            # Each run should start as fresh process would.
+            ResultMemo._shared = None  # noqa: WPS437
+
+        def start() -> int:
+            argv = sys.argv
+            sys.argv = ['trans-tool', '--base', str(self.base_file), '--lang', *self.languages, '--no-color', *args]
+            try:
+                with redirect_stdout(io.StringIO()):
+                    TransTool.start()
+            finally:
+                sys.argv = argv
+            return keys
+
+        self.measure(name, start, setup)
+
+    # #################################################################################################
+
+    def report(self, baseline: Optional[Dict[str, Dict]] = None) -> None:
+        print(f'{"Benchmark":40} {"best time":>12} {"keys/s":>14}' + (f' {"vs baseline":>12}' if baseline else ''))
+        for name, (elapsed, keys) in self.results.items():
+            line = f'{name:40} {elapsed * 1000:9.1f} ms {keys / elapsed:14,.0f}'
+            if baseline and name in baseline:
+                old_rate = baseline[name]['keys_per_sec']
+                line += f' {(keys / elapsed / old_rate - 1) * 100:+11.1f}%'
+            print(line)
+
+    def to_json(self) -> Dict[str, Dict]:
+        return {name: {'seconds': elapsed, 'keys': keys, 'keys_per_sec': keys / elapsed}
+                for name, (elapsed, keys) in self.results.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmarks trans-tool against synthetic bundle.')
+    generator.add_arguments(parser)
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Runs of each benchmark (best is reported). Default: %(default)s.')
+    parser.add_argument('--json', metavar='FILE', help='Writes results to given JSON file.')
+    parser.add_argument('--baseline', metavar='FILE', help='Compares results with ones stored with --json.')
+    args = parser.parse_args()
+
+    bundle_generator = generator.from_arguments(args)
+    languages = generator.BundleGenerator.get_language_codes(args.languages)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        base_file = bundle_generator.write(Path(tmp_dir) / 'bundle')
+        print(f'Keys: {args.keys}, languages: {args.languages}, best of {args.repeat}')
+
+        suite = Suite(base_file, languages, args.repeat)
+        suite.bench_load()
+        suite.bench_checkers()
+        saved_dir = Path(tmp_dir) / 'saved'
+        saved_dir.mkdir()
+        suite.bench_update_save(saved_dir)
+        suite.bench_start('TransTool.start()', [])
+        suite.bench_start('TransTool.start() --columnar', ['--columnar'])
+        suite.bench_start('TransTool.start() --memo', ['--memo'])
+
+    baseline = None
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+    suite.report(baseline)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(suite.to_json(), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+# Generates synthetic *.properties bundle (base file and its translations) for benchmarking.
+#
+# Usage:
+#   python -m benchmarks.generator DIR [--keys N] [--languages N] [...]
+#
+# See --help for all the options.
+#
+"""
+
+import argparse
+import random
+import string
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+
+class BundleGenerator(object):
+    """
+    Generates base file and its translations. Translations are based on the base file, with some
+    keys missing, some dangling keys and small share of values with typical issues (unbalanced
+    brackets, trailing spaces etc.), so checkers have something to report.
+    """
+
+    PLACEHOLDERS = ['%s', '%d', '{0}', '{1}', '%1$s']
+    ISSUES = ['bracket', 'trailing', 'dots', 'quote', 'case']
+
+    def __init__(self, keys: int = 10_000, languages: int = 5, value_length: Tuple[int, int] = (5, 80),
+                 brackets: float = 0.1, placeholders: float = 0.2, quotes: float = 0.05,
+                 missing: float = 0.02, issues: float = 0.01, seed: int = 0):
+        """
+        :param keys: Number of translation keys in base file.
+        :param languages: Number of translations.
+        :param value_length: Min and max length of generated values (in chars).
+        :param brackets: Share of values containing brackets.
+        :param placeholders: Share of values containing formatting placeholders.
+        :param quotes: Share of values containing quoted text.
+        :param missing: Share of base keys missing in each translation.
+        :param issues: Share of translated values with (intentional) issues.
+        :param seed: Random generator seed, so generated bundles are reproducible.
+        """
+        self.keys = keys
+        self.languages = languages
+        self.value_length = value_length
+        self.brackets = brackets
+        self.placeholders = placeholders
+        self.quotes = quotes
+        self.missing = missing
+        self.issues = issues
+        self.rnd = random.Random(seed)
+
+    @staticmethod
+    def get_language_codes(count: int) -> List[str]:
+        """
+        Returns list of (made up) language codes, in form accepted by trans-tool.
+        """
+        letters = string.ascii_lowercase
+        return [f'{letters[idx // len(letters) % len(letters)]}{letters[idx % len(letters)]}' for idx in range(count)]
+
+    def _word(self) -> str:
+        return ''.join(self.rnd.choices(string.ascii_lowercase, k=self.rnd.randint(2, 9)))
+
+    def _value(self) -> str:
+        length = self.rnd.randint(*self.value_length)
+        words = []
+        while sum(len(word) + 1 for word in words) < length:
+            words.append(self._word())
+        if self.rnd.random() < self.placeholders:
+            words.insert(self.rnd.randrange(len(words) + 1), self.rnd.choice(self.PLACEHOLDERS))
+        if self.rnd.random() < self.brackets:
+            pos = self.rnd.randrange(len(words))
+            words[pos] = f'({words[pos]})'
+        if self.rnd.random() < self.quotes:
+            pos = self.rnd.randrange(len(words))
+            words[pos] = f'"{words[pos]}"'
+        value = ' '.join(words)
+        return f'{value[0].upper()}{value[1:]}.'
+
+    def _translate(self, value: str) -> str:
+        """
+        Returns "translation" of the value, keeping its placeholders, brackets and quotes.
+        """
+        words = value.split(' ')
+        translated = [word if not word.isalpha() else self._word() for word in words]
+        translated = ' '.join(translated)
+        translated = f'{translated[0].upper()}{translated[1:]}'
+        if self.rnd.random() < self.issues:
+            issue = self.rnd.choice(self.ISSUES)
+            if issue == 'bracket':
+                translated += ' (oops'
+            elif issue == 'trailing':
+                translated += '  '
+            elif issue == 'dots':
+                translated += '...'
+            elif issue == 'quote':
+                translated += ' "oops'
+            else:
+                translated = translated.lower()
+        return translated
+
+    def generate(self) -> Tuple[List[str], List[Tuple[str, List[str]]]]:
+        """
+        Returns lines of the base file and list of (language code, translation lines) tuples.
+        """
+        entries: List[Tuple[Optional[str], str]] = []
+        for idx in range(self.keys):
+            if idx % 10 == 0:
+                entries.append((None, ''))
+                entries.append((None, f'# Section {idx // 10}: {self._word()} {self._word()}'))
+            entries.append((f'section{idx // 10}.{self._word()}.key{idx}', self._value()))
+
+        base_lines = [value if key is None else f'{key} = {value}' for key, value in entries]
+
+        translations = []
+        for lang in self.get_language_codes(self.languages):
+            lines = []
+            for key, value in entries:
+                if key is None:
+                    lines.append(value)
+                elif self.rnd.random() >= self.missing:
+                    lines.append(f'{key} = {self._translate(value)}')
+            # Some dangling keys.
+            for idx in range(max(1, int(self.keys * self.missing / 2))):
+                lines.append(f'dangling.key{idx} = {self._word()}')
+            translations.append((lang, lines))
+
+        return base_lines, translations
+
+    def write(self, target_dir: Path, name: str = 'bundle') -> Path:
+        """
+        Writes generated bundle into given directory. Returns path to the base file.
+
+        :param target_dir: Directory to write the files to. Created if needed.
+        :param name: Name prefix of the files.
+        """
+        target_dir.mkdir(parents=True, exist_ok=True)
+        base_lines, translations = self.generate()
+        base_file = target_dir / f'{name}.properties'
+        base_file.write_text('\n'.join(base_lines) + '\n', encoding='utf-8')
+        for lang, lines in translations:
+            (target_dir / f'{name}_{lang}.properties').write_text('\n'.join(lines) + '\n', encoding='utf-8')
+        return base_file
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Adds BundleGenerator options to given parser.
+    """
+    parser.add_argument('--keys', type=int, default=10_000, help='Number of keys in base file. Default: %(default)s.')
+    parser.add_argument('--languages', type=int, default=5, help='Number of translations. Default: %(default)s.')
+    parser.add_argument('--value-min', type=int, default=5, help='Min length of values. Default: %(default)s.')
+    parser.add_argument('--value-max', type=int, default=80, help='Max length of values. Default: %(default)s.')
+    parser.add_argument('--brackets', type=float, default=0.1,
+                        help='Share of values with brackets. Default: %(default)s.')
+    parser.add_argument('--placeholders', type=float, default=0.2,
+                        help='Share of values with placeholders. Default: %(default)s.')
+    parser.add_argument('--quotes', type=float, default=0.05,
+                        help='Share of values with quotes. Default: %(default)s.')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed. Default: %(default)s.')
+
+
+def from_arguments(args: argparse.Namespace) -> BundleGenerator:
+    """
+    Returns BundleGenerator configured with options added by add_arguments().
+    """
+    return BundleGenerator(keys=args.keys, languages=args.languages, value_length=(args.value_min, args.value_max),
+                           brackets=args.brackets, placeholders=args.placeholders, quotes=args.quotes, seed=args.seed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Generates synthetic *.properties bundle.')
+    parser.add_argument('target_dir', metavar='DIR', help='Directory to write the bundle to.')
+    add_arguments(parser)
+    args = parser.parse_args()
+    base_file = from_arguments(args).write(Path(args.target_dir))
+    print(f'Base file: {base_file}')
+
+
+if __name__ == '__main__':
+    main()
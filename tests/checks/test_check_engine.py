@@ -0,0 +1,170 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+"""
+
+from typing import List, Tuple
+
+from transtool.checks.base.check import Check
+from transtool.checks.base.engine import CheckEngine
+from transtool.config.builder import ConfigBuilder
+from transtool.config.config import Config
+from transtool.decorators.overrides import overrides
+from transtool.prop.file import PropFile
+from transtool.prop.items import Blank, Comment, PropItem, Translation
+from transtool.prop.parser import PropParser
+from transtool.report.group import ReportGroup
+from tests.test_case import TestCase
+
+
+class WholeFileCheck(Check):
+    """
+    Checker not implementing per-item hook, like third-party checkers may do.
+    """
+
+    @overrides(Check)
+    def check(self, translation: 'PropFile', reference: 'PropFile' = None) -> ReportGroup:
+        report = ReportGroup('Whole file')
+        report.warn(None, f'Items: {len(translation.items)}')
+        return report
+
+
+class CountingItemCheck(Check):
+    """
+    Per-item checker recording all the items it was given.
+    """
+
+    report_title = 'Counting'
+
+    def __init__(self):
+        super().__init__({})
+        self.is_item_check = True
+        self.seen: List[PropItem] = []
+
+    @overrides(Check)
+    def check(self, translation: 'PropFile', reference: 'PropFile' = None) -> ReportGroup:
+        return self._check_all_items(translation, reference)
+
+    @overrides(Check)
+    def check_item(self, report: ReportGroup, idx: int, item: PropItem, reference: 'PropFile' = None) -> None:
+        self.seen.append(item)
+        report.error(idx + 1, 'Seen.')
+
+
+class TestCheckEngine(TestCase):
+
+    def setUp(self) -> None:
+        self.config = Config()
+        ConfigBuilder._setup_checkers(self.config)
+
+    def _build_files(self) -> Tuple[PropFile, PropFile]:
+        reference = PropFile(self.config)
+        translation = PropFile(self.config)
+        values = [
+            ('Foo (bar).', 'foo (bar'),
+            ('Triple...', 'Triple dots... '),
+            ('%s and %d', '%d and %s'),
+            ('"Quoted"', '"Not quoted'),
+            ('Ends with space \\n', 'Ends with space \\n'),
+            ('Not empty', ''),
+        ]
+        for idx, (ref_value, trans_value) in enumerate(values):
+            key = f'key{idx}'
+            reference.append([Comment(self.get_random_string()), Translation(key, ref_value), Blank()])
+            translation.append([Comment(self.get_random_string()), Translation(key, trans_value), Blank()])
+        translation.append(Translation('Invalid key', 'dangling'))
+        return translation, reference
+
+    def _get_checkers(self) -> List[Check]:
+        return [info.callable(info.config) for info in self.config.checks.values()]
+
+    def test_results_match_individual_checks(self) -> None:
+        """
+        Ensures fused engine produces exactly the same results as running check() of each checker.
+        """
+        translation, reference = self._build_files()
+        checkers = self._get_checkers()
+
+        results = CheckEngine(checkers).run(translation, reference)
+
+        self.assertEqual(len(checkers), len(results))
+        for checker, engine_report in zip(checkers, results):
+            expected = checker.check(translation, reference)
+            self.assertEqual(expected.label, engine_report.label)
+            self.assertEqual(expected.errors, engine_report.errors)
+            self.assertEqual(expected.warnings, engine_report.warnings)
+            self.assertEqual([entry.to_string() for entry in expected],
+                             [entry.to_string() for entry in engine_report])
+
+        # Sanity check to ensure our test data triggers something.
+        self.assertTrue(any(not report.empty() for report in results))
+
+    def test_mixed_checkers_order(self) -> None:
+        """
+        Ensures whole-file checkers are supported and results are returned in checkers' order.
+        """
+        translation, _ = self._build_files()
+        item_checker = CountingItemCheck()
+        results = CheckEngine([WholeFileCheck(), item_checker, WholeFileCheck()]).run(translation)
+
+        self.assertEqual(['Whole file', 'Counting', 'Whole file'], [report.label for report in results])
+        self.assertEqual(len(translation.items), results[1].errors)
+
+    def test_items_are_visited_once_per_checker(self) -> None:
+        translation, _ = self._build_files()
+        checkers = [CountingItemCheck(), CountingItemCheck()]
+        CheckEngine(checkers).run(translation)
+        for checker in checkers:
+            self.assertEqual(translation.items, checker.seen)
+
+    def test_prepare_item_check_can_skip_items(self) -> None:
+        """
+        Ensures checker whose prepare_item_check() fails (i.e. due to invalid config) gets no items
+        but its report is still returned.
+        """
+        translation, _ = self._build_files()
+        brackets = self.config.checks['Brackets']
+        config = dict(brackets.config)
+        config['closing'] = []
+        checker = brackets.callable(config)
+
+        results = CheckEngine([checker]).run(translation)
+        self.assertEqual(1, len(results))
+        self.assertEqual(1, results[0].warnings)
+
+    def test_run_stream_matches_run(self) -> None:
+        """
+        Ensures single-file checkers produce the same results when fed with items streamed from the parser.
+        """
+        translation, _ = self._build_files()
+        checkers = [checker for checker in self._get_checkers()
+                    if checker.is_item_check and checker.is_single_file_check]
+        self.assertNotEqual(0, len(checkers))
+
+        expected = CheckEngine(checkers).run(translation)
+        content = '\n'.join(item.to_string() for item in translation.items).encode(PropParser.ENCODING)
+        results = CheckEngine(checkers).run_stream(PropParser().parse(content))
+
+        self.assertEqual(len(expected), len(results))
+        for expected_report, stream_report in zip(expected, results):
+            self.assertEqual(expected_report.label, stream_report.label)
+            self.assertEqual([entry.to_string() for entry in expected_report],
+                             [entry.to_string() for entry in stream_report])
+
+    def test_run_stream_rejects_whole_file_checkers(self) -> None:
+        with self.assertRaises(ValueError):
+            CheckEngine([CountingItemCheck()]).run_stream([])
+        with self.assertRaises(ValueError):
+            CheckEngine([WholeFileCheck()]).run_stream([])
+
+    def test_translations_only_checkers_get_translations(self) -> None:
+        translation, _ = self._build_files()
+        checker = CountingItemCheck()
+        checker.translations_only = True
+        CheckEngine([checker, CountingItemCheck()]).run(translation)
+        self.assertEqual([item for item in translation.items if isinstance(item, Translation)], checker.seen)
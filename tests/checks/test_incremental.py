@@ -0,0 +1,168 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+"""
+
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Tuple
+from unittest.mock import patch
+
+from transtool.checks.base.check import Check
+from transtool.checks.base.engine import CheckEngine
+from transtool.checks.base.incremental import IncrementalEngine, IncrementalState
+from transtool.config.builder import ConfigBuilder
+from transtool.config.config import Config
+from transtool.prop.file import PropFile
+from transtool.prop.items import Blank, Comment, Translation
+from transtool.report.group import ReportGroup
+from tests.test_case import TestCase
+
+
+class TestIncrementalEngine(TestCase):
+
+    def setUp(self) -> None:
+        self.config = Config()
+        ConfigBuilder._setup_checkers(self.config)
+        self.checkers: Dict[str, Check] = {checker_id: info.checker for checker_id, info in self.config.checks.items()}
+
+        self.values = [
+            ('Foo (bar).', 'foo (bar'),
+            ('Triple...', 'Triple dots... '),
+            ('%s and %d', '%d and %s'),
+            ('"Quoted"', '"Not quoted'),
+            ('Fine.', 'Fine.'),
+            ('Not empty', ''),
+        ]
+
+    def _build_files(self, values: List[Tuple[str, str]], prefix: List = None) -> Tuple[PropFile, PropFile]:
+        reference = PropFile(self.config)
+        translation = PropFile(self.config)
+        for item in prefix or []:
+            translation.append(item)
+        for idx, (ref_value, trans_value) in enumerate(values):
+            key = f'key{idx}'
+            reference.append([Comment('# Comment'), Translation(key, ref_value), Blank()])
+            if trans_value is not None:
+                translation.append([Comment('# Comment'), Translation(key, trans_value), Blank()])
+        translation.append(Translation('Invalid key', 'dangling'))
+        return translation, reference
+
+    @staticmethod
+    def _to_list(results: List[ReportGroup]) -> List:
+        return [(group.label, [(type(entry), entry.to_string()) for entry in group]) for group in results]
+
+    def _assert_same_as_full_run(self, state: IncrementalState, translation: PropFile, reference: PropFile) -> None:
+        expected = CheckEngine(list(self.checkers.values())).run(translation.view(), reference.view())
+        results = IncrementalEngine(self.checkers).run(state, translation.view(), reference.view())
+        self.assertEqual(self._to_list(expected), self._to_list(results))
+
+    def test_results_match_full_run(self) -> None:
+        state = IncrementalState()
+        translation, reference = self._build_files(self.values)
+        self._assert_same_as_full_run(state, translation, reference)
+        # Sanity check to ensure our test data triggers something.
+        self.assertNotEqual({}, state.item_results)
+
+        # Nothing changed
+        self._assert_same_as_full_run(state, translation, reference)
+
+        # Changed translation and reference values.
+        values = list(self.values)
+        values[0] = ('Foo (bar).', 'Foo (bar).')
+        values[4] = ('Fine...', 'Fine.')
+        translation, reference = self._build_files(values)
+        self._assert_same_as_full_run(state, translation, reference)
+
+        # Moved lines.
+        translation, reference = self._build_files(values, [Comment('# New'), Blank(), Translation('new', 'New ')])
+        self._assert_same_as_full_run(state, translation, reference)
+
+        # Missing and added keys.
+        values[2] = ('%s and %d', None)
+        values.append(('Added.', 'Added'))
+        translation, reference = self._build_files(values)
+        self._assert_same_as_full_run(state, translation, reference)
+
+    def test_unchanged_keys_are_not_checked_again(self) -> None:
+        state = IncrementalState()
+        translation, reference = self._build_files(self.values)
+        IncrementalEngine(self.checkers).run(state, translation.view(), reference.view())
+
+        values = list(self.values)
+        values[1] = ('Triple...', 'Changed...')
+        translation, reference = self._build_files(values)
+
+        checked_keys = set()
+        check_item = self.checkers['Brackets'].check_item
+
+        def check_item_spy(report, idx, item, ref=None):
+            if isinstance(item, Translation):
+                checked_keys.add(item.key)
+            return check_item(report, idx, item, ref)
+
+        with patch.object(self.checkers['Brackets'], 'check_item', side_effect=check_item_spy):
+            IncrementalEngine(self.checkers).run(state, translation.view(), reference.view())
+        self.assertEqual({'key1'}, checked_keys)
+
+    def test_config_change_invalidates_results(self) -> None:
+        state = IncrementalState()
+        translation, reference = self._build_files(self.values)
+        self._assert_same_as_full_run(state, translation, reference)
+
+        self.checkers['Brackets'].config['opening'] = ['[']
+        self.checkers['Brackets'].config['closing'] = [']']
+        self._assert_same_as_full_run(state, translation, reference)
+
+    def test_move_issue(self) -> None:
+        issue = ReportGroup.build_error('3:7', 'Foo', 'key')
+        moved = IncrementalEngine._move_issue(issue, 3, 10)
+        self.assertEqual('10:7', moved.position)
+        self.assertIs(type(issue), type(moved))
+        self.assertEqual('5', IncrementalEngine._move_issue(ReportGroup.build_warn(3, 'Foo'), 3, 5).position)
+        self.assertIsNone(IncrementalEngine._move_issue(ReportGroup.build_warn('foo', 'Foo'), 3, 5))
+        self.assertIsNone(IncrementalEngine._move_issue(ReportGroup.build_warn('3:1', 'Foo at 3:1'), 3, 5))
+        self.assertIsNone(IncrementalEngine._move_issue(ReportGroup.build_warn(None, 'Foo'), 3, 5).position)
+
+    def test_state_persistence(self) -> None:
+        translation, reference = self._build_files(self.values)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            state_file = Path(tmp_dir) / 'state'
+            expected = IncrementalEngine(self.checkers).run_with_state(state_file, translation.view(), reference.view())
+            self.assertTrue(state_file.exists())
+            state = IncrementalState.load(state_file)
+            self.assertEqual(set(translation.keys), state.keys)
+
+            results = IncrementalEngine(self.checkers).run_with_state(state_file, translation.view(), reference.view())
+            self.assertEqual(self._to_list(expected), self._to_list(results))
+
+            # Corrupted state is ignored.
+            state_file.write_bytes(b'garbage')
+            self.assertEqual({}, IncrementalState.load(state_file).checkers)
+
+    def test_propfile_validate(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            reference_file = Path(tmp_dir) / 'base.properties'
+            reference_file.write_text('key1 = Foo (bar).\nkey2 = Triple...\nkey3 = Fine.\n')
+            translation_file = Path(tmp_dir) / 'base_pl.properties'
+            translation_file.write_text('key1 = foo (bar\nkey2 = Triple dots... \nkey4 = Dangling\n')
+
+            self.config.cache_dir = str(Path(tmp_dir) / 'cache')
+            reports = []
+            for incremental in (False, True, True):
+                self.config.incremental = incremental
+                reference = PropFile(self.config)
+                reference.load(reference_file)
+                translation = PropFile(self.config)
+                translation.load(translation_file, 'pl')
+                translation.validate(reference)
+                reports.append(self._to_list(translation.report._groups))  # noqa: WPS437
+
+            self.assertTrue(any(Path(self.config.cache_dir).rglob('*.state')))
+        self.assertEqual(reports[0], reports[1])
+        self.assertEqual(reports[0], reports[2])
@@ -0,0 +1,158 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+"""
+
+import tempfile
+from pathlib import Path
+from typing import List, Tuple
+from unittest.mock import patch
+
+from transtool.checks.base.engine import CheckEngine
+from transtool.checks.base.memo import ResultMemo
+from transtool.checks.brackets import Brackets
+from transtool.config.builder import ConfigBuilder
+from transtool.config.config import Config
+from transtool.prop.file import PropFile
+from transtool.prop.items import Blank, Comment, Translation
+from transtool.report.group import ReportGroup
+from tests.test_case import TestCase
+
+
+class TestResultMemo(TestCase):
+
+    def setUp(self) -> None:
+        self.config = Config()
+        ConfigBuilder._setup_checkers(self.config)
+        self.checkers = [info.checker for info in self.config.checks.values()]
+
+    def _build_files(self, values: List[str]) -> Tuple[PropFile, PropFile]:
+        reference = PropFile(self.config)
+        translation = PropFile(self.config)
+        for idx, value in enumerate(values):
+            key = f'key{idx}'
+            reference.append([Comment('# Comment'), Translation(key, 'Reference value.'), Blank()])
+            translation.append([Comment('# Comment'), Translation(key, value), Blank()])
+        return translation, reference
+
+    @staticmethod
+    def _to_list(results: List[ReportGroup]) -> List:
+        return [(group.label, [(type(entry), entry.to_string()) for entry in group]) for group in results]
+
+    def test_results_match_run_without_memo(self) -> None:
+        values = ['Foo (bar).', 'foo (bar', 'Triple...', '"Not quoted', 'Fine.', 'Fine.  ', 'Fine.'] * 3
+        translation, reference = self._build_files(values)
+
+        expected = CheckEngine(self.checkers).run(translation.view(), reference.view())
+        # Sanity check to ensure our test data triggers something.
+        self.assertTrue(any(expected))
+
+        memo = ResultMemo()
+        # Run twice, so the second run uses outcomes remembered by the first one.
+        for _ in range(2):
+            results = CheckEngine(self.checkers, memo).run(translation.view(), reference.view())
+            self.assertEqual(self._to_list(expected), self._to_list(results))
+        self.assertGreater(memo.hits, 0)
+
+    def test_repeated_values_are_checked_once(self) -> None:
+        translation, reference = self._build_files(['Foo (bar).'] * 5 + ['foo (bar'] * 3)
+        checker = Brackets(Brackets().get_default_config())
+
+        memo = ResultMemo()
+        with patch.object(checker, 'check_item', wraps=checker.check_item) as check_item:
+            results = CheckEngine([checker], memo).run(translation.view(), reference.view())
+        # Clean value is checked once, while faulty ones are checked each time.
+        checked_values = [call.args[2].value for call in check_item.call_args_list
+                          if isinstance(call.args[2], Translation)]
+        self.assertEqual(['Foo (bar).'] + ['foo (bar'] * 3, checked_values)
+        self.assertEqual(3, len(results[0]))
+
+    def test_report_limit(self) -> None:
+        """
+        Ensures faulty values are not remembered as clean once report group is full.
+        """
+        translation, reference = self._build_files(['foo (bar'] * 3)
+        checker = Brackets(Brackets().get_default_config())
+        config = Config()
+        config.report_limit = 1
+        ReportGroup.configure(config)
+        try:
+            memo = ResultMemo()
+            for _ in range(2):
+                results = CheckEngine([checker], memo).run(translation.view(), reference.view())
+                self.assertEqual(1, len(results[0]))
+                self.assertEqual(3, results[0].errors)
+        finally:
+            ReportGroup.configure(Config())
+
+    def test_config_change_invalidates_outcomes(self) -> None:
+        translation, reference = self._build_files(['Foo [bar'])
+        checker = Brackets({**Brackets().get_default_config(), 'opening': ['('], 'closing': [')']})
+
+        memo = ResultMemo()
+        results = CheckEngine([checker], memo).run(translation.view(), reference.view())
+        self.assertEqual(0, len(results[0]))
+
+        checker.config = Brackets().get_default_config()
+        results = CheckEngine([checker], memo).run(translation.view(), reference.view())
+        self.assertEqual(1, len(results[0]))
+
+    def test_lru_eviction(self) -> None:
+        memo = ResultMemo(2)
+        memo.mark_clean(('digest', 'a'))
+        memo.mark_clean(('digest', 'b'))
+        # Touch "a", so "b" is least recently used now.
+        self.assertTrue(memo.is_clean(('digest', 'a')))
+        memo.mark_clean(('digest', 'c'))
+
+        self.assertEqual(2, len(memo))
+        self.assertTrue(memo.is_clean(('digest', 'a')))
+        self.assertFalse(memo.is_clean(('digest', 'b')))
+        self.assertTrue(memo.is_clean(('digest', 'c')))
+
+        with self.assertRaises(ValueError):
+            ResultMemo(0)
+
+    def test_save_and_load(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            memo_file = Path(tmp_dir) / 'sub' / 'memo'
+            memo = ResultMemo()
+            memo.mark_clean(('digest', ('T', 'foo')))
+            memo.save(memo_file)
+
+            loaded = ResultMemo()
+            loaded.load(memo_file)
+            self.assertTrue(loaded.is_clean(('digest', ('T', 'foo'))))
+            self.assertFalse(loaded.is_clean(('digest', ('T', 'bar'))))
+
+            # Entries written by other app version are ignored.
+            with patch('transtool.const.Const.APP_VERSION', '0.0.0'):
+                loaded = ResultMemo()
+                loaded.load(memo_file)
+            self.assertEqual(0, len(loaded))
+
+            # Corrupted file is ignored.
+            memo_file.write_bytes(b'not a pickle')
+            loaded = ResultMemo()
+            loaded.load(memo_file)
+            self.assertEqual(0, len(loaded))
+
+            # Missing file too.
+            loaded.load(Path(tmp_dir) / 'missing')
+            self.assertEqual(0, len(loaded))
+
+    def test_get_shared(self) -> None:
+        self.assertIsNone(ResultMemo.get_shared(self.config))
+
+        self.config.memo = True
+        memo = ResultMemo.get_shared(self.config)
+        self.assertIsInstance(memo, ResultMemo)
+        self.assertIs(memo, ResultMemo.get_shared(self.config))
+
+        self.config.memo = False
+        self.assertIsNone(ResultMemo.get_shared(self.config))
@@ -77,3 +77,82 @@ class SubstitutionsTests(ChecksTestCase):
 
         cfg['flag'] = Substitutions.FLAG_FAIL_WITH_ERROR
         self.check_single_file(Translation('key', 'Triple dots...'), exp_errors=1)
+
+    # #################################################################################################
+
+    def test_combined_pattern_matches_per_entry_results(self) -> None:
+        """
+        Ensures single scan with combined map pattern yields the same issue as scanning with
+        each map entry separately.
+        """
+        self.checker.config['map'].append({
+            'regexp': r'([?]{2,})',
+            'flag': Substitutions.FLAG_FAIL_WITH_ERROR,
+        })
+        self.checker.need_prepared()
+        self.assertIsNotNone(self.checker._combined)
+
+        tests = [
+            'Nothing to report.',
+            'Triple dots...',
+            'Four dots....',
+            'Triple... then four....',
+            'Spaces  and dots...',
+            'Dots... and  spaces',
+            'Ough!!! What??',
+            'What?? Ough!!!',
+            'Five..... dots',
+        ] + self._get_valid_strings() + self._get_faulty_strings()
+        for test in tests:
+            item = Translation('key', test)
+            expected = self.checker._find_most_important_issue_per_entry(0, item)
+            found = self.checker._find_most_important_issue(0, item)
+            if expected is None:
+                self.assertIsNone(found, test)
+                continue
+            self.assertIs(type(expected), type(found), test)
+            self.assertEqual(expected.to_string(), found.to_string(), test)
+
+    def test_map_with_back_references_is_not_combined(self) -> None:
+        self.checker.config['map'] = [{
+            'regexp': r'(\w)\1{2,}',
+            'replace': '',
+            'flag': Substitutions.FLAG_DEFAULT,
+        }]
+        self.checker.need_prepared()
+        self.assertIsNone(self.checker._combined)
+        self.check_single_file(Translation('key', 'Foooo'), exp_warnings=1)
+        self.check_single_file(Translation('key', 'Foo'))
+
+    def test_overlapping_error_and_warning_entries(self) -> None:
+        """
+        Ensures error is reported even if its match overlaps with earlier match of warning entry.
+        """
+        self.checker.config['map'] = [
+            {'regexp': r'(ab)', 'flag': Substitutions.FLAG_FAIL_WITH_ERROR},
+            {'regexp': r'(xa)', 'replace': 'y', 'flag': Substitutions.FLAG_DEFAULT},
+        ]
+        self.checker.need_prepared()
+        self.assertIsNotNone(self.checker._combined)
+        self.check_single_file(Translation('key', 'xab'), exp_errors=1)
+
+    def test_overlapping_warning_entries(self) -> None:
+        """
+        Ensures warning of the first matching map entry is reported, even if match of later entry
+        starts earlier in the string and overlaps with it.
+        """
+        self.checker.config['map'] = [
+            {'regexp': r'(bc)', 'replace': '1', 'flag': Substitutions.FLAG_DEFAULT},
+            {'regexp': r'(ab)', 'replace': '2', 'flag': Substitutions.FLAG_DEFAULT},
+        ]
+        self.checker.need_prepared()
+        self.assertIsNotNone(self.checker._combined)
+        issue = self.checker._find_most_important_issue(0, Translation('key', 'abc'))
+        self.assertIn('replaced with "1"', issue.to_string())
+
+    def test_issue_column_is_one_based(self) -> None:
+        self.checker.config['map'] = [{'regexp': r'([\.]{3})', 'replace': '…', 'flag': Substitutions.FLAG_DEFAULT}]
+        self.checker.need_prepared()
+        # "Dots" takes 4 characters, so the sequence starts in 5th column.
+        issue = self.checker._find_most_important_issue(2, Translation('key', 'Dots...'))
+        self.assertEqual('3:5', issue.position)
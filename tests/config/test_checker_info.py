@@ -0,0 +1,55 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+"""
+
+from typing import Dict, Optional
+
+from transtool.checks.key_format import KeyFormat
+from transtool.config.checker_info import CheckerInfo
+from transtool.decorators.overrides import overrides
+from tests.test_case import TestCase
+
+
+class CountingKeyFormat(KeyFormat):
+    def __init__(self, config: Optional[Dict] = None):
+        super().__init__(config)
+        self.prepare_cnt = 0
+
+    @overrides(KeyFormat)
+    def prepare(self) -> None:
+        super().prepare()
+        self.prepare_cnt += 1
+
+
+class TestCheckerInfo(TestCase):
+
+    def setUp(self) -> None:
+        self.info = CheckerInfo('KeyFormat', CountingKeyFormat, KeyFormat().get_default_config())
+
+    def test_checker_instance_is_shared(self) -> None:
+        checker = self.info.prepare()
+        self.assertIsInstance(checker, CountingKeyFormat)
+        self.assertIs(checker, self.info.checker)
+        self.assertIs(checker, self.info.prepare())
+        self.assertIs(self.info.config, checker.config)
+
+    def test_checker_is_prepared_once(self) -> None:
+        checker = self.info.checker
+        self.assertEqual(1, checker.prepare_cnt)
+
+        self.info.prepare()
+        checker.need_prepared()
+        self.assertEqual(1, checker.prepare_cnt)
+
+    def test_checker_is_prepared_again_on_config_change(self) -> None:
+        checker = self.info.checker
+        self.info.config['pattern'] = r'^[a-z]+$'
+        checker.need_prepared()
+        self.assertEqual(2, checker.prepare_cnt)
+        self.assertEqual(r'^[a-z]+$', checker._compiled_pattern.pattern)
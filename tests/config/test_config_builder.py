@@ -33,10 +33,30 @@ class FakeArgs(object):
         self.verbose: bool = False
 
         self.files: List[str] = []
+        self.projects: List[str] = []
         self.languages: List[str] = []
         self.languages_skip: List[str] = []
+        self.languages_auto: bool = False
         self.separator: Optional[str] = None
         self.comment_marker: Optional[str] = None
+        self.line_ending: Optional[str] = None
+        self.jobs: Optional[int] = None
+        self.mmap: bool = False
+        self.columnar: bool = False
+        self.cache: bool = False
+        self.cache_dir: Optional[str] = None
+        self.incremental: bool = False
+        self.async_io: bool = False
+        self.memo: bool = False
+        self.memo_size: Optional[int] = None
+        self.memo_file: Optional[str] = None
+        self.profile: bool = False
+        self.profile_file: Optional[str] = None
+        self.report_file: Optional[str] = None
+        self.report_format: Optional[str] = None
+        self.report_limit: Optional[int] = None
+        self.watch: bool = False
+        self.watch_interval: Optional[float] = None
 
         self.config_file = None
         self.file_suffix = Config.DEFAULT_FILE_SUFFIX
@@ -119,6 +139,80 @@ class TestConfigBuilder(TestCase):
             self.assertEqual(SystemExit, type(context_manager.exception))
             self.assertEquals(Utils.ABORT_RETURN_CODE, context_manager.exception.code)
 
+    @patch('simplelog.log.Log.e')
+    def test_validate_config_invalid_line_ending(self, log_e_mock: Mock) -> None:
+        """
+        Ensures unsupported line ending triggers expected error message and quits.
+
+        :param log_e_mock: Log.abort() mock.
+        """
+        config = self.get_config_for_validate()
+        config.line_ending = 'cr'
+        with self.assertRaises(SystemExit):
+            ConfigBuilder._validate_config(config)
+        log_e_mock.assert_called_once_with('Invalid line ending. Must be one of: lf, crlf')
+
+    @patch('simplelog.log.Log.e')
+    def test_validate_config_watch_with_write(self, log_e_mock: Mock) -> None:
+        """
+        Ensures watch mode cannot be combined with writing the files.
+
+        :param log_e_mock: Log.abort() mock.
+        """
+        config = self.get_config_for_validate()
+        config.watch = True
+        config.write = True
+        with self.assertRaises(SystemExit):
+            ConfigBuilder._validate_config(config)
+        log_e_mock.assert_called_once_with('Watch mode cannot be used with --write.')
+
+    @patch('simplelog.log.Log.e')
+    def test_validate_config_watch_with_unsupported_options(self, log_e_mock: Mock) -> None:
+        """
+        Ensures watch mode cannot be combined with options it does not support.
+
+        :param log_e_mock: Log.abort() mock.
+        """
+        tests = [
+            ('jobs', 2, 'Watch mode cannot be used with --jobs.'),
+            ('report_file', 'report.jsonl', 'Watch mode cannot be used with --report-file.'),
+            ('profile', True, 'Watch mode cannot be used with --profile.'),
+        ]
+        for option_name, option_value, msg in tests:
+            log_e_mock.reset_mock()
+            config = self.get_config_for_validate()
+            config.watch = True
+            setattr(config, option_name, option_value)
+            with self.assertRaises(SystemExit):
+                ConfigBuilder._validate_config(config)
+            log_e_mock.assert_called_once_with(msg)
+
+    @patch('simplelog.log.Log.e')
+    def test_validate_config_negative_report_limit(self, log_e_mock: Mock) -> None:
+        """
+        Ensures negative report limit triggers expected error message and quits.
+
+        :param log_e_mock: Log.abort() mock.
+        """
+        config = self.get_config_for_validate()
+        config.report_limit = -1
+        with self.assertRaises(SystemExit):
+            ConfigBuilder._validate_config(config)
+        log_e_mock.assert_called_once_with('Report limit cannot be negative.')
+
+    @patch('simplelog.log.Log.e')
+    def test_validate_config_invalid_report_format(self, log_e_mock: Mock) -> None:
+        """
+        Ensures unsupported report format triggers expected error message and quits.
+
+        :param log_e_mock: Log.abort() mock.
+        """
+        config = self.get_config_for_validate()
+        config.report_format = 'xml'
+        with self.assertRaises(SystemExit):
+            ConfigBuilder._validate_config(config)
+        log_e_mock.assert_called_once_with('Invalid report format. Must be one of: jsonl, sarif')
+
     @patch('simplelog.log.Log.e')
     def test_validate_config_invalid_comment_marker(self, log_e_mock: Mock) -> None:
         """
@@ -0,0 +1,45 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+"""
+
+import tempfile
+from pathlib import Path
+
+from tests.test_case import TestCase
+from transtool.config.config import Config
+from transtool.config.reader import ConfigReader
+
+
+class TestConfigReader(TestCase):
+
+    def _read(self, options: str) -> Config:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config_file = Path(tmp_dir) / 'config.ini'
+            config_file.write_text(f'[trans-tool]\nversion = {Config.VERSION}\n{options}\n')
+            return ConfigReader().read(Config(), config_file)
+
+    def test_typed_options(self) -> None:
+        config = self._read('jobs = 4\nmmap = true\nline_ending = "CRLF"\nreport_limit = 10\nwatch_interval = 1.5\n')
+        self.assertEqual(4, config.jobs)
+        self.assertTrue(config.mmap)
+        self.assertEqual('crlf', config.line_ending)
+        self.assertEqual(10, config.report_limit)
+        self.assertEqual(1.5, config.watch_interval)
+
+    def test_implied_options(self) -> None:
+        config = self._read('cache_dir = cache\nmemo_file = memo.bin\nprofile_file = profile.json\nwatch_interval = 2\n')
+        self.assertEqual('cache', config.cache_dir)
+        self.assertEqual('memo.bin', config.memo_file)
+        self.assertEqual('profile.json', config.profile_file)
+        for option_name in Config.IMPLIED_OPTIONS.values():
+            self.assertTrue(getattr(config, option_name), option_name)
+
+    def test_implied_option_set_explicitly(self) -> None:
+        config = self._read('cache_dir = cache\ncache = false\n')
+        self.assertFalse(config.cache)
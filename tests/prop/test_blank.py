@@ -8,7 +8,10 @@
 #
 """
 
-from transtool.prop.items import Blank
+import copy
+import pickle
+
+from transtool.prop.items import Blank, FrozenBlank
 from tests.test_case import TestCase
 
 
@@ -22,3 +25,25 @@ class TestBlank(TestCase):
     def test_blank_to_string(self) -> None:
         item = Blank()
         self.assertEqual('', item.to_string())
+
+    def test_blank_is_shared(self) -> None:
+        self.assertIs(Blank(), Blank())
+        frozen = Blank().freeze()
+        self.assertIsNot(Blank(), frozen)
+        self.assertIs(frozen, Blank().freeze())
+        self.assertIs(frozen, Blank().freeze_in_place())
+        self.assertIsInstance(frozen, FrozenBlank)
+
+    def test_shared_blank_is_read_only(self) -> None:
+        item = Blank()
+        with self.assertRaises(AttributeError):
+            item.value = self.get_random_string()
+        with self.assertRaises(AttributeError):
+            item.key = self.get_random_string()
+        self.assertIsNone(Blank().value)
+
+    def test_copy_is_shared_instance(self) -> None:
+        self.assertIs(Blank(), copy.deepcopy(Blank()))
+        self.assertIs(Blank(), pickle.loads(pickle.dumps(Blank())))
+        frozen = Blank().freeze()
+        self.assertIs(frozen, pickle.loads(pickle.dumps(frozen)))
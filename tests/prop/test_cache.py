@@ -0,0 +1,108 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+"""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from transtool.config.config import Config
+from transtool.prop.cache import ParseCache
+from transtool.prop.file import PropFile
+from tests.test_case import TestCase
+
+
+class TestParseCache(TestCase):
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.tmp_dir.name) / 'cache'
+        self.file = Path(self.tmp_dir.name) / 'file.properties'
+
+        self.key = self.get_random_string('key')
+        self.file.write_text('\n'.join([
+            f'# {self.get_random_string("comment")}',
+            f'{self.key} = {self.get_random_string("val")}',
+            '',
+            f'{self.key} = {self.get_random_string("duplicated_val")}',
+            '# ==> commented.key = ',
+        ]))
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def _load(self, columnar: bool = False) -> PropFile:
+        config = Config()
+        config.cache = True
+        config.cache_dir = str(self.cache_dir)
+        config.columnar = columnar
+        propfile = PropFile(config)
+        propfile.load(self.file)
+        return propfile
+
+    def _assert_same(self, expected: PropFile, propfile: PropFile) -> None:
+        self.assertEqual([item.to_string() for item in expected.items], [item.to_string() for item in propfile.items])
+        self.assertEqual(expected.keys, propfile.keys)
+        self.assertEqual(expected.commented_out_keys, propfile.commented_out_keys)
+        self.assertEqual(expected.find_by_key(self.key).value, propfile.find_by_key(self.key).value)
+        self.assertEqual(expected.report.errors, propfile.report.errors)
+
+    def test_unchanged_file_is_loaded_from_cache(self) -> None:
+        expected = self._load()
+        self.assertEqual(1, len(list(self.cache_dir.iterdir())))
+        self.assertEqual(1, expected.report.errors)
+
+        with patch('transtool.prop.file.PropFile._parse_file') as parse_mock:
+            propfile = self._load()
+            parse_mock.assert_not_called()
+        self._assert_same(expected, propfile)
+
+    def test_columnar_file_is_loaded_from_cache(self) -> None:
+        expected = self._load(columnar=True)
+        with patch('transtool.prop.file.PropFile._parse_file') as parse_mock:
+            propfile = self._load(columnar=True)
+            parse_mock.assert_not_called()
+        self._assert_same(expected, propfile)
+        self.assertEqual([item.to_string() for item in expected.view().items],
+                         [item.to_string() for item in propfile.view().items])
+
+    def test_changed_file_is_parsed_again(self) -> None:
+        self._load()
+        new_key = self.get_random_string('new_key')
+        with open(self.file, 'a') as fh:
+            fh.write(f'\n{new_key} = {self.get_random_string("val")}')
+
+        propfile = self._load()
+        self.assertIn(new_key, propfile.keys)
+
+        # And the cache entry is updated.
+        with patch('transtool.prop.file.PropFile._parse_file') as parse_mock:
+            self.assertIn(new_key, self._load().keys)
+            parse_mock.assert_not_called()
+
+    def test_corrupted_entry_is_ignored(self) -> None:
+        expected = self._load()
+        for entry_file in self.cache_dir.iterdir():
+            entry_file.write_bytes(b'garbage')
+
+        self._assert_same(expected, self._load())
+        # Entry should be rewritten.
+        self._assert_same(expected, self._load())
+
+    def test_fingerprint(self) -> None:
+        fingerprint = ParseCache.get_fingerprint(self.file)
+        self.assertEqual(str(self.file.resolve()), fingerprint[0])
+        self.assertEqual(self.file.stat().st_size, fingerprint[1])
+        self.assertEqual(fingerprint, ParseCache.get_fingerprint(self.file))
+
+    def test_unwritable_cache_dir_is_not_fatal(self) -> None:
+        self.cache_dir.parent.mkdir(parents=True, exist_ok=True)
+        # Cache dir path is occupied by a file, so it cannot be created.
+        self.cache_dir.write_text('')
+        self.assertEqual(1, self._load().report.errors)
@@ -0,0 +1,168 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+"""
+
+import tempfile
+from pathlib import Path
+
+from transtool.config.builder import ConfigBuilder
+from transtool.config.config import Config
+from transtool.prop.columns import PropColumns
+from transtool.prop.file import PropFile
+from transtool.prop.items import Blank, Comment, FrozenItem, Translation
+from tests.test_case import TestCase
+
+
+class TestPropColumns(TestCase):
+
+    def setUp(self) -> None:
+        self.items = [
+            Comment(f'# {self.get_random_string("comment")}'),
+            Translation(self.get_random_string('key'), self.get_random_string('val'), ':'),
+            Blank(),
+            Translation(self.get_random_string('key'), '', '='),
+        ]
+        self.columns = PropColumns()
+        for line_number, item in enumerate(self.items, start=1):
+            self.columns.append(item, line_number)
+
+    def _assert_same_items(self, expected, actual) -> None:
+        self.assertEqual(len(expected), len(actual))
+        for expected_item, item in zip(expected, actual):
+            self.assertIsInstance(item, type(expected_item))
+            self.assertEqual(expected_item.key, item.key)
+            self.assertEqual(expected_item.value, item.value)
+            self.assertEqual(expected_item.to_string(), item.to_string())
+
+    def test_items(self) -> None:
+        self._assert_same_items(self.items, self.columns)
+        self._assert_same_items(self.items, [self.columns[idx] for idx in range(len(self.items))])
+        self._assert_same_items(self.items[1:3], self.columns[1:3])
+        self._assert_same_items(self.items[-1:], [self.columns[-1]])
+        with self.assertRaises(IndexError):
+            # noinspection PyStatementEffect
+            self.columns[len(self.items)]
+
+    def test_columns(self) -> None:
+        self.assertEqual([1, 3], list(self.columns.translation_indices()))
+        self.assertEqual(self.items[1].key, self.columns.get_key(1))
+        self.assertEqual(self.items[1].value, self.columns.get_value(1))
+        self.assertEqual('', self.columns.get_key(0))
+        self.assertEqual([1, 2, 3, 4], list(self.columns.line_numbers))
+        self.assertEqual(PropColumns.KIND_COMMENT, self.columns.kinds[0])
+        self.assertEqual(PropColumns.KIND_BLANK, self.columns.kinds[2])
+
+    def test_none_value(self) -> None:
+        """
+        Ensures None value is not turned into empty string, while empty string stays empty.
+        """
+        items = [
+            Translation(self.get_random_string('key'), None),
+            Translation(self.get_random_string('key'), ''),
+            Translation(self.get_random_string('key'), self.get_random_string('val')),
+        ]
+        columns = PropColumns()
+        for item in items:
+            columns.append(item)
+
+        self.assertIsNone(columns.get_value(0))
+        self.assertEqual('', columns.get_value(1))
+        for source in (columns, columns.freeze()):
+            self.assertIsNone(source[0].value)
+            self.assertEqual('', source[1].value)
+            self._assert_same_items(items, source)
+
+    def test_append_after_buffer_access(self) -> None:
+        self.assertEqual(self.items[3].key, self.columns.get_key(3))
+        item = Translation(self.get_random_string('key'), self.get_random_string('val'))
+        self.columns.append(item)
+        self.assertEqual(PropColumns.NO_LINE, self.columns.line_numbers[-1])
+        self._assert_same_items(self.items + [item], self.columns)
+
+    def test_freeze(self) -> None:
+        frozen = self.columns.freeze()
+        self._assert_same_items(self.items, frozen)
+        for item in frozen:
+            self.assertIsInstance(item, FrozenItem)
+        with self.assertRaises(TypeError):
+            frozen.append(Blank())
+
+        # Frozen copy must not be affected by changes to its source.
+        self.columns.append(Blank())
+        self.assertEqual(len(self.items), len(frozen))
+        self._assert_same_items(self.items, frozen)
+
+    def test_freeze_shares_storage(self) -> None:
+        frozen = self.columns.freeze()
+        # Rows can only be appended, so there's no need to copy them.
+        self.assertIs(self.columns.kinds, frozen.kinds)
+        self.assertIs(self.columns.keys, frozen.keys)
+        self.assertIs(self.columns.value_ends, frozen.value_ends)
+
+    def test_frozen_items(self) -> None:
+        frozen = self.columns.freeze()
+        for expected_item, item in zip(self.items, [frozen[idx] for idx in range(len(frozen))]):
+            self.assertIsInstance(item, type(expected_item))
+            self.assertIsInstance(item, FrozenItem)
+            self.assertEqual(expected_item.to_string(), item.to_string())
+            with self.assertRaises(AttributeError):
+                item.value = self.get_random_string('val')
+        translation = frozen[1]
+        self.assertEqual(self.items[1].separator, translation.separator)
+        # Keys are not copied.
+        self.assertIs(self.items[1].key, translation.key)
+
+
+class TestColumnarPropFile(TestCase):
+
+    def _load(self, file: Path, columnar: bool) -> PropFile:
+        config = Config()
+        ConfigBuilder._setup_checkers(config)
+        config.columnar = columnar
+        propfile = PropFile(config)
+        propfile.load(file)
+        return propfile
+
+    def test_columnar_file_matches_list_based_one(self) -> None:
+        key = self.get_random_string('key')
+        reference_content = '\n'.join([
+            '# Comment',
+            f'{key} = Foo (bar) %s...',
+            '',
+            'other.key = "Quoted"',
+        ])
+        translation_content = '\n'.join([
+            '# Comment',
+            f'{key} = foo (bar %d....',
+            f'{key} = duplicate',
+            '',
+            'Invalid key = value ',
+        ])
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            reference_file = Path(tmp_dir) / 'reference.properties'
+            reference_file.write_text(reference_content)
+            translation_file = Path(tmp_dir) / 'translation.properties'
+            translation_file.write_text(translation_content)
+
+            results = {}
+            for columnar in (False, True):
+                reference = self._load(reference_file, columnar)
+                translation = self._load(translation_file, columnar)
+                self.assertEqual(columnar, isinstance(translation.items, PropColumns))
+                translation.validate(reference)
+                groups = translation.report._groups  # noqa: WPS437
+                results[columnar] = (
+                    [item.to_string() for item in translation.items],
+                    translation.find_by_key(key).value,
+                    [(group.label, [entry.to_string() for entry in group]) for group in groups],
+                )
+
+        self.assertEqual(results[False], results[True])
+        # Sanity check to ensure our test data triggers something.
+        self.assertNotEqual([], results[True][2])
@@ -0,0 +1,108 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from transtool.prop.discovery import Discovery, FileIndex
+from tests.test_case import TestCase
+
+
+class TestDiscovery(TestCase):
+
+    def test_get_base_names(self) -> None:
+        names = [
+            'gui.properties', 'gui_de.properties', 'gui_extra.properties',
+            # Not valid language codes, so these are not translations of "gui.properties" (see FileIndex).
+            'gui_pt_BR.properties', 'gui_extra_old.properties',
+            # No "errors.properties", so it is a base file.
+            'errors_de.properties',
+            'foo.bar.properties', 'readme.txt', '.properties',
+            'app_messages.properties', 'app_messages_pl.properties',
+        ]
+        expected = ['app_messages.properties', 'errors_de.properties', 'gui.properties', 'gui_extra_old.properties',
+                    'gui_pt_BR.properties']
+        self.assertEqual(expected, Discovery.get_base_names(names, '.properties'))
+
+    def test_find_base_files(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            files = [
+                'src/main/resources/gui.properties',
+                'src/main/resources/gui_pl.properties',
+                'src/main/resources/sub/errors.properties',
+                'other/app.properties',
+                'target/classes/gui.properties',
+                '.git/foo.properties',
+            ]
+            for file in files:
+                (root / file).parent.mkdir(parents=True, exist_ok=True)
+                (root / file).write_text('key = value\n')
+
+            expected = [root / 'other/app.properties',
+                        root / 'src/main/resources/gui.properties',
+                        root / 'src/main/resources/sub/errors.properties']
+            self.assertEqual(expected, Discovery.find_base_files(root, '.properties'))
+
+            with self.assertRaises(NotADirectoryError):
+                Discovery.find_base_files(root / 'other/app.properties', '.properties')
+
+    def test_file_index(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            for name in ('gui.properties', 'gui_pl.properties', 'gui_de.properties', 'gui_pt_BR.properties',
+                         'gui_pl.txt', 'errors.properties', 'errors_fr.properties'):
+                (root / name).write_text('key = value\n')
+            (root / 'gui_fr.properties').mkdir()
+
+            index = FileIndex('.properties')
+            with patch('os.scandir', wraps=os.scandir) as scandir_mock:
+                translations = index.get_translations(root / 'gui.properties')
+                self.assertEqual({'fr': root / 'errors_fr.properties'}, index.get_translations(root / 'errors.properties'))
+                # Directory is listed once only.
+                self.assertEqual(1, scandir_mock.call_count)
+
+            self.assertEqual({'de': root / 'gui_de.properties', 'pl': root / 'gui_pl.properties'}, translations)
+            # Keys are sorted.
+            self.assertEqual(['de', 'pl'], list(translations))
+
+            self.assertEqual({}, index.get_translations(root / 'missing' / 'gui.properties'))
+
+    def test_each_file_is_base_or_translation(self) -> None:
+        """
+        Ensures no file is skipped: any file not found as translation of a base file is a base file itself.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            names = ['gui.properties', 'gui_pl.properties', 'gui_pt_BR.properties', 'gui_extra_old.properties',
+                     'gui_extra.properties', 'gui_extra_de.properties']
+            for name in names:
+                (root / name).write_text('key = value\n')
+
+            index = FileIndex('.properties')
+            found = set()
+            for base_file in Discovery.find_base_files(root, '.properties', index):
+                found.add(base_file.name)
+                found.update(file.name for file in index.get_translations(base_file).values())
+            self.assertEqual(set(names), found)
+
+    def test_find_base_files_populates_index(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            root = Path(tmp_dir)
+            (root / 'gui.properties').write_text('key = value\n')
+            (root / 'gui_pl.properties').write_text('key = value\n')
+
+            index = FileIndex('.properties')
+            Discovery.find_base_files(root, '.properties', index)
+            with patch('os.scandir') as scandir_mock:
+                self.assertEqual({'pl': root / 'gui_pl.properties'}, index.get_translations(root / 'gui.properties'))
+                scandir_mock.assert_not_called()
@@ -9,7 +9,10 @@
 """
 
 import copy
+import os
 import random
+import stat
+import tempfile
 from pathlib import Path
 from typing import List, Union
 from unittest.mock import Mock, mock_open, patch
@@ -23,6 +26,16 @@ from tests.test_case import TestCase
 
 class TestPropFile(TestCase):
 
+    def setUp(self) -> None:
+        # Run each test in its own directory, so files written relative to cwd never end up in the source tree.
+        self.cwd = os.getcwd()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp_dir.name)
+
+    def tearDown(self) -> None:
+        os.chdir(self.cwd)
+        self.tmp_dir.cleanup()
+
     def _generate_propfile_with_content(self, config: Config) -> PropFile:
         """
         Creates instance of PropFile and fills it with randomly generated content.
@@ -75,6 +88,54 @@ class TestPropFile(TestCase):
 
     # #################################################################################################
 
+    def test_find_by_key(self) -> None:
+        """
+        Ensures find_by_key() finds all appended translations and returns None for unknown keys.
+        """
+        propfile = self._generate_propfile_with_content(Config())
+        for item in propfile.items:
+            if isinstance(item, Translation):
+                self.assertIs(item, propfile.find_by_key(item.key))
+        self.assertIsNone(propfile.find_by_key(self.get_random_string('unknown')))
+
+    def test_find_by_key_duplicated_key(self) -> None:
+        """
+        Ensures first occurrence of duplicated key is returned, matching load() behaviour.
+        """
+        key = self.get_random_string('key')
+        first = Translation(key, self.get_random_string('val'))
+        propfile = PropFile(Config())
+        propfile.append([first, Translation(key, self.get_random_string('val'))])
+        self.assertIs(first, propfile.find_by_key(key))
+
+    def test_find_by_key_items_modified_directly(self) -> None:
+        """
+        Ensures key index notices items removed from or added to `items` list directly.
+        """
+        key1 = self.get_random_string('key1')
+        key2 = self.get_random_string('key2')
+        propfile = PropFile(Config())
+        propfile.append(Translation(key1, self.get_random_string('val')))
+
+        del propfile.items[0]
+        self.assertIsNone(propfile.find_by_key(key1))
+
+        item = Translation(key2, self.get_random_string('val'))
+        propfile.items.append(item)
+        self.assertIs(item, propfile.find_by_key(key2))
+
+    def test_find_by_key_after_init_container(self) -> None:
+        """
+        Ensures key index is cleared when container is reinitialized.
+        """
+        key = self.get_random_string('key')
+        propfile = PropFile(Config())
+        propfile.append(Translation(key, self.get_random_string('val')))
+        propfile.init_container(None)
+        self.assertIsNone(propfile.find_by_key(key))
+
+    # #################################################################################################
+
     def test_load_non_existing_file(self) -> None:
         """
         Tests if load() fails on non-existing file correctly.
@@ -213,6 +274,81 @@ class TestPropFile(TestCase):
                     msg = log_e_mock.call_args_list[0][0][0]
                     self.assertEqual(msg, f'Invalid syntax at line {trap_position + 1} of "{fake_file_name}".')
 
+    def test_load_mmap(self) -> None:
+        """
+        Ensures memory mapped loader mode produces the same content and reports as the default one.
+        """
+        key = self.get_random_string('key')
+        content = '\r\n'.join([
+            f'# {self.get_random_string("comment")}',
+            f'{key} = {self.get_random_string("val")}',
+            '',
+            f'{key} = {self.get_random_string("duplicated_val")}',
+            f'{self.get_random_string("key")} : {self.get_random_string("val")}',
+        ])
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file = Path(tmp_dir) / 'file.properties'
+            file.write_bytes(content.encode('utf-8'))
+
+            expected = PropFile(Config())
+            expected.load(file)
+
+            config = Config()
+            config.mmap = True
+            propfile = PropFile(config)
+            propfile.load(file)
+
+        self.assertEqual([item.to_string() for item in expected.items],
+                         [item.to_string() for item in propfile.items])
+        self.assertEqual(expected.keys, propfile.keys)
+        self.assertEqual(1, propfile.report.errors)
+
+    def test_load_encoding(self) -> None:
+        """
+        Ensures all loader modes read files in the same encoding save() writes them in, regardless of locale.
+        """
+        key = self.get_random_string('key')
+        val = f'Zażółć gęślą jaźń {self.get_random_string()}'
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file = Path(tmp_dir) / 'file.properties'
+            saved = PropFile(Config())
+            saved.append(Translation(key, val))
+            saved.save(file)
+
+            with patch('builtins.open', wraps=open) as open_mock:
+                default = PropFile(Config())
+                default.load(file)
+            self.assertEqual('utf-8', open_mock.call_args.kwargs.get('encoding'))
+
+            config = Config()
+            config.mmap = True
+            mapped = PropFile(config)
+            mapped.load(file)
+
+        for propfile in (default, mapped):
+            self.assertEqual(val, propfile.find_by_key(key).value)
+
+    def test_load_content(self) -> None:
+        """
+        Ensures file content read ahead (see IoPipeline) is used instead of the file.
+        """
+        key = self.get_random_string('key')
+        val = self.get_random_string('val')
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file = Path(tmp_dir) / 'file.properties'
+            file.write_text(f'{key} = {self.get_random_string("old_val")}\n')
+
+            propfile = PropFile(Config())
+            propfile.load(file, 'pl', f'# Comment\n{key} = {val}\n'.encode('utf-8'))
+
+            # File is not even required to exist.
+            missing_file = PropFile(Config())
+            missing_file.load(Path(tmp_dir) / 'missing.properties', content=b'')
+
+        self.assertEqual(file, propfile.file)
+        self.assertEqual(['# Comment', f'{key} = {val}'], [item.to_string() for item in propfile.items])
+        self.assertEqual(0, len(missing_file.items))
+
     @patch('pathlib.Path.exists')
     def test_load_valid_file(self, path_mock: Mock) -> None:
         """
@@ -302,26 +438,21 @@ class TestPropFile(TestCase):
     def _check_written_content(self, propfile: PropFile,
                                verify_file_name: Union[str, Path],
                                save_file_name: Union[str, Path] = None):
-        with patch('builtins.open', mock_open()) as manager:
-            with patch('simplelog.log.Log.i') as log_i_mock:
-                if save_file_name:
-                    propfile.save(save_file_name)
-                else:
-                    propfile.save()
-                manager.assert_called_once_with(verify_file_name, 'w')
-
-                # Ensure call to Log.i() happened with expected message.
-                msg = log_i_mock.call_args_list[0][0][0]
-                self.assertEqual(msg, f'Writing: {verify_file_name}')
+        with patch('simplelog.log.Log.i') as log_i_mock:
+            if save_file_name:
+                propfile.save(save_file_name)
+            else:
+                propfile.save()
 
-                # Check file content is written as expected.
-                expected = []
-                for item in propfile.items:
-                    expected.append(item.to_string())
+            # Ensure call to Log.i() happened with expected message.
+            msg = log_i_mock.call_args_list[0][0][0]
+            self.assertEqual(msg, f'Writing: {verify_file_name}')
 
-                fh = manager()
-                # FIXME: LF/CRLF should be configurable
-                fh.write.assert_called_once_with('\n'.join(expected))
+        # Check file content is written as expected.
+        expected = []
+        for item in propfile.items:
+            expected.append(item.to_string())
+        self.assertEqual('\n'.join(expected).encode('utf-8'), Path(verify_file_name).read_bytes())
 
     def test_save(self) -> None:
         """
@@ -330,8 +461,9 @@ class TestPropFile(TestCase):
         config = Config()
         propfile = self._generate_propfile_with_content(config)
 
-        fake_file_name = Path(self.get_random_string())
-        self._check_written_content(propfile, fake_file_name, fake_file_name)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            fake_file_name = Path(tmp_dir) / self.get_random_string()
+            self._check_written_content(propfile, fake_file_name, fake_file_name)
 
     def test_save_use_property_file(self) -> None:
         """
@@ -340,9 +472,10 @@ class TestPropFile(TestCase):
         """
         config = Config()
         propfile = self._generate_propfile_with_content(config)
-        verify_file_name = Path(self.get_random_string())
-        propfile.file = verify_file_name
-        self._check_written_content(propfile, verify_file_name)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            verify_file_name = Path(tmp_dir) / self.get_random_string()
+            propfile.file = verify_file_name
+            self._check_written_content(propfile, verify_file_name)
 
     def test_save_no_target_file(self) -> None:
         """
@@ -387,12 +520,70 @@ class TestPropFile(TestCase):
 
         self.do_compare_output_with_saved_content(propfile, expected)
 
-    def do_compare_output_with_saved_content(self, propfile: PropFile, expected: List[str]) -> None:
-        with patch('builtins.open', mock_open()) as manager:
-            propfile.save(self.get_random_string())
-            fh = manager()
-            # FIXME: LF/CRLF should be configurable
-            fh.write.assert_called_once_with('\n'.join(expected))
+    def test_save_crlf(self) -> None:
+        """
+        Ensures configured line ending is used.
+        """
+        config = Config()
+        config.line_ending = 'crlf'
+        propfile = PropFile(config)
+
+        item = Translation(self.get_random_string('key'), self.get_random_string('value'))
+        propfile.append([Comment('# Comment'), item, Blank()])
+
+        self.do_compare_output_with_saved_content(propfile, ['# Comment', item.to_string(), ''], '\r\n')
+
+    def do_compare_output_with_saved_content(self, propfile: PropFile, expected: List[str],
+                                             line_ending: str = '\n') -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file = Path(tmp_dir) / self.get_random_string()
+            propfile.save(str(file))
+            self.assertEqual(line_ending.join(expected).encode('utf-8'), file.read_bytes())
+
+    def test_save_skips_unchanged_file(self) -> None:
+        """
+        Ensures file is not written again if its content would not change.
+        """
+        propfile = self._generate_propfile_with_content(Config())
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file = Path(tmp_dir) / 'file.properties'
+            propfile.save(file)
+            # Pretend the file was written long time ago.
+            os.utime(file, ns=(1_000_000_000, 1_000_000_000))
+
+            with patch('simplelog.log.Log.i') as log_i_mock:
+                propfile.save(file)
+                log_i_mock.assert_not_called()
+            self.assertEqual(1_000_000_000, file.stat().st_mtime_ns)
+
+            # Same size, different content.
+            propfile.append(Translation('foo', 'bar'))
+            content = propfile.to_bytes()
+            file.write_bytes(content.replace(b'bar', b'baz'))
+            propfile.save(file)
+            self.assertEqual(content, file.read_bytes())
+
+    def test_save_is_atomic(self) -> None:
+        """
+        Ensures failed write leaves the original file intact and no temporary files behind.
+        """
+        propfile = self._generate_propfile_with_content(Config())
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file = Path(tmp_dir) / 'file.properties'
+            file.write_bytes(b'original')
+            os.chmod(file, 0o640)
+
+            with patch('os.replace', side_effect=OSError('Disk full')):
+                with self.assertRaises(OSError):
+                    propfile.save(file)
+            self.assertEqual(b'original', file.read_bytes())
+            self.assertEqual(['file.properties'], os.listdir(tmp_dir))
+
+            propfile.save(file)
+            self.assertEqual(propfile.to_bytes(), file.read_bytes())
+            # Permissions are preserved.
+            self.assertEqual(0o640, stat.S_IMODE(file.stat().st_mode))
+            self.assertEqual(['file.properties'], os.listdir(tmp_dir))
 
     # #################################################################################################
 
@@ -512,10 +703,16 @@ class TestPropFile(TestCase):
                     else:
                         expected = Comment.comment_out_key(config, ref_item.key)
                     self.assertEqual(expected, trans_item.to_string())
+                    self.assertIsNone(translation.find_by_key(ref_item.key))
                     continue
 
             self.fail(f'Unknown item type: {type(trans_item)}')
 
+        # Key index should now reflect the updated content only.
+        for trans_item in translation.items:
+            if isinstance(trans_item, Translation):
+                self.assertIs(trans_item, translation.find_by_key(trans_item.key))
+
     def test_update_fail_on_unknown_type(self) -> None:
         """
         Ensures unexpected and unsupported content will be caught and raise TypeError.
@@ -0,0 +1,59 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+"""
+
+from transtool.prop.ordered_set import OrderedSet
+from tests.test_case import TestCase
+
+
+class TestOrderedSet(TestCase):
+
+    def test_init(self) -> None:
+        items = self.get_random_string_list(10, 'key')
+        ordered = OrderedSet(items)
+        self.assertEqual(len(items), len(ordered))
+        self.assertEqual(items, list(ordered))
+
+    def test_add_keeps_order_and_skips_duplicates(self) -> None:
+        items = self.get_random_string_list(10, 'key')
+        ordered = OrderedSet()
+        for item in items:
+            ordered.add(item)
+        # Adding again should not change anything.
+        for item in reversed(items):
+            ordered.add(item)
+        self.assertEqual(items, list(ordered))
+
+    def test_contains(self) -> None:
+        items = self.get_random_string_list(10, 'key')
+        ordered = OrderedSet(items)
+        for item in items:
+            self.assertIn(item, ordered)
+        self.assertNotIn(self.get_random_string('unknown'), ordered)
+
+    def test_discard(self) -> None:
+        items = self.get_random_string_list(5, 'key')
+        ordered = OrderedSet(items)
+        ordered.discard(items[2])
+        # Discarding non-existing item is no-op.
+        ordered.discard(self.get_random_string('unknown'))
+        self.assertEqual(items[:2] + items[3:], list(ordered))
+
+    def test_difference(self) -> None:
+        items = self.get_random_string_list(10, 'key')
+        ordered = OrderedSet(items)
+        self.assertEqual(items[5:], ordered.difference(OrderedSet(items[:3]), {items[3]}, [items[4]]))
+        self.assertEqual(items, ordered.difference())
+
+    def test_eq(self) -> None:
+        items = self.get_random_string_list(5, 'key')
+        self.assertEqual(OrderedSet(items), OrderedSet(items))
+        # Order matters, and it is not a list.
+        self.assertNotEqual(OrderedSet(items), items)
+        self.assertNotEqual(OrderedSet(items), OrderedSet(reversed(items)))
@@ -0,0 +1,90 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+"""
+
+import io
+import tempfile
+import types
+from pathlib import Path
+
+from transtool.prop.items import Blank, Comment, Translation
+from transtool.prop.parser import PropParser
+from tests.test_case import TestCase
+
+
+class TestPropParser(TestCase):
+
+    def setUp(self) -> None:
+        self.key = self.get_random_string('key')
+        self.val = self.get_random_string('val')
+        self.comment = f'# {self.get_random_string("comment")}'
+        self.content = f'{self.comment}\r\n\n{self.key} = {self.val}\n   \n'
+
+    def _assert_items(self, result) -> None:
+        result = list(result)
+        self.assertEqual([1, 2, 3, 4], [line_number for line_number, _ in result])
+        items = [item for _, item in result]
+        self.assertIsInstance(items[0], Comment)
+        self.assertEqual(self.comment, items[0].value)
+        self.assertIsInstance(items[1], Blank)
+        self.assertIsInstance(items[2], Translation)
+        self.assertEqual(self.key, items[2].key)
+        self.assertEqual(self.val, items[2].value)
+        self.assertIsInstance(items[3], Blank)
+
+    def test_parse_text_handle(self) -> None:
+        self._assert_items(PropParser().parse(io.StringIO(self.content)))
+
+    def test_parse_binary_handle(self) -> None:
+        self._assert_items(PropParser().parse(io.BytesIO(self.content.encode('utf-8'))))
+
+    def test_parse_byte_buffer(self) -> None:
+        buffer = self.content.encode('utf-8')
+        self._assert_items(PropParser().parse(buffer))
+        self._assert_items(PropParser().parse(bytearray(buffer)))
+        self._assert_items(PropParser().parse(memoryview(buffer)))
+
+    def test_parse_is_lazy(self) -> None:
+        """
+        Ensures items are parsed on demand, so invalid line is not reached until consumed.
+        """
+        result = PropParser().parse(io.StringIO(f'{self.comment}\nINVALID LINE\n'))
+        self.assertIsInstance(result, types.GeneratorType)
+        _, item = next(result)
+        self.assertIsInstance(item, Comment)
+        with self.assertRaises(SyntaxError):
+            next(result)
+
+    def test_parse_invalid_syntax(self) -> None:
+        file_name = self.get_random_string('file')
+        with self.assertRaises(SyntaxError) as context:
+            list(PropParser(file_name).parse(io.StringIO(f'{self.comment}\nINVALID LINE\n')))
+        self.assertIn('line 2', str(context.exception))
+        self.assertIn(file_name, str(context.exception))
+
+    def test_parse_mapped(self) -> None:
+        """
+        Ensures memory mapped parsing yields the same items as parsing file handle.
+        """
+        contents = [
+            self.content,
+            self.content.replace('\n', '\r\n'),
+            # No trailing LF
+            self.content.rstrip(),
+            f'{self.key} = {self.get_random_string("val")} żółć\n',
+            '',
+        ]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file = Path(tmp_dir) / 'file.properties'
+            for content in contents:
+                file.write_bytes(content.encode('utf-8'))
+                expected = list(PropParser(file).parse(io.StringIO(content)))
+                result = list(PropParser(file).parse_mapped(file))
+                self.assertEqual([(line_number, type(item), item.to_string()) for line_number, item in expected],
+                                 [(line_number, type(item), item.to_string()) for line_number, item in result])
@@ -0,0 +1,56 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+"""
+
+import tempfile
+import threading
+from pathlib import Path
+
+from transtool.prop.pipeline import IoPipeline
+from tests.test_case import TestCase
+
+
+class TestIoPipeline(TestCase):
+
+    def test_read_and_write(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source = Path(tmp_dir) / 'source.txt'
+            source.write_bytes(b'foo\n')
+            target = Path(tmp_dir) / 'target.txt'
+
+            with IoPipeline() as pipeline:
+                self.assertEqual(b'foo\n', pipeline.read(source).result())
+                pipeline.write(target.write_text, 'bar')
+            # Writes are completed once pipeline is closed.
+            self.assertEqual('bar', target.read_text())
+
+            with IoPipeline() as pipeline:
+                with self.assertRaises(FileNotFoundError):
+                    pipeline.read(Path(tmp_dir) / 'missing').result()
+
+    def test_io_runs_in_background(self) -> None:
+        with IoPipeline() as pipeline:
+            thread = pipeline.submit(threading.current_thread).result()
+        self.assertIsNot(threading.current_thread(), thread)
+
+    def test_close_raises_write_error(self) -> None:
+        pipeline = IoPipeline()
+        pipeline.start()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            pipeline.write(Path(tmp_dir, 'missing', 'file.txt').write_text, 'foo')
+            with self.assertRaises(FileNotFoundError):
+                pipeline.close()
+
+    def test_not_started(self) -> None:
+        with self.assertRaises(RuntimeError):
+            IoPipeline().read(Path('foo'))
+        with self.assertRaises(ValueError):
+            IoPipeline(0)
+        # Closing not started pipeline is fine.
+        IoPipeline().close()
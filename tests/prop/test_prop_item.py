@@ -8,7 +8,7 @@
 #
 """
 
-from transtool.prop.items import PropItem
+from transtool.prop.items import Blank, Comment, PropItem, Translation
 from tests.test_case import TestCase
 
 
@@ -30,3 +30,9 @@ class TestPropItem(TestCase):
         item = PropItem()
         with self.assertRaises(NotImplementedError):
             item.to_string()
+
+    def test_items_have_no_instance_dict(self) -> None:
+        self.assertFalse(hasattr(PropItem(), '__dict__'))
+        for item in [Translation('key', 'value'), Comment('# comment'), Blank()]:
+            self.assertFalse(hasattr(item, '__dict__'), type(item))
+            self.assertFalse(hasattr(item.freeze(), '__dict__'), type(item))
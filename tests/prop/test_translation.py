@@ -166,3 +166,36 @@ class TestTranslation(TestCase):
         self.assertEqual(key, res_key)
         self.assertEqual(sep, res_sep)
         self.assertEqual(val, res_val)
+
+    def test_parse_translation_line_fast_path_matches_escape_aware_scan(self) -> None:
+        """
+        Ensures separator found by the fast path is always the one escape-aware scan finds.
+        """
+        lines = [
+            'key = value',
+            'key: value = with : separators',
+            r'key = value with \= escaped separator',
+            r'ke\y = value',
+            r'key\\ = value',
+            r'key\=\=x = value',
+            r'\=\:',
+            r'key\\\= = value',
+            'no separator',
+        ]
+        for line in lines:
+            expected_pos = Translation.find_separator(line)
+            res = Translation.parse_translation_line(line)
+            if expected_pos is None:
+                self.assertIsNone(res, line)
+                continue
+            self.assertIsNotNone(res, line)
+            self.assertEqual(line[:expected_pos].strip(), res[0], line)
+            self.assertEqual(line[expected_pos], res[1], line)
+            self.assertEqual(line[expected_pos + 1:].lstrip(), res[2], line)
+
+    def test_key_and_separator_are_interned(self) -> None:
+        key = self.get_random_string('key')
+        first = Translation(''.join(list(key)), self.get_random_string('val'))
+        second = Translation(''.join(list(key)), self.get_random_string('val'))
+        self.assertIs(first.key, second.key)
+        self.assertIs(first.separator, second.separator)
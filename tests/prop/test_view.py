@@ -0,0 +1,115 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+"""
+
+import pickle
+
+from transtool.config.config import Config
+from transtool.prop.file import PropFile
+from transtool.prop.items import Blank, Comment, Translation
+from transtool.prop.view import PropFileView
+from tests.test_case import TestCase
+
+
+class TestPropFileView(TestCase):
+
+    def setUp(self) -> None:
+        self.config = Config()
+        self.key = self.get_random_string('key')
+        self.commented_key = self.get_random_string('commented_key')
+
+        self.propfile = PropFile(self.config, 'pl')
+        self.propfile.append([
+            Comment(self.get_random_string('comment')),
+            Translation(self.key, self.get_random_string('val')),
+            Blank(),
+            Comment.get_commented_out_key_comment(self.config, self.commented_key),
+        ])
+        self.view = self.propfile.view()
+
+    def test_content(self) -> None:
+        self.assertIsInstance(self.view, PropFileView)
+        self.assertEqual(len(self.propfile.items), len(self.view.items))
+        for item, view_item in zip(self.propfile.items, self.view.items):
+            self.assertIsInstance(view_item, type(item))
+            self.assertEqual(item.to_string(), view_item.to_string())
+
+        self.assertEqual(self.propfile.keys, self.view.keys)
+        self.assertEqual(self.propfile.commented_out_keys, self.view.commented_out_keys)
+        self.assertEqual('pl', self.view.language)
+        self.assertIs(self.config, self.view.config)
+
+        self.assertEqual(self.propfile.find_by_key(self.key).value, self.view.find_by_key(self.key).value)
+        self.assertIsNone(self.view.find_by_key(self.get_random_string('unknown')))
+
+    def test_view_is_read_only(self) -> None:
+        with self.assertRaises(AttributeError):
+            self.view.language = 'de'
+        with self.assertRaises(AttributeError):
+            # noinspection PyUnresolvedReferences
+            self.view.items.append(Blank())
+        with self.assertRaises(TypeError):
+            self.view.keys.add(self.get_random_string('key'))
+        with self.assertRaises(TypeError):
+            self.view.commented_out_keys.discard(self.commented_key)
+
+    def test_items_are_read_only(self) -> None:
+        for item in self.view.items:
+            with self.assertRaises(AttributeError):
+                item.value = self.get_random_string()
+        with self.assertRaises(AttributeError):
+            self.view.find_by_key(self.key).key = self.get_random_string()
+
+    def test_view_is_isolated_from_source(self) -> None:
+        """
+        Ensures changes to the source file are not visible through already built view.
+        """
+        items_cnt = len(self.view.items)
+        with self.assertRaises(AttributeError):
+            self.propfile.find_by_key(self.key).value = self.get_random_string('new_val')
+        new_key = self.get_random_string('new_key')
+        self.propfile.append(Translation(new_key, self.get_random_string('val')))
+
+        self.assertEqual(items_cnt, len(self.view.items))
+        self.assertEqual(items_cnt, len(list(self.view.items)))
+        with self.assertRaises(IndexError):
+            self.view.items[items_cnt]  # noqa: WPS428
+        self.assertIsNone(self.view.find_by_key(new_key))
+        self.assertEqual(1, len(self.view.keys))
+
+    def test_items_are_not_copied(self) -> None:
+        for item, view_item in zip(self.propfile.items, self.view.items):
+            self.assertIs(item, view_item)
+
+    def test_view_is_cached(self) -> None:
+        self.assertIs(self.view, self.propfile.view())
+
+        self.propfile.append(Blank())
+        view = self.propfile.view()
+        self.assertIsNot(self.view, view)
+        self.assertEqual(len(self.propfile.items), len(view.items))
+
+        # Changes made directly to the items list must be noticed too.
+        self.propfile.items.append(Blank())
+        self.assertEqual(len(self.propfile.items), len(self.propfile.view().items))
+
+    def test_freeze_frozen_item(self) -> None:
+        frozen = self.view.items[0]
+        self.assertIs(frozen, frozen.freeze())
+
+    def test_pickle(self) -> None:
+        """
+        Ensures views can be sent to worker processes.
+        """
+        restored = pickle.loads(pickle.dumps(self.view))
+        self.assertEqual(self.view.keys, restored.keys)
+        self.assertEqual([item.to_string() for item in self.view.items], [item.to_string() for item in restored.items])
+        self.assertEqual(self.view.find_by_key(self.key).value, restored.find_by_key(self.key).value)
+        with self.assertRaises(AttributeError):
+            restored.items[1].value = self.get_random_string()
@@ -0,0 +1,52 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+"""
+
+import tempfile
+from pathlib import Path
+
+from transtool.prop.watcher import FileWatcher
+from tests.test_case import TestCase
+
+
+class TestFileWatcher(TestCase):
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp_dir.name)
+        (self.dir / 'base.properties').write_text('key = Foo\n')
+        (self.dir / 'base_pl.properties').write_text('key = Foo\n')
+        (self.dir / 'notes.txt').write_text('Not watched.\n')
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_file_names(self) -> None:
+        watcher = FileWatcher([self.dir], '.properties')
+        self.assertEqual(['base.properties', 'base_pl.properties'], sorted(watcher.file_names[self.dir]))
+
+    def test_poll(self) -> None:
+        watcher = FileWatcher([self.dir, self.dir], '.properties')
+        self.assertEqual(set(), watcher.poll())
+
+        (self.dir / 'base_pl.properties').write_text('key = Foo Bar\n')
+        (self.dir / 'base_de.properties').write_text('key = Foo\n')
+        (self.dir / 'base.properties').unlink()
+        (self.dir / 'notes.txt').write_text('Still not watched.\n')
+        expected = {self.dir / 'base_pl.properties', self.dir / 'base_de.properties', self.dir / 'base.properties'}
+        self.assertEqual(expected, watcher.poll())
+        self.assertIn('base_de.properties', watcher.file_names[self.dir])
+
+        # Changes are reported once.
+        self.assertEqual(set(), watcher.poll())
+
+    def test_missing_directory(self) -> None:
+        watcher = FileWatcher([self.dir / 'missing'], '.properties')
+        self.assertEqual([], watcher.file_names[self.dir / 'missing'])
+        self.assertEqual(set(), watcher.poll())
@@ -8,7 +8,10 @@
 #
 """
 
+import pickle
+
 from transtool.config.config import Config
+from transtool.report.group import ReportGroup
 from transtool.report.report import Report
 from tests.test_case import TestCase
 
@@ -25,3 +28,47 @@ class TestReport(TestCase):
 
     def test_empty(self) -> None:
         self.assertTrue(self.report.empty())
+
+    def _get_group(self, errors: int, warnings: int) -> ReportGroup:
+        group = ReportGroup(self.get_random_string('group'))
+        for idx in range(errors):
+            group.error(idx, self.get_random_string('error'))
+        for idx in range(warnings):
+            group.warn(idx, self.get_random_string('warn'))
+        return group
+
+    def test_totals(self) -> None:
+        self.report.add(self._get_group(2, 1))
+        self.report.add(self._get_group(0, 3))
+        self.assertEqual(2, self.report.errors)
+        self.assertEqual(4, self.report.warnings)
+
+    def test_totals_follow_group_changes(self) -> None:
+        group = self._get_group(1, 0)
+        self.report.add(group)
+        group.warn(None, self.get_random_string('warn'))
+        group.add(ReportGroup.build_error(None, self.get_random_string('error')))
+        self.assertEqual(2, self.report.errors)
+        self.assertEqual(1, self.report.warnings)
+
+    def test_merge(self) -> None:
+        self.report.add(self._get_group(1, 1))
+        other = Report(self.config)
+        other.add(self._get_group(2, 3))
+        other.add(self._get_group(0, 1))
+
+        self.report.merge(other)
+        self.assertEqual(3, self.report.errors)
+        self.assertEqual(5, self.report.warnings)
+        self.assertEqual(3, len(list(self.report)))
+
+    def test_pickle(self) -> None:
+        self.report.add(self._get_group(1, 2))
+        report = pickle.loads(pickle.dumps(self.report))
+        self.assertEqual(1, report.errors)
+        self.assertEqual(2, report.warnings)
+
+        # Unpickled groups update unpickled report.
+        next(iter(report)).error(None, self.get_random_string('error'))
+        self.assertEqual(2, report.errors)
+        self.assertEqual(1, self.report.errors)
@@ -67,6 +67,35 @@ class TestReportGroup(TestCase):
         self.assertEqual(0, self.rg.warnings)
         self.assertEqual(1, self.rg.errors)
 
+    def test_limit(self) -> None:
+        config = Config()
+        config.report_limit = 2
+        ReportGroup.configure(config)
+        try:
+            rg = ReportGroup(self.get_random_string('label'))
+            rg.error(1, self.get_random_string())
+            rg.warn(2, self.get_random_string())
+            self.assertTrue(rg.is_full())
+            rg.error(3, self.get_random_string())
+            rg.warn(4, self.get_random_string())
+            rg.add([Warn(None, msg=self.get_random_string()), Error(None, msg=self.get_random_string())])
+        finally:
+            ReportGroup.configure(Config())
+
+        # All the issues are counted, but only first ones are kept.
+        self.assertEqual(2, len(rg))
+        self.assertEqual(['1', '2'], [item.position for item in rg])
+        self.assertEqual(3, rg.errors)
+        self.assertEqual(3, rg.warnings)
+        self.assertEqual(4, rg.omitted)
+
+    def test_no_limit(self) -> None:
+        for idx in range(100):
+            self.rg.warn(idx, self.get_random_string())
+        self.assertFalse(self.rg.is_full())
+        self.assertEqual(100, len(self.rg))
+        self.assertEqual(0, self.rg.omitted)
+
     def test_add_with_list(self) -> None:
         """
         Ensures add() deals with all the cases properly.
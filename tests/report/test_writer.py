@@ -0,0 +1,151 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+"""
+
+import io
+import json
+from pathlib import Path
+from typing import Type
+
+from transtool.config.config import Config
+from transtool.const import Const
+from transtool.report.group import ReportGroup
+from transtool.report.report import Report
+from transtool.report.writer import JsonLinesReportWriter, ReportWriter, SarifReportWriter
+from tests.test_case import TestCase
+
+
+class Output(io.StringIO):
+    """
+    StringIO keeping its content once closed.
+    """
+
+    def close(self) -> None:
+        self.value = self.getvalue()
+        super().close()
+
+
+class TestReportWriter(TestCase):
+
+    def setUp(self) -> None:
+        self.report = Report(Config())
+        group = ReportGroup('Brackets', 'Brackets')
+        group.error(3, 'No closing bracket.', 'key1')
+        group.warn('5:2', 'Odd comment.')
+        self.report.add(group)
+        # Group not produced by checker.
+        duplicates = ReportGroup('Duplicated keys')
+        duplicates.error(7, 'Duplicated key.', 'key2')
+        self.report.add(duplicates)
+
+    def _write(self, writer_cls: Type[ReportWriter], fatal: bool = False) -> str:
+        output = Output()
+        with writer_cls(output, fatal) as writer:
+            writer.write_report(Path('base_pl.properties'), 'pl', self.report)
+            writer.write_report(Path('base.properties'), None, Report(Config()))
+        return output.value
+
+    def test_create(self) -> None:
+        self.assertIsInstance(ReportWriter.create('jsonl', '-'), JsonLinesReportWriter)
+        self.assertIsInstance(ReportWriter.create('sarif', '-'), SarifReportWriter)
+        with self.assertRaises(ValueError):
+            ReportWriter.create('xml', '-')
+
+    def test_create_stdout(self) -> None:
+        stdout = io.StringIO()
+        with ReportWriter.create('jsonl', ReportWriter.STDOUT, stdout=stdout) as writer:
+            writer.write_report(Path('base_pl.properties'), 'pl', self.report)
+        # Standard output is not closed once report is written.
+        self.assertFalse(stdout.closed)
+        self.assertEqual(3, len(stdout.getvalue().splitlines()))
+
+    def test_jsonl(self) -> None:
+        lines = self._write(JsonLinesReportWriter).splitlines()
+        self.assertEqual(3, len(lines))
+        records = [json.loads(line) for line in lines]
+        self.assertEqual({
+            'file': 'base_pl.properties',
+            'language': 'pl',
+            'checker': 'Brackets',
+            'group': 'Brackets',
+            'severity': 'error',
+            'position': '3',
+            'line': 3,
+            'key': 'key1',
+            'message': 'No closing bracket.',
+        }, records[0])
+        self.assertEqual('warning', records[1]['severity'])
+        self.assertEqual(5, records[1]['line'])
+        self.assertIsNone(records[1]['key'])
+        self.assertEqual('DuplicatedKeys', records[2]['checker'])
+
+    def test_jsonl_fatal(self) -> None:
+        records = [json.loads(line) for line in self._write(JsonLinesReportWriter, fatal=True).splitlines()]
+        self.assertEqual({'error'}, {record['severity'] for record in records})
+
+    def test_sarif(self) -> None:
+        sarif = json.loads(self._write(SarifReportWriter))
+        self.assertEqual('2.1.0', sarif['version'])
+        self.assertEqual(1, len(sarif['runs']))
+        run = sarif['runs'][0]
+        self.assertEqual(Const.APP_NAME, run['tool']['driver']['name'])
+        self.assertEqual(3, len(run['results']))
+
+        result = run['results'][0]
+        self.assertEqual('Brackets', result['ruleId'])
+        self.assertEqual('error', result['level'])
+        self.assertEqual('Line 3: "key1": No closing bracket.', result['message']['text'])
+        location = result['locations'][0]['physicalLocation']
+        self.assertEqual('base_pl.properties', location['artifactLocation']['uri'])
+        self.assertEqual({'startLine': 3}, location['region'])
+        self.assertEqual('warning', run['results'][1]['level'])
+        region = run['results'][1]['locations'][0]['physicalLocation']['region']
+        self.assertEqual({'startLine': 5, 'startColumn': 2}, region)
+
+    def test_sarif_no_results(self) -> None:
+        self.report = Report(Config())
+        sarif = json.loads(self._write(SarifReportWriter))
+        self.assertEqual([], sarif['runs'][0]['results'])
+
+    def _add_limited_group(self) -> None:
+        config = Config()
+        config.report_limit = 1
+        ReportGroup.configure(config)
+        try:
+            group = ReportGroup('Brackets', 'Brackets')
+            group.warn(1, 'First.')
+            group.warn(2, 'Second.')
+            group.warn(3, 'Third.')
+        finally:
+            ReportGroup.configure(Config())
+        self.report = Report(Config())
+        self.report.add(group)
+
+    def test_jsonl_omitted(self) -> None:
+        self._add_limited_group()
+        records = [json.loads(line) for line in self._write(JsonLinesReportWriter).splitlines()]
+        self.assertEqual(2, len(records))
+        self.assertNotIn('omitted', records[0])
+        self.assertEqual(2, records[1]['omitted'])
+        self.assertEqual('Brackets', records[1]['checker'])
+        self.assertEqual('warning', records[1]['severity'])
+        self.assertIsNone(records[1]['line'])
+
+    def test_sarif_omitted(self) -> None:
+        self._add_limited_group()
+        run = json.loads(self._write(SarifReportWriter))['runs'][0]
+        self.assertEqual(1, len(run['results']))
+        notifications = run['invocations'][0]['toolExecutionNotifications']
+        self.assertEqual(1, len(notifications))
+        self.assertEqual('Brackets', notifications[0]['associatedRule']['id'])
+        self.assertEqual(2, notifications[0]['properties']['omitted'])
+
+    def test_sarif_nothing_omitted(self) -> None:
+        run = json.loads(self._write(SarifReportWriter))['runs'][0]
+        self.assertNotIn('invocations', run)
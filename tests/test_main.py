@@ -0,0 +1,324 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+"""
+
+import io
+import json
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from unittest.mock import patch
+
+from simplelog.log import Log
+
+from transtool.config.builder import ConfigBuilder
+from transtool.config.config import Config
+from transtool.main import TransTool
+from transtool.profiler import Profiler
+from transtool.prop.discovery import Discovery, FileIndex
+from transtool.prop.file import PropFile
+from tests.test_case import TestCase
+
+
+class TestTransTool(TestCase):
+
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp_dir.name)
+
+        (self.dir / 'base.properties').write_text('key1 = Foo.\nkey2 = Bar (baz)\n')
+        (self.dir / 'base_de.properties').write_text('key1 = Foo.\nkey2 = Bar (baz)\n')
+        # Translation with issues.
+        (self.dir / 'base_pl.properties').write_text('key1 = Foo\nkey2 = Bar (baz\ndangling = Zoo\n')
+        # No translation file for "fr".
+
+        (self.dir / 'sub').mkdir()
+        (self.dir / 'sub' / 'other.properties').write_text('key1 = Foo (bar)\n')
+        (self.dir / 'sub' / 'other_de.properties').write_text('key1 = Foo (bar\n')
+        (self.dir / 'sub' / 'other_pl.properties').write_text('key1 = Foo (bar)\n')
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def _get_config(self, jobs: int) -> Config:
+        config = Config()
+        config.color = False
+        config.jobs = jobs
+        ConfigBuilder._setup_checkers(config)
+        config.files = [str(self.dir / 'base.properties')]
+        config.languages = ['de', 'pl', 'fr']
+        return config
+
+    def _run(self, jobs: int, files: Optional[List[str]] = None, **options) -> Tuple[int, str]:
+        config = self._get_config(jobs)
+        if files is not None:
+            config.files = files
+        for option_name, option_value in options.items():
+            setattr(config, option_name, option_value)
+        Log.configure(config)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            executor = TransTool._get_executor(config)
+            try:
+                rc = TransTool._process_files(config, executor)
+            finally:
+                if executor is not None:
+                    executor.shutdown()
+        return rc, output.getvalue()
+
+    def test_get_executor(self) -> None:
+        self.assertIsNone(TransTool._get_executor(self._get_config(1)))
+        executor = TransTool._get_executor(self._get_config(2))
+        self.assertIsNotNone(executor)
+        executor.shutdown()
+
+    def test_parallel_output_matches_sequential(self) -> None:
+        """
+        Ensures that running checks in worker processes produces the very same output and return code
+        as sequential run.
+        """
+        seq_rc, seq_output = self._run(jobs=1)
+        par_rc, par_output = self._run(jobs=3)
+
+        self.assertNotEqual(0, seq_rc)
+        self.assertEqual(seq_rc, par_rc)
+        self.assertEqual(seq_output, par_output)
+
+    def test_parallel_output_matches_sequential_many_base_files(self) -> None:
+        files = [str(base_file) for base_file in Discovery.find_base_files(self.dir, '.properties')]
+        self.assertEqual([str(self.dir / 'base.properties'), str(self.dir / 'sub' / 'other.properties')], files)
+
+        seq_rc, seq_output = self._run(jobs=1, files=files)
+        par_rc, par_output = self._run(jobs=3, files=files)
+
+        self.assertNotEqual(0, seq_rc)
+        self.assertIn('other_de.properties', seq_output)
+        self.assertEqual(seq_rc, par_rc)
+        self.assertEqual(seq_output, par_output)
+
+    def test_languages_auto(self) -> None:
+        config = self._get_config(1)
+        config.languages = []
+        config.languages_auto = True
+        config.languages_skip = ['pl']
+        Log.configure(config)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            rc = TransTool._process_files(config, None)
+
+        self.assertEqual(0, rc)
+        self.assertIn('DE: ', output.getvalue())
+        # Skipped and not existing.
+        self.assertNotIn('PL: ', output.getvalue())
+        self.assertNotIn('FR: ', output.getvalue())
+
+    def test_missing_translation_not_loaded(self) -> None:
+        config = self._get_config(1)
+        Log.configure(config)
+        with patch('transtool.prop.file.PropFile.load', autospec=True) as load_mock:
+            with redirect_stdout(io.StringIO()) as output:
+                TransTool._process_files(config, None)
+        # No attempt to load translation for "fr" is made.
+        loaded = [call.args[1].name for call in load_mock.call_args_list]
+        self.assertEqual(['base.properties', 'base_de.properties', 'base_pl.properties'], loaded)
+        self.assertIn('File not found', output.getvalue())
+
+    def _get_files_content(self) -> Dict[str, str]:
+        return {str(file.relative_to(self.dir)): file.read_text() for file in sorted(self.dir.rglob('*.properties'))}
+
+    def _set_files_content(self, files: Dict[str, str]) -> None:
+        for file in self.dir.rglob('*.properties'):
+            file.unlink()
+        for name, content in files.items():
+            (self.dir / name).write_text(content)
+
+    def test_async_io_output_matches_sync(self) -> None:
+        seq_rc, seq_output = self._run(jobs=1)
+        async_rc, async_output = self._run(jobs=1, async_io=True)
+        self.assertEqual(seq_rc, async_rc)
+        self.assertEqual(seq_output, async_output)
+
+    def test_profile(self) -> None:
+        """
+        Ensures timings of checks done in worker processes are collected too.
+        """
+        for jobs in (1, 2):
+            profiler = Profiler.enable()
+            try:
+                self._run(jobs=jobs)
+            finally:
+                Profiler.disable()
+            files = profiler.get_summary()['files']
+            for lang in ('de', 'pl'):
+                trans_file = str(self.dir / f'base_{lang}.properties')
+                self.assertEqual({Profiler.CATEGORY_LOAD, Profiler.CATEGORY_CHECK}, set(files[trans_file]))
+            self.assertIn('Brackets', profiler.get_summary()['checkers'])
+
+    def test_report_file(self) -> None:
+        report_file = self.dir / 'report.jsonl'
+        self._run(jobs=1, report_file=str(report_file))
+        records = [json.loads(line) for line in report_file.read_text().splitlines()]
+        # Issues are written along with text output.
+        self.assertEqual({'pl'}, {record['language'] for record in records})
+        self.assertIn('Brackets', {record['checker'] for record in records})
+
+        # Order does not depend on number of jobs.
+        parallel_report_file = self.dir / 'parallel.jsonl'
+        self._run(jobs=2, report_file=str(parallel_report_file))
+        self.assertEqual(report_file.read_text(), parallel_report_file.read_text())
+
+    def test_report_file_stdout(self) -> None:
+        """
+        Ensures report written to standard output is not mixed with any other output.
+        """
+        argv = ['trans-tool', '--no-color', '--profile', '-b', str(self.dir / 'base.properties'), '-l', 'de', 'pl',
+                '--report-file', '-']
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        with patch('sys.argv', argv), redirect_stdout(stdout), redirect_stderr(stderr):
+            rc = TransTool.start()
+        Log.configure(Config())
+
+        self.assertNotEqual(0, rc)
+        records = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertEqual({'pl'}, {record['language'] for record in records})
+        # Text report and profile went to standard error.
+        self.assertIn('PL: ', stderr.getvalue())
+        self.assertIn('Brackets', stderr.getvalue())
+
+    def _watch(self, config: Config, changes: List[Dict[str, str]]) -> Tuple[int, List[str]]:
+        """
+        Runs watch mode, applying each of given changes (file name -> content) instead of waiting
+        for the next poll. Returns watch mode return code and output of initial check followed by
+        output of each poll.
+        """
+        outputs: List[io.StringIO] = [io.StringIO()]
+        pending = list(changes)
+
+        def apply_change(_interval: float) -> None:
+            for file_name, content in pending.pop(0).items():
+                (self.dir / file_name).write_text(content)
+            outputs.append(io.StringIO())
+
+        class Output(object):
+            def write(self, text: str) -> None:
+                outputs[-1].write(text)
+
+            def flush(self) -> None:
+                pass
+
+        Log.configure(config)
+        with redirect_stdout(Output()), patch('time.sleep', side_effect=apply_change):
+            rc = TransTool._watch(config, FileIndex(config.file_suffix), max_cycles=len(changes))
+        return rc, [output.getvalue() for output in outputs]
+
+    def test_watch(self) -> None:
+        config = self._get_config(1)
+        config.watch = True
+        loaded: List[Path] = []
+        load = PropFile.load
+
+        def tracking_load(propfile: PropFile, file: Path, *args, **kwargs) -> None:
+            loaded.append(file)
+            load(propfile, file, *args, **kwargs)
+
+        with patch.object(PropFile, 'load', tracking_load):
+            _, outputs = self._watch(config, [
+                # Fixed "pl" translation.
+                {'base_pl.properties': 'key1 = Foo.\nkey2 = Bar (baz)\n'},
+                # Nothing changed.
+                {},
+                # Base file changed, "de" translation is out of sync now.
+                {'base.properties': 'key1 = Foo.\nkey2 = Bar (baz)\nkey3 = Zoo.\n'},
+                # New "fr" translation.
+                {'base_fr.properties': 'key1 = Foo.\n'},
+            ])
+
+        initial, fixed, unchanged, base_changed, created = outputs
+        self.assertIn('PL:', initial)
+        self.assertIn('File not found', initial)
+        self.assertIn('PL:', fixed)
+        self.assertIn('OK', fixed)
+        self.assertNotIn('DE:', fixed)
+        self.assertEqual('', unchanged)
+        self.assertIn('DE:', base_changed)
+        self.assertIn('Missing translation', base_changed)
+        self.assertIn('FR:', created)
+        self.assertNotIn('DE:', created)
+
+        # Unchanged translations are not loaded again.
+        self.assertEqual(1, loaded.count(self.dir / 'base_de.properties'))
+        self.assertEqual(2, loaded.count(self.dir / 'base_pl.properties'))
+        self.assertEqual(2, loaded.count(self.dir / 'base.properties'))
+
+    def test_watch_missing_translation_is_not_error(self) -> None:
+        """
+        Ensures missing translation is reported, but not counted as error, same as in regular run.
+        """
+        config = self._get_config(1)
+        # Only the "fr" translation is missing, others are fine.
+        config.languages = ['de', 'fr']
+        rc, output = self._run(jobs=1, languages=['de', 'fr'])
+        self.assertEqual(0, rc)
+        self.assertIn('File not found', output)
+
+        config.watch = True
+        Log.configure(config)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            watch_rc = TransTool._watch(config, FileIndex(config.file_suffix), max_cycles=0)
+        self.assertEqual(rc, watch_rc)
+        self.assertIn('File not found', output.getvalue())
+
+    def test_watch_rc_covers_unchanged_files(self) -> None:
+        """
+        Ensures errors in files that did not change since previous check still count.
+        """
+        config = self._get_config(1)
+        config.watch = True
+        # Initially "pl" translation has errors. Then "de" is edited, without introducing new errors.
+        rc, outputs = self._watch(config, [
+            {'base_de.properties': (self.dir / 'base_de.properties').read_text()},
+        ])
+        self.assertNotEqual(0, rc)
+        self.assertIn('DE:', outputs[1])
+        self.assertNotIn('PL:', outputs[1])
+
+        # Once "pl" is fixed, there are no errors left.
+        rc, _ = self._watch(config, [
+            {'base_pl.properties': 'key1 = Foo.\nkey2 = Bar (baz)\n'},
+        ])
+        self.assertEqual(0, rc)
+
+    def test_watch_survives_broken_files(self) -> None:
+        config = self._get_config(1)
+        config.watch = True
+        _, outputs = self._watch(config, [
+            {'base.properties': 'key1 = Foo.\nkey1 = Foo.\n', 'base_pl.properties': 'no separator\n'},
+            {'base.properties': 'key1 = Foo.\nkey2 = Bar (baz)\n', 'base_pl.properties': 'key1 = Foo.\nkey2 = Bar (baz)\n'},
+        ])
+        self.assertIn('Duplicated key', outputs[1])
+        self.assertIn('Invalid syntax', outputs[1])
+        self.assertIn('PL:', outputs[2])
+        self.assertIn('OK', outputs[2])
+
+    def test_async_io_write(self) -> None:
+        original = self._get_files_content()
+        seq_rc, seq_output = self._run(jobs=1, write=True)
+        expected = self._get_files_content()
+        # Sanity check, "fr" translation should be created.
+        self.assertIn('base_fr.properties', expected)
+
+        for jobs in (1, 2):
+            self._set_files_content(original)
+            async_rc, async_output = self._run(jobs=jobs, write=True, async_io=True)
+            self.assertEqual(seq_rc, async_rc)
+            self.assertEqual(seq_output, async_output)
+            self.assertEqual(expected, self._get_files_content())
@@ -0,0 +1,108 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+"""
+
+import io
+import json
+import tempfile
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from simplelog.log import Log
+
+from transtool.checks.base.engine import CheckEngine
+from transtool.checks.brackets import Brackets
+from transtool.checks.dangling_keys import DanglingKeys
+from transtool.config.config import Config
+from transtool.profiler import ProfileTimer, Profiler
+from transtool.prop.file import PropFile
+from tests.test_case import TestCase
+
+
+class TestProfiler(TestCase):
+
+    def tearDown(self) -> None:
+        Profiler.disable()
+
+    def test_disabled_by_default(self) -> None:
+        self.assertIsNone(Profiler.get())
+        profiler = Profiler.enable()
+        self.assertIs(profiler, Profiler.get())
+        Profiler.disable()
+        self.assertIsNone(Profiler.get())
+
+    def test_timer(self) -> None:
+        timer = ProfileTimer()
+        func = timer.wrap(lambda value: value * 2)
+        self.assertEqual(4, func(2))
+        self.assertEqual(6, func(3))
+        self.assertEqual(2, timer.items)
+        self.assertGreater(timer.wall, 0)
+
+    def test_summary(self) -> None:
+        profiler = Profiler()
+        profiler.merge([
+            (Profiler.CATEGORY_LOAD, Profiler.CATEGORY_LOAD, 'a', 0.5, 0.25, 1, 10),
+            (Profiler.CATEGORY_CHECK, 'Brackets', 'a', 1.0, 0.5, 1, 10),
+            (Profiler.CATEGORY_CHECK, 'Brackets', 'b', 2.0, 1.0, 1, 20),
+        ])
+        summary = profiler.get_summary()
+        self.assertEqual({'Brackets': {'wall': 3.0, 'cpu': 1.5, 'calls': 2, 'items': 30}}, summary['checkers'])
+        self.assertEqual({Profiler.CATEGORY_LOAD, Profiler.CATEGORY_CHECK}, set(summary['files']['a']))
+        self.assertEqual(0.5, summary['files']['a'][Profiler.CATEGORY_LOAD]['wall'])
+        self.assertEqual(20, summary['files']['b'][Profiler.CATEGORY_CHECK]['items'])
+
+    def test_run_in_worker(self) -> None:
+        def work() -> int:
+            Profiler.get().add_timer(timer, Profiler.CATEGORY_CHECK, 'Foo', None)
+            return 42
+
+        timer = ProfileTimer()
+        timer.items = 1
+        result, events = Profiler.run_in_worker(work)
+        self.assertEqual(42, result)
+        self.assertEqual(1, len(events))
+        self.assertIsNone(Profiler.get())
+
+    def test_profiled_run(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            base_file = Path(tmp_dir) / 'base.properties'
+            base_file.write_text('key1 = Foo (bar)\nkey2 = Bar\n')
+            trans_file = Path(tmp_dir) / 'base_pl.properties'
+            trans_file.write_text('key1 = Foo (bar\ndangling = Zoo\n')
+
+            config = Config()
+            profiler = Profiler.enable()
+            reference = PropFile(config)
+            reference.load(base_file)
+            translation = PropFile(config)
+            translation.load(trans_file, 'pl')
+            CheckEngine([Brackets(Brackets().get_default_config()), DanglingKeys()]).run(translation.view(), reference.view())
+            translation.update(reference)
+            translation.save()
+
+            summary = profiler.get_summary()
+            # Per-item checker is given each item, others the whole file.
+            self.assertEqual(2, summary['checkers']['Brackets']['items'])
+            self.assertEqual(1, summary['checkers']['DanglingKeys']['calls'])
+            self.assertEqual(set(Profiler.CATEGORIES), set(summary['files'][str(trans_file)]))
+            self.assertEqual({Profiler.CATEGORY_LOAD}, set(summary['files'][str(base_file)]))
+
+            Log.configure(config)
+            output = io.StringIO()
+            with redirect_stdout(output):
+                profiler.dump()
+            self.assertIn('Brackets', output.getvalue())
+            self.assertIn(str(trans_file), output.getvalue())
+
+            profile_file = Path(tmp_dir) / 'profile.json'
+            profiler.save(profile_file)
+            data = json.loads(profile_file.read_text())
+            self.assertEqual(summary['checkers']['Brackets']['items'], data['checkers']['Brackets']['items'])
+            self.assertEqual(len(profiler.events), len(data['events']))
@@ -8,11 +8,13 @@
 #
 """
 
+import copy
 import json
 from abc import ABC, abstractmethod
 from configparser import ConfigParser
-from typing import Dict, List, Union, Optional
+from typing import Dict, Hashable, Iterable, List, Union, Optional
 
+from transtool.report.group import ReportGroup
 from transtool.report.report import Report
 from transtool.prop.items import Translation, Comment, PropItem
 
@@ -26,6 +28,9 @@ class Check(ABC):
 
     DEFAULT_CHECK_CONFIG = {}
 
+    # Label of the ReportGroup produced by per-item checks.
+    report_title = ''
+
     def __init__(self, config: Optional[Dict] = None):
         if config is not None:
             if not isinstance(config, Dict):
@@ -33,6 +38,33 @@ class Check(ABC):
         self.config = config
 
         self.is_single_file_check = False
+        # Set to True by checkers implementing check_item(), so CheckEngine can run them all in a single pass.
+        self.is_item_check = False
+        # Set to True by per-item checkers caring about Translation items only, so CheckEngine
+        # does not pass them any other items.
+        self.translations_only = False
+        # Set to True by checkers whose results depend on presence of the keys only, and which
+        # implement get_checked_keys() and check_key(), so their results can be updated key by key.
+        self.is_key_check = False
+
+        # Copy of the config prepare() was last run for.
+        self._prepared_config: Optional[Dict] = None
+
+    def prepare(self) -> None:
+        """
+        Builds any config derived state (i.e. compiled regexps, lookup tables) checker needs. As checker
+        instances are reused to check all the files, this is meant to be called once per run, and
+        is automatically called again by need_prepared() if config got changed in the meantime.
+        """
+        self.need_valid_config()
+
+    def need_prepared(self) -> None:
+        """
+        Ensures prepare() was run for current configuration.
+        """
+        if self._prepared_config is None or self._prepared_config != self.config:
+            self.prepare()
+            self._prepared_config = copy.deepcopy(self.config)
 
     @abstractmethod
     # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
@@ -45,6 +77,93 @@ class Check(ABC):
         """
         raise NotImplementedError
 
+    # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
+    def prepare_item_check(self, report: ReportGroup, translation: 'PropFile',
+                           reference: Optional['PropFile'] = None) -> bool:
+        """
+        Called once per checked file, before its items are passed to check_item(). Validates the
+        configuration and files. Any issue found (i.e. config problems) should be added to the report.
+        :param report: ReportGroup to collect results into.
+        :param translation: PropFile object containing translations to be checked. None if items are
+                            streamed (see CheckEngine.run_stream()).
+        :param reference: Optional PropFile object to be used as reference.
+        :return: True if items should be checked, False otherwise.
+        """
+        self.need_valid_config()
+        self.need_prepared()
+        return True
+
+    # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
+    def check_item(self, report: ReportGroup, idx: int, item: PropItem, reference: Optional['PropFile'] = None) -> None:
+        """
+        Per-item counterpart of check(), used by checkers with `is_item_check` set. Checks single item
+        and adds any issue found to the report.
+        :param report: ReportGroup to collect results into.
+        :param idx: Zero based index of the item in the checked file.
+        :param item: PropItem to check.
+        :param reference: Optional PropFile object to be used as reference.
+        """
+        raise NotImplementedError
+
+    def get_item_memo_key(self, item: PropItem) -> Optional[Hashable]:
+        """
+        Returns hashable key describing everything (except item's position and translation key) the
+        outcome of check_item() for given item depends on, or None if the outcome cannot be memoized.
+        Items with the same memo key that passed the check once are not checked again if ResultMemo
+        is used (see CheckEngine). Checker's config is accounted for separately.
+        :param item: PropItem to be checked.
+        """
+        return None
+
+    @staticmethod
+    def _get_value_memo_key(item: PropItem) -> Optional[Hashable]:
+        """
+        Helper for checkers whose check_item() outcome depends on item's type and value only.
+        :param item: PropItem to be checked.
+        """
+        if isinstance(item, Translation):
+            return 'T', item.value
+        if isinstance(item, Comment):
+            return 'C', item.value
+        return None
+
+    # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
+    def get_checked_keys(self, translation: 'PropFile', reference: 'PropFile') -> Iterable[str]:
+        """
+        Used by checkers with `is_key_check` set. Returns all the keys check_key() can report, in
+        the order check() reports them.
+        :param translation: PropFile object containing translations to be checked.
+        :param reference: PropFile object to be used as reference.
+        """
+        raise NotImplementedError
+
+    # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
+    def check_key(self, report: ReportGroup, key: str, translation: 'PropFile', reference: 'PropFile') -> None:
+        """
+        Per-key counterpart of check(), used by checkers with `is_key_check` set. Checks single key
+        and adds any issue found to the report.
+        :param report: ReportGroup to collect results into.
+        :param key: Key to check.
+        :param translation: PropFile object containing translations to be checked.
+        :param reference: PropFile object to be used as reference.
+        """
+        raise NotImplementedError
+
+    # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
+    def _check_all_items(self, translation: 'PropFile', reference: Optional['PropFile'] = None) -> ReportGroup:
+        """
+        Implementation of check() for per-item checkers. Feeds all items of the translation to check_item().
+        :param translation: PropFile object containing translations to be checked.
+        :param reference: Optional PropFile object to be used as reference.
+        :return: ReportGroup with results of the check.
+        """
+        report = ReportGroup(self.report_title)
+        if self.prepare_item_check(report, translation, reference):
+            # Do not try to be clever and filter() data first, because line_number values will no longer be correct.
+            for idx, item in enumerate(translation.items):
+                self.check_item(report, idx, item, reference)
+        return report
+
     def _shall_skip_item(self, item: PropItem) -> bool:
         """
         Returns True if item is a Translation OR is a Comment, but checker's config "comments" option is True
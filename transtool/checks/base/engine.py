@@ -0,0 +1,174 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+"""
+
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
+
+from transtool.profiler import ProfileTimer, Profiler
+from transtool.prop.columns import PropColumns
+from transtool.prop.items import PropItem, Translation
+from transtool.report.group import ReportGroup
+from .check import Check
+from .memo import ResultMemo
+
+
+# noinspection PyUnresolvedReferences
+class CheckEngine(object):
+    """
+    Runs set of checkers against the file. Checkers supporting per-item checks (`is_item_check`)
+    are all fed from a single traversal of the file items, while remaining checkers get whole
+    file via their check() method. If ResultMemo is given, per-item checks of values that already
+    passed given check are skipped. If Profiler is active, time spent in each checker is recorded.
+    """
+
+    def __init__(self, checkers: List[Check], memo: Optional[ResultMemo] = None):
+        self.checkers = checkers
+        self.memo = memo
+
+    # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
+    def run(self, translation: 'PropFile', reference: Optional['PropFile'] = None) -> List[ReportGroup]:
+        """
+        Runs all the checkers against given files.
+
+        :param translation: PropFile object containing translations to be checked.
+        :param reference: Optional PropFile object to be used as reference.
+        :return: List of ReportGroups, in the same order as checkers.
+        """
+        results: List[Optional[ReportGroup]] = []
+        item_checks: List[Tuple[Check, ReportGroup]] = []
+
+        for checker in self.checkers:
+            if checker.is_item_check:
+                report = ReportGroup(checker.report_title)
+                if checker.prepare_item_check(report, translation, reference):
+                    item_checks.append((checker, report))
+                results.append(report)
+            else:
+                # Filled once per-item checkers are done, so reports are in checkers' order.
+                results.append(None)
+
+        if item_checks:
+            self._run_item_checks(item_checks, translation.items, reference, translation.file)
+
+        profiler = Profiler.get()
+        for checker_idx, checker in enumerate(self.checkers):
+            if results[checker_idx] is None:
+                started = profiler.start() if profiler is not None else None
+                results[checker_idx] = checker.check(translation, reference)
+                if profiler is not None:
+                    profiler.stop(started, Profiler.CATEGORY_CHECK, type(checker).__name__, translation.file,
+                                  len(translation.items))
+
+        return results
+
+    # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
+    def _run_item_checks(self, item_checks: List[Tuple[Check, ReportGroup]], items: Sequence[PropItem],
+                         reference: Optional['PropFile'] = None, file: Optional[Path] = None) -> None:
+        """
+        Feeds items to per-item checkers. Checkers handling translations only (`translations_only`)
+        are given Translation items only. With columnar storage, if there are only such checkers,
+        other rows are not even materialized.
+
+        :param file: File the items come from. Used for profiling only.
+        """
+        profiler = Profiler.get()
+        timers = {id(checker): ProfileTimer() for checker, _ in item_checks} if profiler is not None else {}
+
+        all_checks = [(self._get_item_check(checker, timers.get(id(checker))), report)
+                      for checker, report in item_checks if not checker.translations_only]
+        translation_checks = [(self._get_item_check(checker, timers.get(id(checker))), report)
+                              for checker, report in item_checks if checker.translations_only]
+
+        self._feed_items(all_checks, translation_checks, items, reference)
+
+        if profiler is not None:
+            for checker, _ in item_checks:
+                profiler.add_timer(timers[id(checker)], Profiler.CATEGORY_CHECK, type(checker).__name__, file)
+
+    # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
+    def _feed_items(self, all_checks: List[Tuple[Callable, ReportGroup]],
+                    translation_checks: List[Tuple[Callable, ReportGroup]], items: Sequence[PropItem],
+                    reference: Optional['PropFile'] = None) -> None:
+        """
+        Implementation of _run_item_checks().
+        """
+        if not all_checks and isinstance(items, PropColumns):
+            for idx in items.translation_indices():
+                item = items[idx]
+                for check_item, item_report in translation_checks:
+                    check_item(item_report, idx, item, reference)
+            return
+
+        for idx, item in enumerate(items):
+            for check_item, item_report in all_checks:
+                check_item(item_report, idx, item, reference)
+            if translation_checks and isinstance(item, Translation):
+                for check_item, item_report in translation_checks:
+                    check_item(item_report, idx, item, reference)
+
+    def _get_item_check(self, checker: Check, timer: Optional[ProfileTimer] = None) -> Callable:
+        """
+        Returns callable to be used in place of checker's check_item(), consulting the memo if there's any.
+
+        :param checker: Checker to run.
+        :param timer: Optional timer to record time spent in the checker with. Items skipped thanks
+                      to the memo are not counted.
+        """
+        check_item = checker.check_item if timer is None else timer.wrap(checker.check_item)
+        memo = self.memo
+        if memo is None:
+            return check_item
+
+        digest = ResultMemo.get_checker_digest(checker)
+
+        # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
+        def memoized_check_item(report: ReportGroup, idx: int, item: PropItem,
+                                reference: Optional['PropFile'] = None) -> None:
+            memo_key = checker.get_item_memo_key(item)
+            if memo_key is None:
+                check_item(report, idx, item, reference)
+                return
+            memo_key = (digest, memo_key)
+            if memo.is_clean(memo_key):
+                return
+            # Not len(report), as issues above the report group limit are counted only.
+            issues_cnt = report.errors + report.warnings
+            check_item(report, idx, item, reference)
+            if report.errors + report.warnings == issues_cnt:
+                memo.mark_clean(memo_key)
+
+        return memoized_check_item
+
+    def run_stream(self, parsed: Iterable[Tuple[int, PropItem]]) -> List[ReportGroup]:
+        """
+        Runs the checkers against items as they come, i.e. straight from PropParser.parse(), without
+        the need to have whole file loaded first. As there's no file object then, only single-file
+        checkers supporting per-item checks can be used this way.
+
+        :param parsed: Tuples of (line number, item) of the checked file, in file order, as yielded by
+                       PropParser. Parser yields one item per source line, so items' positions match
+                       their line numbers.
+        :return: List of ReportGroups, in the same order as checkers.
+        """
+        for checker in self.checkers:
+            if not (checker.is_item_check and checker.is_single_file_check):
+                raise ValueError(f'{type(checker).__name__} cannot check streamed items.')
+
+        results: List[ReportGroup] = []
+        item_checks: List[Tuple[Check, ReportGroup]] = []
+        for checker in self.checkers:
+            report = ReportGroup(checker.report_title)
+            if checker.prepare_item_check(report, None):
+                item_checks.append((checker, report))
+            results.append(report)
+
+        self._run_item_checks(item_checks, (item for _, item in parsed))
+
+        return results
@@ -0,0 +1,318 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from transtool.const import Const
+from transtool.profiler import ProfileTimer, Profiler
+from transtool.prop.items import PropItem, Translation
+from transtool.report.group import ReportGroup
+from transtool.report.items import ReportItem
+from .check import Check
+
+
+class IncrementalState(object):
+    """
+    Results of previous validation of a file, as used by IncrementalEngine.
+    """
+
+    # Bump if format of the state changes.
+    FORMAT_VERSION = 2
+
+    def __init__(self):
+        # Fingerprint of checker's class and config, for all checkers which results are recorded.
+        self.checkers: Dict[str, str] = {}
+        # Translation key -> (fingerprint of the key's translation and reference, item index).
+        self.fingerprints: Dict[str, Tuple] = {}
+        # Checker ID -> Translation key -> issues reported by per-item checker for that key.
+        self.item_results: Dict[str, Dict[str, List[ReportItem]]] = {}
+
+        # Key sets of checked files.
+        self.keys: Set[str] = set()
+        self.commented_out_keys: Set[str] = set()
+        self.reference_keys: Set[str] = set()
+        # Checker ID -> Key -> issues reported by per-key checker for that key.
+        self.key_results: Dict[str, Dict[str, List[ReportItem]]] = {}
+
+    @staticmethod
+    def load(state_file: Path) -> 'IncrementalState':
+        """
+        Loads state from given file. Returns empty state if there's no (usable) state stored.
+        """
+        if state_file.exists():
+            # noinspection PyBroadException
+            try:
+                with open(state_file, 'rb') as fh:
+                    version, app_version, state = pickle.load(fh)
+                if version == IncrementalState.FORMAT_VERSION and app_version == Const.APP_VERSION \
+                        and isinstance(state, IncrementalState):
+                    return state
+            except Exception:
+                # Corrupted state is as good as no state.
+                pass
+        return IncrementalState()
+
+    def save(self, state_file: Path) -> None:
+        """
+        Stores the state in given file. Failing to write the state is not an error.
+        """
+        try:
+            state_file.parent.mkdir(parents=True, exist_ok=True)
+            # Write to temporary file first, so concurrent runs never see partially written state.
+            fd, tmp_name = tempfile.mkstemp(dir=state_file.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as fh:
+                    pickle.dump((self.FORMAT_VERSION, Const.APP_VERSION, self), fh, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_name, state_file)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError:
+            pass
+
+
+# noinspection PyUnresolvedReferences
+class IncrementalEngine(object):
+    """
+    Incremental counterpart of CheckEngine. Results of the previous run are kept in IncrementalState,
+    and only the work affected by changes made since is redone:
+    * per-item checkers are run only for the keys whose translation or reference value changed (or
+      whose issues cannot be moved to item's new line number). Comments and blank lines are always checked,
+    * per-key checkers (`is_key_check`) are run only for the keys added to or removed from either file,
+    * any other checker is run in full.
+    Change of checker's config invalidates all its recorded results.
+    If Profiler is active, time spent in each checker is recorded. Reused results are not counted.
+    """
+
+    STATE_DIR = 'incremental'
+
+    def __init__(self, checkers: Dict[str, Check]):
+        """
+        :param checkers: Checkers to run, keyed by checker ID.
+        """
+        self.checkers = checkers
+
+    @staticmethod
+    def get_state_file(cache_dir: Path, translation_file: Path, reference_file: Optional[Path] = None) -> Path:
+        """
+        Returns path of the file the state of given translation (and reference) file pair is stored in.
+        """
+        name = str(translation_file.resolve())
+        if reference_file is not None:
+            name += f'|{reference_file.resolve()}'
+        return cache_dir / IncrementalEngine.STATE_DIR / f'{hashlib.sha256(name.encode("utf-8")).hexdigest()}.state'
+
+    @staticmethod
+    def _get_checker_fingerprint(checker: Check) -> str:
+        checker_cls = type(checker)
+        config = json.dumps(checker.config, sort_keys=True, default=str)
+        return f'{checker_cls.__module__}.{checker_cls.__qualname__}:{config}'
+
+    @staticmethod
+    def _move_issue(issue: ReportItem, old_line: int, new_line: int) -> Optional[ReportItem]:
+        """
+        Returns copy of the issue reported at old_line moved to new_line, or None if its position
+        is not recognized and the issue cannot be moved. As line number could also be part of the
+        message, issues with message containing old line number are not moved either.
+        """
+        position = issue.position
+        if position is not None and old_line != new_line:
+            old_position = str(old_line)
+            if old_position in issue.msg:
+                return None
+            if position == old_position:
+                position = str(new_line)
+            elif position.startswith(f'{old_position}:'):
+                position = f'{new_line}{position[len(old_position):]}'
+            else:
+                return None
+        return type(issue)(position, issue.msg, issue.trans_key)
+
+    # #################################################################################################
+
+    # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
+    def run_with_state(self, state_file: Path, translation: 'PropFile',
+                       reference: Optional['PropFile'] = None) -> List[ReportGroup]:
+        """
+        Loads the state from given file, runs the checkers and stores updated state back.
+
+        :param state_file: File to keep the state in (see get_state_file()).
+        :param translation: PropFile object containing translations to be checked.
+        :param reference: Optional PropFile object to be used as reference.
+        :return: List of ReportGroups, in the same order as checkers.
+        """
+        state = IncrementalState.load(state_file)
+        results = self.run(state, translation, reference)
+        state.save(state_file)
+        return results
+
+    # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
+    def run(self, state: IncrementalState, translation: 'PropFile',
+            reference: Optional['PropFile'] = None) -> List[ReportGroup]:
+        """
+        Runs all the checkers against given files, reusing results recorded in the state, then
+        updates the state with the results of this run.
+
+        :param state: Results of previous run. Updated in place.
+        :param translation: PropFile object containing translations to be checked.
+        :param reference: Optional PropFile object to be used as reference.
+        :return: List of ReportGroups, in the same order as checkers.
+        """
+        checker_fingerprints = {checker_id: self._get_checker_fingerprint(checker)
+                                for checker_id, checker in self.checkers.items()}
+        # Checkers which results recorded in the state are valid for current config.
+        reusable = {checker_id for checker_id, fingerprint in checker_fingerprints.items()
+                    if state.checkers.get(checker_id) == fingerprint}
+
+        results: Dict[str, ReportGroup] = {}
+
+        item_checks: List[Tuple[str, Check, ReportGroup]] = []
+        for checker_id, checker in self.checkers.items():
+            if checker.is_item_check:
+                report = ReportGroup(checker.report_title)
+                if checker.prepare_item_check(report, translation, reference):
+                    item_checks.append((checker_id, checker, report))
+                else:
+                    # Nothing was checked, so there's no results to be recorded.
+                    del checker_fingerprints[checker_id]
+                results[checker_id] = report
+        if item_checks:
+            self._run_item_checks(state, reusable, item_checks, translation, reference)
+
+        profiler = Profiler.get()
+        for checker_id, checker in self.checkers.items():
+            if checker_id in results:
+                continue
+            started = profiler.start() if profiler is not None else None
+            if checker.is_key_check and reference is not None:
+                results[checker_id] = self._run_key_check(state, checker_id in reusable, checker_id, checker,
+                                                          translation, reference)
+            else:
+                results[checker_id] = checker.check(translation, reference)
+                if checker.is_key_check:
+                    # Per-key results were not recorded.
+                    del checker_fingerprints[checker_id]
+            if profiler is not None:
+                profiler.stop(started, Profiler.CATEGORY_CHECK, type(checker).__name__, translation.file,
+                              len(translation.items))
+
+        state.keys = set(translation.keys)
+        state.commented_out_keys = set(translation.commented_out_keys)
+        state.reference_keys = set(reference.keys) if reference is not None else set()
+        state.checkers = checker_fingerprints
+
+        return [results[checker_id] for checker_id in self.checkers]
+
+    # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
+    def _run_item_checks(self, state: IncrementalState, reusable: Set[str],
+                         item_checks: List[Tuple[str, Check, ReportGroup]],
+                         translation: 'PropFile', reference: Optional['PropFile']) -> None:
+        fingerprints: Dict[str, Tuple] = {}
+        item_results: Dict[str, Dict[str, List[ReportItem]]] = {checker_id: {} for checker_id, _, _ in item_checks}
+
+        profiler = Profiler.get()
+        timers = {checker_id: ProfileTimer() for checker_id, _, _ in item_checks} if profiler is not None else {}
+        # Checker ID -> callable to be used in place of checker's check_item().
+        check_items = {checker_id: timers[checker_id].wrap(checker.check_item) if timers else checker.check_item
+                       for checker_id, checker, _ in item_checks}
+
+        for idx, item in enumerate(translation.items):
+            if not isinstance(item, Translation):
+                for checker_id, checker, report in item_checks:
+                    if not checker.translations_only:
+                        check_items[checker_id](report, idx, item, reference)
+                continue
+
+            ref_value = None
+            if reference is not None:
+                ref = reference.find_by_key(item.key)
+                if ref is not None:
+                    ref_value = ref.value
+            fingerprint = (item.value, item.separator, ref_value)
+            fingerprints[item.key] = (fingerprint, idx)
+
+            previous = state.fingerprints.get(item.key)
+            unchanged = previous is not None and previous[0] == fingerprint
+            for checker_id, checker, report in item_checks:
+                issues = None
+                if unchanged and checker_id in reusable:
+                    issues = self._reuse_issues(state.item_results.get(checker_id, {}).get(item.key, []),
+                                                previous[1], idx)
+                if issues is None:
+                    issues = self._check_item(checker, check_items[checker_id], idx, item, reference)
+                report.add(issues)
+                if issues:
+                    item_results[checker_id][item.key] = issues
+
+        if profiler is not None:
+            for checker_id, checker, _ in item_checks:
+                profiler.add_timer(timers[checker_id], Profiler.CATEGORY_CHECK, type(checker).__name__, translation.file)
+
+        state.fingerprints = fingerprints
+        # Results of checkers not run this time are dropped, as they were not checked against current data.
+        state.item_results = item_results
+
+    def _reuse_issues(self, issues: List[ReportItem], old_idx: int, new_idx: int) -> Optional[List[ReportItem]]:
+        """
+        Returns previously reported issues moved to item's current position, or None if any of them
+        cannot be moved and the item needs to be checked again.
+        """
+        moved = []
+        for issue in issues:
+            moved_issue = self._move_issue(issue, old_idx + 1, new_idx + 1)
+            if moved_issue is None:
+                return None
+            moved.append(moved_issue)
+        return moved
+
+    @staticmethod
+    # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
+    def _check_item(checker: Check, check_item: Callable, idx: int, item: PropItem,
+                    reference: Optional['PropFile']) -> List[ReportItem]:
+        report = ReportGroup(checker.report_title)
+        check_item(report, idx, item, reference)
+        return list(report)
+
+    # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
+    def _run_key_check(self, state: IncrementalState, reusable: bool, checker_id: str, checker: Check,
+                       translation: 'PropFile', reference: 'PropFile') -> ReportGroup:
+        report = ReportGroup(checker.report_title)
+        checker.need_valid_config()
+        checker.need_both_files(translation, reference)
+
+        previous_results = state.key_results.get(checker_id, {}) if reusable else None
+        changed_keys: Set[str] = set()
+        if previous_results is not None:
+            # Result of per-key check depends on presence of the key in the files only, so we need to
+            # check the keys that were added to or removed from any of the files only.
+            changed_keys = (state.keys.symmetric_difference(translation.keys)
+                            | state.commented_out_keys.symmetric_difference(translation.commented_out_keys)
+                            | state.reference_keys.symmetric_difference(reference.keys))
+
+        key_results: Dict[str, List[ReportItem]] = {}
+        for key in checker.get_checked_keys(translation, reference):
+            if previous_results is not None and key not in changed_keys:
+                issues = previous_results.get(key, [])
+            else:
+                key_report = ReportGroup(checker.report_title)
+                checker.check_key(key_report, key, translation, reference)
+                issues = list(key_report)
+            report.add(issues)
+            if issues:
+                key_results[key] = issues
+
+        state.key_results[checker_id] = key_results
+        return report
@@ -0,0 +1,144 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Hashable, Optional, Tuple
+
+from transtool.config.config import Config
+from transtool.const import Const
+from .check import Check
+
+
+class ResultMemo(object):
+    """
+    Memoizes outcomes of pure per-item checks (see Check.get_item_memo_key()), so the same value
+    (i.e. product name or placeholder, present in many languages and files) is checked once only.
+
+    As issues reported by checkers refer to item's position and key, we do not store the issues but
+    just record that given value passed the check. Values with issues are simply checked each time,
+    which is fine, as these are (hopefully) rare. Number of entries is limited, with least recently
+    used ones evicted first. Entries can be persisted in a file, to be reused by subsequent runs.
+    """
+
+    # Bump if format of the persisted entries changes.
+    FORMAT_VERSION = 1
+
+    # Memo instance shared by all the checks run in this process. See get_shared().
+    _shared: Optional['ResultMemo'] = None
+
+    def __init__(self, max_size: int = Config.DEFAULT_MEMO_SIZE):
+        if max_size < 1:
+            raise ValueError('Memo size must be positive.')
+        self.max_size = max_size
+        self._entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_shared(config: Config) -> Optional['ResultMemo']:
+        """
+        Returns memo instance shared by all the checks run in this process, or None if memoization
+        is disabled. Persisted entries (if any) are loaded once the instance is created.
+
+        :param config: Application config.
+        """
+        if not config.memo:
+            ResultMemo._shared = None
+            return None
+        memo = ResultMemo._shared
+        if memo is None or memo.max_size != config.memo_size:
+            memo = ResultMemo(config.memo_size)
+            if config.memo_file:
+                memo.load(Path(config.memo_file))
+            ResultMemo._shared = memo
+        return memo
+
+    @staticmethod
+    def get_checker_digest(checker: Check) -> str:
+        """
+        Returns digest identifying the checker and its current configuration.
+        """
+        checker_cls = type(checker)
+        config = json.dumps(checker.config, sort_keys=True, default=str)
+        return hashlib.sha256(f'{checker_cls.__module__}.{checker_cls.__qualname__}:{config}'.encode('utf-8')).hexdigest()
+
+    # #################################################################################################
+
+    def is_clean(self, key: Tuple[str, Hashable]) -> bool:
+        """
+        Returns True if the check identified by key was recorded as passed.
+
+        :param key: Tuple of (checker digest, item memo key).
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True
+        self.misses += 1
+        return False
+
+    def mark_clean(self, key: Tuple[str, Hashable]) -> None:
+        """
+        Records the check identified by key as passed.
+
+        :param key: Tuple of (checker digest, item memo key).
+        """
+        self._entries[key] = None
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # #################################################################################################
+
+    def load(self, file: Path) -> None:
+        """
+        Loads entries persisted in given file. Missing, corrupted or outdated file is silently ignored.
+        """
+        if not file.exists():
+            return
+        # noinspection PyBroadException
+        try:
+            with open(file, 'rb') as fh:
+                version, app_version, keys = pickle.load(fh)
+            if version != self.FORMAT_VERSION or app_version != Const.APP_VERSION:
+                return
+            for key in keys:
+                self.mark_clean(tuple(key))
+        except Exception:
+            # Corrupted file is as good as no file.
+            pass
+
+    def save(self, file: Path) -> None:
+        """
+        Persists entries in given file. Failing to write the file is not an error.
+        """
+        try:
+            file.parent.mkdir(parents=True, exist_ok=True)
+            # Write to temporary file first, so concurrent runs never see partially written file.
+            fd, tmp_name = tempfile.mkstemp(dir=file.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as fh:
+                    pickle.dump((self.FORMAT_VERSION, Const.APP_VERSION, list(self._entries)), fh,
+                                protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_name, file)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError:
+            pass
@@ -8,9 +8,10 @@
 #
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, Hashable, List, Optional
 
 from transtool.decorators.overrides import overrides
+from transtool.prop.items import PropItem
 from transtool.report.group import ReportGroup
 from .base.check import Check
 
@@ -31,6 +32,13 @@ class Brackets(Check):
     def __init__(self, config: Optional[Dict] = None):
         super().__init__(config)
         self.is_single_file_check = True
+        self.is_item_check = True
+
+        # Built by prepare()
+        self._closing_by_opening: Dict[str, str] = {}
+        self._opening: FrozenSet[str] = frozenset()
+        self._closing: FrozenSet[str] = frozenset()
+        self._quotation_marks: FrozenSet[str] = frozenset()
 
     report_title = 'Brackets'
 
@@ -42,98 +50,112 @@ class Brackets(Check):
         :return: True if it is quoted, False otherwise.
         """
         if 0 < char_idx < len(line) - 1:
-            for quotation_mark in self.config['quotation_marks']:
-                if line[char_idx - 1] == quotation_mark and line[char_idx + 1] == quotation_mark:
-                    # It looks it is, so we are going to skip it.
-                    return True
+            quotation_mark = line[char_idx - 1]
+            if quotation_mark == line[char_idx + 1] and quotation_mark in self._quotation_marks:
+                # It looks it is, so we are going to skip it.
+                return True
         return False
 
+    @overrides(Check)
+    def prepare(self) -> None:
+        super().prepare()
+        # Closing bracket expected for each opening one. If the same opening bracket is listed more than once,
+        # the first pair wins.
+        self._closing_by_opening = {}
+        for opening, closing in zip(self.config['opening'], self.config['closing']):
+            self._closing_by_opening.setdefault(opening, closing)
+        self._opening = frozenset(self.config['opening'])
+        self._closing = frozenset(self.config['closing'])
+        self._quotation_marks = frozenset(self.config['quotation_marks'])
+
     @overrides(Check)
     # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
     def check(self, translation: 'PropFile', reference: 'PropFile' = None) -> ReportGroup:
-        self.need_valid_config()
+        return self._check_all_items(translation, reference)
 
-        report = ReportGroup(self.report_title)
+    @overrides(Check)
+    # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
+    def prepare_item_check(self, report: ReportGroup, translation: 'PropFile', reference: 'PropFile' = None) -> bool:
+        self.need_valid_config()
+        self.need_prepared()
 
         opening_key = 'opening'
         closing_key = 'closing'
 
-        opening = self.config[opening_key]
-        closing = self.config[closing_key]
-
-        opening_cnt = len(opening)
-        closing_cnt = len(closing)
+        opening_cnt = len(self.config[opening_key])
+        closing_cnt = len(self.config[closing_key])
 
         if opening_cnt == 0 or closing_cnt == 0:
             report.warn(line=None, msg=f'CONFIG: Empty "{opening_key}" and "{closing_key}" arrays.')
-            return report
+            return False
         if opening_cnt != closing_cnt:
             report.error(line=None,
                          msg=f'CONFIG: Size of "{opening_key}" and "{closing_key}" arrays must be equal.')
-            return report
+            return False
 
-        # We do that check at the end to ensure config is validated first.
-        if not translation.items:
-            return report
+        return True
 
-        for idx, item in enumerate(translation.items):
-            # Do not try to be clever and filter() data first, because line_number values will no longer be correct.
-            if self._shall_skip_item(item):
+    @overrides(Check)
+    # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
+    def check_item(self, report: ReportGroup, idx: int, item: PropItem, reference: 'PropFile' = None) -> None:
+        if self._shall_skip_item(item):
+            return
+
+        opening = self._opening
+        closing = self._closing
+
+        stack: List[Bracket] = []
+        for char_idx, current_char in enumerate(item.value):
+            in_opening = False
+            in_closing = False
+
+            if current_char in opening:
+                in_opening = True
+            elif current_char in closing:
+                in_closing = True
+            else:
                 continue
 
-            stack: List[Bracket] = []
-            has_errors = False
-            for char_idx, current_char in enumerate(item.value):
-                position: str = f'{idx + 1}:{char_idx + 1}'
-
-                in_opening = False
-                in_closing = False
+            position: str = f'{idx + 1}:{char_idx + 1}'
 
-                if current_char in opening:
-                    in_opening = True
-                elif current_char in closing:
-                    in_closing = True
-                else:
-                    continue
-
-                # At this point we know we are dealing with known bracket.
-                if self.config['ignore_quoted'] and self._is_quoted(item.value, char_idx):
-                    continue
-
-                if in_opening:
-                    # Every opening brace is pushed to the stack.
-                    stack.append(Bracket(char_idx, current_char))
-                    continue
-
-                if in_closing:
-                    # Every closing brace should take its own pair off the stack
+            # At this point we know we are dealing with known bracket.
+            if self.config['ignore_quoted'] and self._is_quoted(item.value, char_idx):
+                continue
 
-                    if not stack:
-                        # If stack is empty, then we had more closing brackets than opening ones.
-                        report.create(position, f'No opening character matching "{current_char}".', item.key)
-                        # Just show single error per line to avoid flooding.
-                        has_errors = True
-                        break
+            if in_opening:
+                # Every opening brace is pushed to the stack.
+                stack.append(Bracket(char_idx, current_char))
+                continue
 
-                    # Check if what we are about to pop from the stack and see if our current_char matches.
-                    expected = closing[opening.index(stack[-1].bracket)]
-                    if current_char == expected:
-                        stack.pop()
-                        continue
+            if in_closing:
+                # Every closing brace should take its own pair off the stack
 
-                    # This is not the bracket we were looking for...
-                    report.create(position, f'Expected "{expected}", found "{current_char}".', item.key)
+                if not stack:
+                    # If stack is empty, then we had more closing brackets than opening ones.
+                    report.create(position, f'No opening character matching "{current_char}".', item.key)
                     # Just show single error per line to avoid flooding.
-                    has_errors = True
-                    break
+                    return
+
+                # Check if what we are about to pop from the stack and see if our current_char matches.
+                expected = self._closing_by_opening[stack[-1].bracket]
+                if current_char == expected:
+                    stack.pop()
+                    continue
 
-            if not has_errors and stack:
+                # This is not the bracket we were looking for...
+                report.create(position, f'Expected "{expected}", found "{current_char}".', item.key)
                 # Just show single error per line to avoid flooding.
-                bracket = stack[0]
-                position: str = f'{idx + 1}:{bracket.pos + 1}'
-                report.create(position, f'No closing character for "{bracket.bracket}" found.', item.key)
+                return
 
-        return report
+        if stack:
+            # Just show single error per line to avoid flooding.
+            bracket = stack[0]
+            position: str = f'{idx + 1}:{bracket.pos + 1}'
+            report.create(position, f'No closing character for "{bracket.bracket}" found.', item.key)
+
+    @overrides(Check)
+    def get_item_memo_key(self, item: PropItem) -> Optional[Hashable]:
+        return self._get_value_memo_key(item)
 
     @overrides(Check)
     def get_default_config(self) -> Dict:
@@ -8,6 +8,8 @@
 #
 """
 
+from typing import Dict, Iterable, Optional
+
 from transtool.decorators.overrides import overrides
 from transtool.report.group import ReportGroup
 from .base.check import Check
@@ -15,16 +17,34 @@ from .base.check import Check
 
 class DanglingKeys(Check):
 
+    report_title = 'Dangling keys'
+
+    def __init__(self, config: Optional[Dict] = None):
+        super().__init__(config)
+        self.is_key_check = True
+
     # noinspection PyUnresolvedReferences
     @overrides(Check)
     # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
     def check(self, translation_file: 'PropFile', reference_file: 'PropFile' = None) -> ReportGroup:
         self.need_both_files(translation_file, reference_file)
 
-        report = ReportGroup('Dangling keys')
+        report = ReportGroup(self.report_title)
         # Remove all keys that are present in both files and see what left.
-        dangling_keys = list(filter(lambda key: key not in reference_file.keys, translation_file.keys))
-        for trans_key in dangling_keys:
+        for trans_key in translation_file.keys.difference(reference_file.keys):
             report.error(None, f'Not present in base file: "{trans_key}".')
 
         return report
+
+    # noinspection PyUnresolvedReferences
+    @overrides(Check)
+    # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
+    def get_checked_keys(self, translation_file: 'PropFile', reference_file: 'PropFile') -> Iterable[str]:
+        return translation_file.keys
+
+    # noinspection PyUnresolvedReferences
+    @overrides(Check)
+    # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
+    def check_key(self, report: ReportGroup, key: str, translation_file: 'PropFile', reference_file: 'PropFile') -> None:
+        if key not in reference_file.keys:
+            report.error(None, f'Not present in base file: "{key}".')
@@ -8,9 +8,9 @@
 #
 """
 
-from typing import Dict
+from typing import Dict, Optional
 from transtool.decorators.overrides import overrides
-from transtool.prop.items import Translation
+from transtool.prop.items import PropItem, Translation
 from transtool.report.group import ReportGroup
 from .base.check import Check
 
@@ -21,36 +21,46 @@ class EmptyTranslations(Check):
     This check verifies translation exists and is not an empty string (unless original string is also empty).
     """
 
+    report_title = 'Empty translations'
+
+    def __init__(self, config: Optional[Dict] = None):
+        super().__init__(config)
+        self.is_item_check = True
+        self.translations_only = True
+
     @overrides(Check)
     # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
     def check(self, translation_file: 'PropFile', reference_file: 'PropFile' = None) -> ReportGroup:
-        self.need_valid_config()
-        self.need_both_files(translation_file, reference_file)
+        return self._check_all_items(translation_file, reference_file)
 
-        report = ReportGroup('Empty translations')
-
-        for idx, item in enumerate(translation_file.items):
-            # We care translations only for now.
-            # Do not try to be clever and filter() data first, because line_number values will no longer be correct.
-            if not isinstance(item, Translation):
-                continue
+    @overrides(Check)
+    # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
+    def prepare_item_check(self, report: ReportGroup, translation: 'PropFile', reference: 'PropFile' = None) -> bool:
+        self.need_valid_config()
+        self.need_both_files(translation, reference)
+        return True
 
-            # If translation is not empty, skip it.
-            if item.value.strip() != '':
-                continue
+    @overrides(Check)
+    # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
+    def check_item(self, report: ReportGroup, idx: int, item: PropItem, reference: 'PropFile' = None) -> None:
+        # We care translations only for now.
+        if not isinstance(item, Translation):
+            return
 
-            # Get reference string. Skip if not found (dangling key?)
-            ref: Translation = reference_file.find_by_key(item.key)
-            if not ref:
-                continue
+        # If translation is not empty, skip it.
+        if item.value.strip() != '':
+            return
 
-            # If reference string is empty, translation can be empty too.
-            if ref.value.strip() == '':
-                continue
+        # Get reference string. Skip if not found (dangling key?)
+        ref: Translation = reference.find_by_key(item.key)
+        if not ref:
+            return
 
-            report.warn(idx + 1, 'Empty string.', item.key)
+        # If reference string is empty, translation can be empty too.
+        if ref.value.strip() == '':
+            return
 
-        return report
+        report.warn(idx + 1, 'Empty string.', item.key)
 
     @overrides(Check)
     def get_default_config(self) -> Dict:
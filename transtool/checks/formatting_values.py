@@ -9,10 +9,10 @@
 """
 
 import re
-from typing import List
+from typing import Dict, List, Optional
 
 from transtool.decorators.overrides import overrides
-from transtool.prop.items import Translation
+from transtool.prop.items import PropItem, Translation
 from transtool.report.group import ReportGroup
 from .base.check import Check
 
@@ -30,53 +30,63 @@ class FormattingValues(Check):
     then translation uses it as well and in the same order.
     """
 
+    report_title = 'Formatting values'
+
+    def __init__(self, config: Optional[Dict] = None):
+        super().__init__(config)
+        self.is_item_check = True
+        self.translations_only = True
+
+    # Format String Syntax
+    # https://docs.oracle.com/javase/7/docs/api/java/util/Formatter.html
+    FORMATTER_PATTERN = re.compile(r'(%[a-zA-Z0-9$#+.(-]+)')
+
     def _parse(self, item: str) -> List[Formatter]:
-        # Format String Syntax
-        # https://docs.oracle.com/javase/7/docs/api/java/util/Formatter.html
-        pattern = r'(%[a-zA-Z0-9$#+.(-]+)'
-        return [Formatter(match.start(), match.group(1)) for match in re.finditer(pattern, item)]
+        if '%' not in item:
+            return []
+        return [Formatter(match.start(), match.group(1)) for match in self.FORMATTER_PATTERN.finditer(item)]
 
     @overrides(Check)
     # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
     def check(self, translation_file: 'PropFile', reference_file: 'PropFile' = None) -> ReportGroup:
-        self.need_both_files(translation_file, reference_file)
-
-        report = ReportGroup('Formatting values')
-
-        for idx, item in enumerate(translation_file.items):
-            # We care translations only for now.
-            # Do not try to be clever and filter() data first, because line_number values will no longer be correct.
-            if not isinstance(item, Translation):
-                continue
-
-            # Is there translation of this item present?
-            ref = reference_file.find_by_key(item.key)
-            # Skip dangling keys
-            if not ref:
-                continue
-
-            # See if we have any formatting values in both lines
-            ref_items = self._parse(ref.value)
-            trans_items = self._parse(item.value)
+        return self._check_all_items(translation_file, reference_file)
 
-            if not ref_items and not trans_items:
-                # Nothing to check here.
-                continue
+    @overrides(Check)
+    # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
+    def prepare_item_check(self, report: ReportGroup, translation: 'PropFile', reference: 'PropFile' = None) -> bool:
+        self.need_both_files(translation, reference)
+        return True
 
-            if len(trans_items) != len(ref_items):
-                report.error(idx + 1, f'Expected {len(ref_items)} formatters, found {len(trans_items)}.', item.key)
+    @overrides(Check)
+    # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
+    def check_item(self, report: ReportGroup, idx: int, item: PropItem, reference: 'PropFile' = None) -> None:
+        # We care translations only for now.
+        if not isinstance(item, Translation):
+            return
+
+        # Is there translation of this item present?
+        ref = reference.find_by_key(item.key)
+        # Skip dangling keys
+        if not ref:
+            return
+
+        # See if we have any formatting values in both lines
+        ref_items = self._parse(ref.value)
+        trans_items = self._parse(item.value)
+
+        if not ref_items and not trans_items:
+            # Nothing to check here.
+            return
+
+        if len(trans_items) != len(ref_items):
+            report.error(idx + 1, f'Expected {len(ref_items)} formatters, found {len(trans_items)}.', item.key)
+            return
+
+        # Count matches, let's check the order now.
+        for ref_item, trans_item in zip(ref_items, trans_items):
+            if ref_item.formatter == trans_item.formatter:
                 continue
 
-            # Count matches, let's check the order now.
-            while ref_items:
-                ref_pop = ref_items.pop(0)
-                trans_pop = trans_items.pop(0)
-
-                if ref_pop.formatter == trans_pop.formatter:
-                    continue
-
-                pos = f'{idx + 1}:{trans_pop.pos + 1}'
-                report.error(pos, f'Expected "{ref_pop.formatter}", found "{trans_pop.formatter}".', item.key)
-                break
-
-        return report
+            pos = f'{idx + 1}:{trans_item.pos + 1}'
+            report.error(pos, f'Expected "{ref_item.formatter}", found "{trans_item.formatter}".', item.key)
+            break
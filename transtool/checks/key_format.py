@@ -9,10 +9,10 @@
 """
 
 import re
-from typing import Dict, Optional
+from typing import Dict, Hashable, Optional, Pattern
 
 from transtool.decorators.overrides import overrides
-from transtool.prop.items import Translation
+from transtool.prop.items import PropItem, Translation
 from transtool.report.group import ReportGroup
 from .base.check import Check
 
@@ -23,31 +23,39 @@ class KeyFormat(Check):
     This check verifies that translation keys follow specified naming convention.
     """
 
+    report_title = 'Key naming pattern.'
+
     def __init__(self, config: Optional[Dict] = None):
         super().__init__(config)
         self.is_single_file_check = True
+        self.is_item_check = True
+        self.translations_only = True
+        self._compiled_pattern: Optional[Pattern] = None
 
     @overrides(Check)
     # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
     def check(self, translation_file: 'PropFile', reference_file: 'PropFile' = None) -> ReportGroup:
-        self.need_valid_config()
-
-        report = ReportGroup('Key naming pattern.')
+        return self._check_all_items(translation_file, reference_file)
 
-        if translation_file.items:
-            pattern = self.config['pattern']
-            compiled_pattern = re.compile(pattern)
+    @overrides(Check)
+    def prepare(self) -> None:
+        super().prepare()
+        self._compiled_pattern = re.compile(self.config['pattern'])
 
-            for line_number, item in enumerate(translation_file.items):
-                # We care translations only for now.
-                # Do not try to be clever and filter() data first, because line_number values will no longer be correct.
-                if not isinstance(item, Translation):
-                    continue
+    @overrides(Check)
+    # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
+    def check_item(self, report: ReportGroup, idx: int, item: PropItem, reference: 'PropFile' = None) -> None:
+        # We care translations only for now.
+        if not isinstance(item, Translation):
+            return
 
-                if compiled_pattern.match(item.key) is None:
-                    report.error(line_number + 1, 'Invalid key name format.', item.key)
+        if self._compiled_pattern.match(item.key) is None:
+            report.error(idx + 1, 'Invalid key name format.', item.key)
 
-        return report
+    @overrides(Check)
+    def get_item_memo_key(self, item: PropItem) -> Optional[Hashable]:
+        # Only the key format is checked.
+        return item.key if isinstance(item, Translation) else None
 
     @overrides(Check)
     def get_default_config(self) -> Dict:
@@ -8,7 +8,8 @@
 #
 """
 
-from typing import Dict
+from typing import Dict, Iterable, Optional
+
 from transtool.decorators.overrides import overrides
 from transtool.report.group import ReportGroup
 from .base.check import Check
@@ -20,28 +21,45 @@ class MissingTranslations(Check):
     This check checks if given base key is also present in translation file.
     """
 
+    report_title = 'Missing translations'
+
+    def __init__(self, config: Optional[Dict] = None):
+        super().__init__(config)
+        self.is_key_check = True
+
     @overrides(Check)
     # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
     def check(self, translation_file: 'PropFile', reference_file: 'PropFile' = None) -> ReportGroup:
         self.need_valid_config()
         self.need_both_files(translation_file, reference_file)
 
-        report = ReportGroup('Missing translations')
-
-        missing_keys: List[str] = [ref_key for ref_key in reference_file.keys if ref_key not in translation_file.keys]
+        report = ReportGroup(self.report_title)
 
         # Commented out keys are also considered present in the translation
         # unless we run in strict check mode.
+        present_keys = [translation_file.keys]
         if not self.config['strict']:
-            for comm_key in translation_file.commented_out_keys:
-                if comm_key in missing_keys:
-                    del missing_keys[missing_keys.index(comm_key)]
+            present_keys.append(translation_file.commented_out_keys)
 
-        for missing_key in missing_keys:
+        for missing_key in reference_file.keys.difference(*present_keys):
             report.warn(None, 'Missing translation.', missing_key)
 
         return report
 
+    @overrides(Check)
+    # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
+    def get_checked_keys(self, translation_file: 'PropFile', reference_file: 'PropFile') -> Iterable[str]:
+        return reference_file.keys
+
+    @overrides(Check)
+    # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
+    def check_key(self, report: ReportGroup, key: str, translation_file: 'PropFile', reference_file: 'PropFile') -> None:
+        if key in translation_file.keys:
+            return
+        if not self.config['strict'] and key in translation_file.commented_out_keys:
+            return
+        report.warn(None, 'Missing translation.', key)
+
     @overrides(Check)
     def get_default_config(self) -> Dict:
         return {
@@ -8,9 +8,10 @@
 #
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, Hashable, List, Optional
 
 from transtool.decorators.overrides import overrides
+from transtool.prop.items import PropItem
 from transtool.report.group import ReportGroup
 from .base.check import Check
 
@@ -28,48 +29,61 @@ class QuotationMarks(Check):
     opened marks got their closing pair.
     """
 
+    report_title = 'Quotation marks'
+
     def __init__(self, config: Optional[Dict] = None):
         super().__init__(config)
         self.is_single_file_check = True
+        self.is_item_check = True
+
+        # Built by prepare()
+        self._chars: FrozenSet[str] = frozenset()
+
+    @overrides(Check)
+    def prepare(self) -> None:
+        super().prepare()
+        self._chars = frozenset(self.config['chars'])
 
     @overrides(Check)
     # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
     def check(self, translation_file: 'PropFile', reference_file: 'PropFile' = None) -> ReportGroup:
-        self.need_valid_config()
-
-        report = ReportGroup('Quotation marks')
+        return self._check_all_items(translation_file, reference_file)
 
-        for line_idx, item in enumerate(translation_file.items):
-            # Do not try to be clever and filter() data first, because line_number values will no longer be correct.
-            if self._shall_skip_item(item):
+    @overrides(Check)
+    # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
+    def check_item(self, report: ReportGroup, idx: int, item: PropItem, reference: 'PropFile' = None) -> None:
+        if self._shall_skip_item(item):
+            return
+
+        chars = self._chars
+        stack: List[Mark] = []
+        for pos, current_char in enumerate(item.value):
+            if current_char not in chars:
                 continue
 
-            stack: List[Mark] = []
-            for pos, current_char in enumerate(item.value):
-                if current_char not in self.config['chars']:
-                    continue
-
-                if not stack:
-                    # If stack is empty, push our mark and move on
-                    stack.append(Mark(pos, current_char))
-                    continue
-
-                # If stack is not empty then we see if the last item is a match. If not,
-                # we assume this attempt to nest the quotation marks. If that's not the case
-                # we will catch that later anyway as we will have it left on stack.
-                if stack[-1].mark == current_char:
-                    # It it matches our mark, then it's the right one :)
-                    stack.pop()
-                    continue
+            if not stack:
+                # If stack is empty, push our mark and move on
                 stack.append(Mark(pos, current_char))
+                continue
 
-            for quotation_mark in stack:
-                position: str = f'{line_idx + 1}:{quotation_mark.pos + 1}'
-                report.create(position, f'No paired mark for {quotation_mark.mark}.', item.key)
-                # Just show single error per line to avoid flooding.
-                break
+            # If stack is not empty then we see if the last item is a match. If not,
+            # we assume this attempt to nest the quotation marks. If that's not the case
+            # we will catch that later anyway as we will have it left on stack.
+            if stack[-1].mark == current_char:
+                # It it matches our mark, then it's the right one :)
+                stack.pop()
+                continue
+            stack.append(Mark(pos, current_char))
 
-        return report
+        if stack:
+            # Just show single error per line to avoid flooding.
+            quotation_mark = stack[0]
+            position: str = f'{idx + 1}:{quotation_mark.pos + 1}'
+            report.create(position, f'No paired mark for {quotation_mark.mark}.', item.key)
+
+    @overrides(Check)
+    def get_item_memo_key(self, item: PropItem) -> Optional[Hashable]:
+        return self._get_value_memo_key(item)
 
     @overrides(Check)
     def get_default_config(self) -> Dict:
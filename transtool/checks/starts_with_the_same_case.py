@@ -11,7 +11,7 @@
 from typing import Dict, Tuple, Optional
 
 from transtool.decorators.overrides import overrides
-from transtool.prop.items import Translation
+from transtool.prop.items import PropItem, Translation
 from transtool.report.group import ReportGroup
 from .base.check import Check
 
@@ -22,6 +22,13 @@ class StartsWithTheSameCase(Check):
     This check verifies translation first letter is the same lower/upper cased as original text.
     """
 
+    report_title = 'First words case mismatch.'
+
+    def __init__(self, config: Optional[Dict] = None):
+        super().__init__(config)
+        self.is_item_check = True
+        self.translations_only = True
+
     def _find_word(self, line: str) -> Tuple[Optional[int], Optional[str]]:
         words = line.strip().split()
         for idx, word in enumerate(words):
@@ -32,64 +39,67 @@ class StartsWithTheSameCase(Check):
     @overrides(Check)
     # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
     def check(self, translation_file: 'PropFile', reference_file: 'PropFile' = None) -> ReportGroup:
-        self.need_both_files(translation_file, reference_file)
+        return self._check_all_items(translation_file, reference_file)
+
+    @overrides(Check)
+    # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
+    def prepare_item_check(self, report: ReportGroup, translation: 'PropFile', reference: 'PropFile' = None) -> bool:
+        self.need_both_files(translation, reference)
         self.need_valid_config()
+        return True
 
-        report = ReportGroup('First words case mismatch.')
-
-        for idx, trans in enumerate(translation_file.items):
-            # We care translations only for now.
-            # Do not try to be clever and filter() data first, because line_number values will no longer be correct.
-            if not isinstance(trans, Translation):
-                continue
-
-            # Is there translation of this item present?
-            ref = reference_file.find_by_key(trans.key)
-
-            if not ref:
-                continue
-
-            # Skip if translation or reference string is empty.
-            if ref.value.strip() == '' or trans.value.strip() == '':
-                continue
-
-            # Before we look for words, let's check for digits (if enabled)
-            if self.config['accept_digits']:
-                # Any starting digit matches "opposite" sentence's case
-                if ref.value[0].isdigit() or trans.value[0].isdigit():
-                    continue
-
-            # Find first 'word' that starts with a letter.
-            ref_word_idx, ref_word = self._find_word(ref.value)
-            trans_word_idx, trans_word = self._find_word(trans.value)
-
-            # Skip line if both base and translation strings contain no words.
-            if not ref_word and not trans_word:
-                continue
-
-            if ref_word and not trans_word:
-                report.warn(idx + 1, 'Translation contains no words starting with a letter, while original does.',
-                            trans.key)
-                continue
-            if not ref_word and trans_word:
-                report.warn(idx + 1, 'Base string contains no words starting with a letter, but translation does.',
-                            trans.key)
-                continue
-
-            ref_first_char = ref_word[0]
-            trans_first_char = trans_word[0]
-
-            if trans_first_char.isupper() != ref_first_char.isupper():
-                if ref_first_char.isupper():
-                    expected = 'UPPER-cased'
-                    found = 'lower-cased'
-                else:
-                    expected = 'lower-cased'
-                    found = 'UPPER-cased'
-
-                report.warn(idx + 1, f'Value starts with {found} character. Expected {expected}.', trans.key)
-
-        return report
+    @overrides(Check)
+    # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
+    def check_item(self, report: ReportGroup, idx: int, trans: PropItem, reference: 'PropFile' = None) -> None:
+        # We care translations only for now.
+        if not isinstance(trans, Translation):
+            return
+
+        # Is there translation of this item present?
+        ref = reference.find_by_key(trans.key)
+
+        if not ref:
+            return
+
+        # Skip if translation or reference string is empty.
+        if ref.value.strip() == '' or trans.value.strip() == '':
+            return
+
+        # Before we look for words, let's check for digits (if enabled)
+        if self.config['accept_digits']:
+            # Any starting digit matches "opposite" sentence's case
+            if ref.value[0].isdigit() or trans.value[0].isdigit():
+                return
+
+        # Find first 'word' that starts with a letter.
+        ref_word_idx, ref_word = self._find_word(ref.value)
+        trans_word_idx, trans_word = self._find_word(trans.value)
+
+        # Skip line if both base and translation strings contain no words.
+        if not ref_word and not trans_word:
+            return
+
+        if ref_word and not trans_word:
+            report.warn(idx + 1, 'Translation contains no words starting with a letter, while original does.',
+                        trans.key)
+            return
+        if not ref_word and trans_word:
+            report.warn(idx + 1, 'Base string contains no words starting with a letter, but translation does.',
+                        trans.key)
+            return
+
+        ref_first_char = ref_word[0]
+        trans_first_char = trans_word[0]
+
+        if trans_first_char.isupper() != ref_first_char.isupper():
+            if ref_first_char.isupper():
+                expected = 'UPPER-cased'
+                found = 'lower-cased'
+            else:
+                expected = 'lower-cased'
+                found = 'UPPER-cased'
+
+            report.warn(idx + 1, f'Value starts with {found} character. Expected {expected}.', trans.key)
 
     @overrides(Check)
     def get_default_config(self) -> Dict:
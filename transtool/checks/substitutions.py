@@ -9,7 +9,7 @@
 """
 
 import re
-from typing import Dict, Optional
+from typing import Dict, Hashable, List, Optional, Pattern, Tuple
 
 from transtool.decorators.overrides import overrides
 from transtool.report.group import ReportGroup
@@ -29,37 +29,87 @@ class Substitutions(Check):
     FLAG_DEFAULT = 0
     FLAG_FAIL_WITH_ERROR = -1
 
+    report_title = 'Substitutions'
+
     def __init__(self, config: Optional[Dict] = None):
         super().__init__(config)
         self.is_single_file_check = True
+        self.is_item_check = True
+
+        # Built by prepare()
+        self._compiled_map: List[Tuple[Pattern, Dict]] = []
+        # Whole map compiled into single alternation, or None if map cannot be combined.
+        self._combined: Optional[Pattern] = None
+
+    def _is_error(self, config: Dict) -> bool:
+        return 'flag' in config and config['flag'] == self.FLAG_FAIL_WITH_ERROR
+
+    @overrides(Check)
+    def prepare(self) -> None:
+        super().prepare()
+        self._compiled_map = [(re.compile(config['regexp']), config) for config in self.config['map']]
+        self._prepare_combined()
+
+    def _prepare_combined(self) -> None:
+        """
+        Compiles all the map entries into single alternation pattern, so single scan of the string
+        tells if any entry matches at all. As most of the strings match nothing, this saves scanning
+        each string once per map entry. The combined pattern is used as pre-filter only, as matches of
+        the alternation can overlap and hide matches of other entries, which would change the issue
+        reported.
+
+        Map entries using back references cannot be safely combined (their group numbers change), so
+        if there's any such entry (or combined pattern fails to compile), per-entry patterns are used.
+        """
+        self._combined = None
+
+        back_reference = re.compile(r'\\[1-9]|\(\?P=')
+        if not self._compiled_map or any(back_reference.search(config['regexp']) for config in self.config['map']):
+            return
+
+        try:
+            self._combined = re.compile('|'.join(f'(?:{pattern.pattern})' for pattern, _ in self._compiled_map))
+        except re.error:
+            pass
 
     def _find_most_important_issue(self, idx: int, item: PropItem) -> Optional[ReportItem]:
-        warns = []
-        for config in self.config['map']:
-            for match in re.finditer(config['regexp'], item.value):
-                at = f'{idx + 1}:{match.start()}'
+        if self._combined is not None and self._combined.search(item.value) is None:
+            return None
+        return self._find_most_important_issue_per_entry(idx, item)
 
-                if 'flag' in config and config['flag'] == self.FLAG_FAIL_WITH_ERROR:
+    def _find_most_important_issue_per_entry(self, idx: int, item: PropItem) -> Optional[ReportItem]:
+        first_warn = None
+        for pattern, config in self._compiled_map:
+            for match in pattern.finditer(item.value):
+                at = f'{idx + 1}:{match.start() + 1}'
+
+                if self._is_error(config):
                     msg = f'Invalid sequence "{match.group(1)}".'
                     return ReportGroup.build_error(at, msg, item.key)
 
-                replacement = config['replace']
-                msg = f'Sequence at {at} can be replaced with "{replacement}".'
-                warns.append(ReportGroup.build_warn(at, msg, item.key))
+                if first_warn is None:
+                    replacement = config['replace']
+                    msg = f'Sequence at {at} can be replaced with "{replacement}".'
+                    first_warn = ReportGroup.build_warn(at, msg, item.key)
+                # Only errors matter from now on.
+                break
 
-        return warns[0] if (isinstance(warns, list) and warns) else None
+        return first_warn
 
     @overrides(Check)
     # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
     def check(self, translation: 'PropFile', reference: 'PropFile' = None) -> ReportGroup:
-        self.need_valid_config()
+        return self._check_all_items(translation, reference)
 
-        report = ReportGroup('Substitutions')
-        if translation.items:
-            report.add([self._find_most_important_issue(idx, item) for idx, item in enumerate(translation.items) if
-                        not self._shall_skip_item(item)])
+    @overrides(Check)
+    # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
+    def check_item(self, report: ReportGroup, idx: int, item: PropItem, reference: 'PropFile' = None) -> None:
+        if not self._shall_skip_item(item):
+            report.add(self._find_most_important_issue(idx, item))
 
-        return report
+    @overrides(Check)
+    def get_item_memo_key(self, item: PropItem) -> Optional[Hashable]:
+        return self._get_value_memo_key(item)
 
     @overrides(Check)
     def get_default_config(self) -> Dict:
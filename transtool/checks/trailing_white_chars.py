@@ -8,9 +8,10 @@
 #
 """
 
-from typing import Dict, Optional
+from typing import Dict, Hashable, Optional
 
 from transtool.decorators.overrides import overrides
+from transtool.prop.items import PropItem
 from transtool.report.group import ReportGroup
 from .base.check import Check
 
@@ -21,26 +22,30 @@ class TrailingWhiteChars(Check):
     Checks if file has trailing white characters at the end of each line.
     """
 
+    report_title = 'Trailing white characters'
+
     def __init__(self, config: Optional[Dict] = None):
         super().__init__(config)
         self.is_single_file_check = True
+        self.is_item_check = True
 
     @overrides(Check)
     # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
     def check(self, translation_file: 'PropFile', reference_file: 'PropFile' = None) -> ReportGroup:
-        self.need_valid_config()
-
-        report = ReportGroup('Trailing white characters')
+        return self._check_all_items(translation_file, reference_file)
 
-        for idx, item in enumerate(translation_file.items):
-            # Do not try to be clever and filter() data first, because line_number values will no longer be correct.
-            if self._shall_skip_item(item):
-                continue
-            diff_count = len(item.value) - len(item.value.rstrip())
-            if diff_count > 0:
-                report.create(idx + 1, f'Trailing white chars: {diff_count}.', item.key)
+    @overrides(Check)
+    # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
+    def check_item(self, report: ReportGroup, idx: int, item: PropItem, reference: 'PropFile' = None) -> None:
+        if self._shall_skip_item(item):
+            return
+        diff_count = len(item.value) - len(item.value.rstrip())
+        if diff_count > 0:
+            report.create(idx + 1, f'Trailing white chars: {diff_count}.', item.key)
 
-        return report
+    @overrides(Check)
+    def get_item_memo_key(self, item: PropItem) -> Optional[Hashable]:
+        return self._get_value_memo_key(item)
 
     @overrides(Check)
     def get_default_config(self) -> Dict:
@@ -11,7 +11,6 @@
 from typing import Dict, List, Optional
 
 from transtool.decorators.overrides import overrides
-from transtool.report.group import ReportGroup
 from .brackets import Brackets
 
 
@@ -26,7 +25,7 @@ class TypesettingQuotationMarks(Brackets):
         super().__init__(config)
         self.is_single_file_check = True
 
-    report_title = ReportGroup('Print Quotation Marks')
+    report_title = 'Print Quotation Marks'
 
     opening: List[str] = ['‘', '«', '„', '「', '《']
     closing: List[str] = ['’', '»', '“', '」', '》']
@@ -8,10 +8,10 @@
 #
 """
 
-from typing import Dict, Optional
+from typing import Dict, Hashable, Optional
 
 from transtool.decorators.overrides import overrides
-from transtool.prop.items import Translation
+from transtool.prop.items import PropItem, Translation
 from transtool.report.group import ReportGroup
 from .base.check import Check
 
@@ -21,9 +21,12 @@ class WhiteCharsBeforeLinefeed(Check):
     This check ensures there's no space before "\n", "\r" literals.
     """
 
+    report_title = 'White chars before linefeed literal'
+
     def __init__(self, config: Optional[Dict] = None):
         super().__init__(config)
         self.is_single_file_check = True
+        self.is_item_check = True
 
     def _scan(self, report: ReportGroup, idx: int, item: Translation, literal: str) -> bool:
         literal_len = len(literal)
@@ -41,25 +44,26 @@ class WhiteCharsBeforeLinefeed(Check):
     @overrides(Check)
     # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
     def check(self, translation_file: 'PropFile', reference_file: 'PropFile' = None) -> ReportGroup:
-        self.need_valid_config()
+        return self._check_all_items(translation_file, reference_file)
 
-        report = ReportGroup('White chars before linefeed literal')
+    @overrides(Check)
+    # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
+    def check_item(self, report: ReportGroup, idx: int, item: PropItem, reference: 'PropFile' = None) -> None:
+        if self._shall_skip_item(item):
+            return
 
-        for idx, item in enumerate(translation_file.items):
-            # Do not try to be clever and filter() data first, because line_number values will no longer be correct.
-            if self._shall_skip_item(item):
+        for literal in (r'\n', r'\r'):
+            # Skip too short lines.
+            literal_len = len(literal)
+            if len(item.value.strip()) <= literal_len:
                 continue
 
-            for literal in (r'\n', r'\r'):
-                # Skip too short lines.
-                literal_len = len(literal)
-                if len(item.value.strip()) <= literal_len:
-                    continue
+            if self._scan(report, idx, item, literal):
+                break
 
-                if self._scan(report, idx, item, literal):
-                    break
-
-        return report
+    @overrides(Check)
+    def get_item_memo_key(self, item: PropItem) -> Optional[Hashable]:
+        return self._get_value_memo_key(item)
 
     @overrides(Check)
     def get_default_config(self) -> Dict:
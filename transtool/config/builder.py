@@ -117,7 +117,7 @@ class ConfigBuilder(object):
         :param config: Config object to validate.
         """
         if config.languages:
-            pattern = re.compile(r'^[a-z]{2,}$')
+            pattern = re.compile(Config.LANGUAGE_REGEXP)
             for lang in config.languages:
                 if not pattern.match(lang):
                     ConfigBuilder._abort(f'Invalid language: "{lang}".')
@@ -128,6 +128,37 @@ class ConfigBuilder(object):
         if config.comment_marker not in Config.ALLOWED_COMMENT_MARKERS:
             ConfigBuilder._abort('Invalid comment marker.')
 
+        if config.line_ending not in Config.LINE_ENDINGS:
+            ConfigBuilder._abort(f'Invalid line ending. Must be one of: {", ".join(Config.LINE_ENDINGS)}')
+
+        if config.report_format not in Config.REPORT_FORMATS:
+            ConfigBuilder._abort(f'Invalid report format. Must be one of: {", ".join(Config.REPORT_FORMATS)}')
+
+        if config.report_limit < 0:
+            ConfigBuilder._abort('Report limit cannot be negative.')
+
+        if config.watch and config.write:
+            # Written files would be seen as changed, over and over again.
+            ConfigBuilder._abort('Watch mode cannot be used with --write.')
+
+        if config.watch:
+            # Watch mode checks files sequentially and only reports issues as text, as they are found.
+            if config.jobs != 1:
+                ConfigBuilder._abort('Watch mode cannot be used with --jobs.')
+            if config.report_file:
+                ConfigBuilder._abort('Watch mode cannot be used with --report-file.')
+            if config.profile:
+                ConfigBuilder._abort('Watch mode cannot be used with --profile.')
+
+        if config.watch_interval <= 0:
+            ConfigBuilder._abort('Watch interval must be positive.')
+
+        if config.jobs < 0:
+            ConfigBuilder._abort('Number of jobs cannot be negative.')
+
+        if config.memo_size < 1:
+            ConfigBuilder._abort('Memo size must be positive.')
+
     @staticmethod
     def _set_on_off_option(config: Config, args, option_name: str) -> None:
         """
@@ -171,12 +202,52 @@ class ConfigBuilder(object):
             'quiet',
             'verbose',
             'file_suffix',
+            'line_ending',
+            'jobs',
         ]
         for option_name in optionals:
             opt_val = args.__getattribute__(option_name)
             if opt_val is not None:
                 config.__setattr__(option_name, opt_val)
 
+        if args.languages_auto:
+            config.languages_auto = True
+        if args.mmap:
+            config.mmap = True
+        if args.columnar:
+            config.columnar = True
+        if args.cache_dir is not None:
+            config.cache_dir = args.cache_dir
+        if args.cache:
+            config.cache = True
+        if args.incremental:
+            config.incremental = True
+        if args.async_io:
+            config.async_io = True
+        if args.memo_size is not None:
+            config.memo_size = args.memo_size
+        if args.memo_file is not None:
+            config.memo_file = args.memo_file
+        if args.memo:
+            config.memo = True
+        if args.profile_file is not None:
+            config.profile_file = args.profile_file
+        if args.profile:
+            config.profile = True
+        if args.report_file is not None:
+            config.report_file = args.report_file
+        if args.report_format is not None:
+            config.report_format = args.report_format
+        if args.report_limit is not None:
+            config.report_limit = args.report_limit
+        if args.watch_interval is not None:
+            config.watch_interval = args.watch_interval
+        if args.watch:
+            config.watch = True
+        for option_name, implied_option_name in Config.IMPLIED_OPTIONS.items():
+            if args.__getattribute__(option_name) is not None:
+                config.__setattr__(implied_option_name, True)
+
         # languages
         if args.languages:
             for lang in args.languages:
@@ -191,6 +262,8 @@ class ConfigBuilder(object):
         if args.files:
             ConfigBuilder._add_file_suffix(config, args.files)
             Utils.add_if_not_in_list(config.files, args.files)
+        if args.projects:
+            Utils.add_if_not_in_list(config.projects, args.projects)
 
     @staticmethod
     def _get_checkers_from_args(config: Config, args_checkers: Optional[List[str]]) -> None:
@@ -252,11 +325,15 @@ class ConfigBuilder(object):
                            help='Print config as seen by the app once config file and args are parsed.')
         group.add_argument('-b', '--base', action='store', dest='files', nargs='+', metavar='FILE',
                            help='List of base files to check.')
+        group.add_argument('-p', '--project', action='store', dest='projects', nargs='+', metavar='DIR',
+                           help='Checks all base files found in given directory trees (i.e. "src/main/resources").')
         group.add_argument('-l', '--lang', action='store', dest='languages', nargs='+', metavar='LANG',
                            help='List of languages to check (space or comma separated if more than one, i.e. "de pl").')
         group.add_argument('-ls', '--lang-skip', action='store', dest='languages_skip', nargs='+', metavar='LANG',
                            help='List of languages to ignore. This overrides languages provided by `--lang` '
                                 + ' (which can be sourced from application config file).')
+        group.add_argument('-la', '--lang-auto', action='store_true', dest='languages_auto',
+                           help='If no languages are specified, checks all translations found next to each base file.')
 
         group = parser.add_argument_group('Additional options')
         group.add_argument('-w', '--write', action='store_true', dest='write',
@@ -273,6 +350,8 @@ class ConfigBuilder(object):
                                 + f'Must be one of the following: {", ".join(Config.ALLOWED_COMMENT_MARKERS)}')
         group.add_argument('--suffix', action='store', dest='file_suffix', metavar='STRING', nargs=1,
                            help=f'Default file name suffix. Default: "{Config.DEFAULT_FILE_SUFFIX}".')
+        group.add_argument('--line-ending', action='store', dest='line_ending', choices=list(Config.LINE_ENDINGS),
+                           help='Line ending of written files. Default: "lf".')
 
         group = parser.add_argument_group('Checks controlling options')
         group.add_argument('--checks', action='store', dest='checkers', nargs='+', metavar='CHECK_ID',
@@ -290,6 +369,49 @@ class ConfigBuilder(object):
                            help='Produces more verbose reports.')
         group.add_argument('-d', '--debug', action='store_true', dest='debug',
                            help='Enables debug output.')
+        group.add_argument('-j', '--jobs', action='store', dest='jobs', type=int, metavar='N',
+                           help='Number of worker processes used to check translations in parallel. '
+                                + 'Use 0 to match number of CPU cores. Default: 1 (no parallelism).')
+        group.add_argument('--mmap', action='store_true', dest='mmap',
+                           help='Uses memory mapped files to load *.properties files. Lowers memory usage '
+                                + 'and number of system calls while loading large files.')
+        group.add_argument('--columnar', action='store_true', dest='columnar',
+                           help='Keeps loaded items in compact, columnar storage instead of separate objects. '
+                                + 'Lowers memory usage with large files at the cost of slower checks.')
+        group.add_argument('--cache', action='store_true', dest='cache',
+                           help='Caches parsed files on disk, so unchanged files are not parsed again on next run.')
+        group.add_argument('--cache-dir', action='store', dest='cache_dir', metavar='DIR',
+                           help='Directory to keep parse cache and incremental state in. Implies --cache. '
+                                + f'Default: "{Config.DEFAULT_CACHE_DIR}".')
+        group.add_argument('--incremental', action='store_true', dest='incremental',
+                           help='Keeps results of each run in cache directory and re-checks only keys changed since.')
+        group.add_argument('--async-io', action='store_true', dest='async_io',
+                           help='Reads next translation file while current one is checked, and writes files in the '
+                                + 'background. Helps with slow (i.e. network) filesystems.')
+        group.add_argument('--memo', action='store_true', dest='memo',
+                           help='Remembers values that passed per-item checks, so values repeated across keys, '
+                                + 'files and languages are checked once only.')
+        group.add_argument('--memo-size', action='store', dest='memo_size', type=int, metavar='N',
+                           help=f'Max number of remembered check outcomes. Default: {Config.DEFAULT_MEMO_SIZE}.')
+        group.add_argument('--memo-file', action='store', dest='memo_file', metavar='FILE',
+                           help='File to persist remembered check outcomes in, to reuse them in next runs. Implies --memo.')
+        group.add_argument('--profile', action='store_true', dest='profile',
+                           help='Prints time spent loading, checking, updating and saving files, per checker and per file.')
+        group.add_argument('--profile-file', action='store', dest='profile_file', metavar='FILE',
+                           help='Writes collected timings to given file as JSON. Implies --profile.')
+        group.add_argument('--report-file', action='store', dest='report_file', metavar='FILE',
+                           help='Writes found issues to given file in machine-readable format. Use "-" for standard output.')
+        group.add_argument('--report-format', action='store', dest='report_format', choices=Config.REPORT_FORMATS,
+                           help='Format of --report-file: "jsonl" (JSON Lines) or "sarif" (SARIF v2.1.0). Default: "jsonl".')
+        group.add_argument('--report-limit', action='store', dest='report_limit', type=int, metavar='N',
+                           help='Max number of issues reported by each check per file. Remaining issues are counted only. '
+                                + 'Default: 0 (no limit).')
+        group.add_argument('--watch', action='store_true', dest='watch',
+                           help='Keeps running, re-checking files as they change. Checkers and loaded files are kept in memory, '
+                                + 'so only changed files are loaded and checked again.')
+        group.add_argument('--watch-interval', action='store', dest='watch_interval', type=float, metavar='SECONDS',
+                           help='Seconds between checks for changed files in watch mode. Implies --watch. '
+                                + f'Default: {Config.DEFAULT_WATCH_INTERVAL}.')
 
         group.add_argument('-c', '--color', action='store_true', dest='color',
                            help='Enables use of ANSI colors (default).')
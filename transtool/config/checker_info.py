@@ -16,3 +16,28 @@ class CheckerInfo(object):
         self.id = checker_id
         self.callable = checker_callable
         self.config = config
+
+        # Checker instance shared by all the checked files.
+        self._checker = None
+
+    # Do NOT "fix" the Check reference and do not import it, or you step on circular dependency!
+    def prepare(self) -> 'Check':
+        """
+        Creates checker instance (once) and lets it build its config derived state, so the same
+        instance can then be used to check all the files.
+
+        :return: Prepared checker instance.
+        """
+        if self._checker is None:
+            self._checker = self.callable(self.config)
+        self._checker.need_prepared()
+        return self._checker
+
+    @property
+    def checker(self) -> 'Check':
+        """
+        Returns checker instance shared by all the checked files, creating and preparing it if needed.
+        """
+        if self._checker is None:
+            return self.prepare()
+        return self._checker
@@ -8,7 +8,7 @@
 #
 """
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 from simplelog.config import Config as SimpleLogConfig
 
 from transtool.config.checker_info import CheckerInfo
@@ -19,7 +19,25 @@ class Config(SimpleLogConfig):
 
     ALLOWED_SEPARATORS: List[str] = ['=', ':']
     ALLOWED_COMMENT_MARKERS: List[str] = ['#', '!']
+    # Line endings of written files.
+    LINE_ENDINGS: Dict[str, str] = {'lf': '\n', 'crlf': '\r\n'}
     DEFAULT_FILE_SUFFIX: str = '.properties'
+    # Valid language code, also used to tell translation files from base files (see FileIndex).
+    LANGUAGE_REGEXP: str = r'^[a-z]{2,}$'
+    DEFAULT_CACHE_DIR: str = '.transtool-cache'
+    DEFAULT_MEMO_SIZE: int = 100000
+    # Seconds between checks for changed files in watch mode.
+    DEFAULT_WATCH_INTERVAL: float = 0.5
+    # Supported formats of machine-readable report (see ReportWriter).
+    REPORT_FORMATS: List[str] = ['jsonl', 'sarif']
+    # Options turning other option on when set, i.e. setting cache directory enables cache.
+    # Applied the same way to command line arguments and config file options.
+    IMPLIED_OPTIONS: Dict[str, str] = {
+        'cache_dir': 'cache',
+        'memo_file': 'memo',
+        'profile_file': 'profile',
+        'watch_interval': 'watch',
+    }
 
     # COM: comment marker
     # KEY: translation key
@@ -55,11 +73,50 @@ class Config(SimpleLogConfig):
         self.write_reference: bool = False
 
         self.files: List[str] = []
+        # Directories to look for base files in (see Discovery).
+        self.projects: List[str] = []
         self.languages: List[str] = []
         self.languages_skip: List[str] = []
+        # If no languages are given, check all the translations found next to the base file.
+        self.languages_auto: bool = False
+
+        # Number of worker processes used to check translations. 0 means "as many as CPU cores".
+        self.jobs: int = 1
+        # Use memory mapped files while loading *.properties files.
+        self.mmap: bool = False
+        # Keep loaded items in columnar storage instead of list of objects.
+        self.columnar: bool = False
+        # Cache parsed files on disk, so unchanged files are not parsed again on next run.
+        self.cache: bool = False
+        self.cache_dir: str = Config.DEFAULT_CACHE_DIR
+        # Keep results of previous run (in cache_dir) and re-check changed keys only.
+        self.incremental: bool = False
+        # Read translation files ahead and write files in the background.
+        self.async_io: bool = False
+        # Remember values that passed per-item checks, so repeated values are not checked again.
+        self.memo: bool = False
+        # Max number of remembered outcomes.
+        self.memo_size: int = Config.DEFAULT_MEMO_SIZE
+        # Optional file to persist remembered outcomes in, to be reused by subsequent runs.
+        self.memo_file: Optional[str] = None
+        # Print time spent loading, checking, updating and saving files, per checker and per file.
+        self.profile: bool = False
+        # Optional file to write collected timings to (as JSON).
+        self.profile_file: Optional[str] = None
+        # Optional file to write found issues to, in machine-readable format. "-" means standard output.
+        self.report_file: Optional[str] = None
+        # Format of report_file. One of REPORT_FORMATS.
+        self.report_format: str = 'jsonl'
+        # Max number of issues kept in each report group, others are counted only. 0 means no limit.
+        self.report_limit: int = 0
+        # Keep running and re-check files as they change.
+        self.watch: bool = False
+        self.watch_interval: float = Config.DEFAULT_WATCH_INTERVAL
 
         self.separator: str = '='
         self.comment_marker: str = '#'
+        # Line ending of written files. One of LINE_ENDINGS keys.
+        self.line_ending: str = 'lf'
 
         self.checks: Dict[str, CheckerInfo] = {
             # empty set. Populated and manipulated by ConfigBuilder.
@@ -10,7 +10,7 @@
 
 from configparser import ConfigParser
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Callable, Dict, List
 
 from transtool.config.config import Config
 from transtool.utils import Utils
@@ -68,7 +68,40 @@ class ConfigReader(object):
             if self.parser.has_option(main_section, single_bool):
                 config.__setattr__(single_bool, self.parser.get(main_section, single_bool))
 
+        # Option name -> method used to read its value.
+        typed_opts: Dict[str, Callable[[str, str], Any]] = {
+            'languages_auto': self.parser.getboolean,
+            'line_ending': self._get_choice,
+            'jobs': self.parser.getint,
+            'mmap': self.parser.getboolean,
+            'columnar': self.parser.getboolean,
+            'cache': self.parser.getboolean,
+            'cache_dir': self.parser.get,
+            'incremental': self.parser.getboolean,
+            'async_io': self.parser.getboolean,
+            'memo': self.parser.getboolean,
+            'memo_size': self.parser.getint,
+            'memo_file': self.parser.get,
+            'profile': self.parser.getboolean,
+            'profile_file': self.parser.get,
+            'report_file': self.parser.get,
+            'report_format': self._get_choice,
+            'report_limit': self.parser.getint,
+            'watch': self.parser.getboolean,
+            'watch_interval': self.parser.getfloat,
+        }
+        for option_name, getter in typed_opts.items():
+            if self.parser.has_option(main_section, option_name):
+                config.__setattr__(option_name, getter(main_section, option_name))
+        for option_name, implied_option_name in Config.IMPLIED_OPTIONS.items():
+            # Explicitly set value of implied option takes precedence.
+            if self.parser.has_option(main_section, implied_option_name):
+                continue
+            if self.parser.has_option(main_section, option_name):
+                config.__setattr__(implied_option_name, True)
+
         self._merge_if_exists(self.parser, config.files, main_section, 'files')
+        self._merge_if_exists(self.parser, config.projects, main_section, 'projects')
         self._merge_if_exists(self.parser, config.languages, main_section, 'languages')
         self._merge_if_exists(self.parser, config.checks, main_section, 'checks')
 
@@ -87,6 +120,9 @@ class ConfigReader(object):
 
     # #################################################################################################
 
+    def _get_choice(self, section: str, option: str) -> str:
+        return Utils.remove_quotes(self.parser.get(section, option)).lower()
+
     def _merge_if_exists(self, parser: ConfigParser, target_list: List[str], config_section: str,
                          config_option: str) -> None:
         if parser.has_option(config_section, config_option):
@@ -8,13 +8,29 @@
 #
 """
 
-import copy
+import os
 import sys
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import nullcontext, redirect_stdout
+from functools import partial
 from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, TextIO, Tuple
 
+from transtool.checks.base.engine import CheckEngine
+from transtool.checks.base.incremental import IncrementalEngine
+from transtool.checks.base.memo import ResultMemo
 from transtool.config.builder import ConfigBuilder
 from transtool.config.config import Config
+from transtool.profiler import Profiler
+from transtool.prop.discovery import Discovery, FileIndex
 from transtool.prop.file import PropFile
+from transtool.prop.pipeline import IoPipeline
+from transtool.prop.view import PropFileView
+from transtool.prop.watcher import FileWatcher
+from transtool.report.group import ReportGroup
+from transtool.report.report import Report
+from transtool.report.writer import ReportWriter
 from .const import Const
 from simplelog.log import Log
 from .utils import Utils
@@ -36,60 +52,138 @@ class TransTool(object):
         ConfigBuilder.build(config)
         # Reconfigure once we got user settings handled.
         Log.configure(config)
+        ReportGroup.configure(config)
 
         if '--config-dump' in sys.argv:
             config.dump()
             return 0
 
+        if config.report_file == ReportWriter.STDOUT:
+            # Report is written to standard output, so any other output goes to standard error, not to mix with it.
+            report_target = sys.stdout
+            with redirect_stdout(sys.stderr):
+                return TransTool._run(config, report_target)
+        return TransTool._run(config)
+
+    @staticmethod
+    def _run(config: Config, report_target: Optional[TextIO] = None) -> int:
+        """
+        Checks (and optionally writes) all the files as configured.
+
+        :param config: Application config.
+        :param report_target: Stream to use as standard output for --report-file, or None to use sys.stdout.
+        :return: Application return code.
+        """
+        # Directories listed while looking for base files are not listed again while looking for translations.
+        index = FileIndex(config.file_suffix)
+        for project_dir in config.projects:
+            try:
+                base_files = Discovery.find_base_files(Path(project_dir), config.file_suffix, index)
+            except NotADirectoryError as project_ex:
+                Log.e(str(project_ex))
+                return 200  # noqa: WPS432
+            Utils.add_if_not_in_list(config.files, [str(base_file) for base_file in base_files])
+
         if not config.files:
             Log.e('No base file(s) specified.')
             return 200  # noqa: WPS432
 
+        # Create checkers once. The same instances are used to check all the files.
+        for checker_info in config.checks.values():
+            checker_info.prepare()
+
+        if config.watch:
+            return TransTool._watch(config, index)
+
+        profiler = Profiler.enable() if config.profile else None
+        executor = TransTool._get_executor(config)
+        try:
+            return TransTool._process_files(config, executor, index, report_target)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            memo = ResultMemo.get_shared(config)
+            if memo is not None and config.memo_file:
+                memo.save(Path(config.memo_file))
+            if profiler is not None:
+                Profiler.disable()
+                profiler.dump()
+                if config.profile_file:
+                    profiler.save(Path(config.profile_file))
+
+    @staticmethod
+    def _process_files(config: Config, executor: Optional[ProcessPoolExecutor], index: Optional[FileIndex] = None,
+                       report_target: Optional[TextIO] = None) -> int:
+        """
+        Validates (and optionally writes) all the configured base files and their translations.
+        When run with process pool, checks of translations of all the base files are scheduled
+        upfront, so workers are kept busy while results are consumed, one base file after another.
+
+        :param config: Application config.
+        :param executor: Process pool to run translation checks in or None to run everything in current process.
+        :param index: Index of translation files present on disk. New one is created if not given.
+        :param report_target: Stream to use as standard output for --report-file, or None to use sys.stdout.
+        :return: Application return code.
+        """
+        if index is None:
+            index = FileIndex(config.file_suffix)
+        writer = None
+        if config.report_file:
+            writer = ReportWriter.create(config.report_format, config.report_file, config.fatal, report_target)
+        # Scheduled writes are all completed once we leave the block.
+        with IoPipeline() if config.async_io else nullcontext() as pipeline, writer or nullcontext():
+            return TransTool._process_jobs(config, executor, index, pipeline, writer)
+
+    @staticmethod
+    def _process_jobs(config: Config, executor: Optional[ProcessPoolExecutor], index: FileIndex,
+                      pipeline: Optional[IoPipeline], writer: Optional[ReportWriter] = None) -> int:
+        """
+        Implementation of _process_files().
+
+        :param config: Application config.
+        :param executor: Process pool to run translation checks in or None to run everything in current process.
+        :param index: Index of translation files present on disk.
+        :param pipeline: IoPipeline to prefetch translation files and write files with, or None.
+        :param writer: ReportWriter to write found issues with, or None.
+        :return: Application return code.
+        """
+        jobs: Iterable[BaseFileJob] = (TransTool._schedule_base_file(config, executor, index, Path(file_str))
+                                       for file_str in config.files)
+        if executor is not None:
+            jobs = list(jobs)
+
         errors = 0
-        for file_str in config.files:
-            reference_path = Path(file_str)
+        for job in jobs:
+            reference_path = job.reference_path
 
-            tmp = Path(reference_path).name.split('.')
-            if len(tmp) != 2:
+            if len(reference_path.name.split('.')) != 2:
                 Log.e('Base filename format invalid. Must be "prefix.suffix".')
+                TransTool._cancel_jobs(jobs)
                 Utils.abort()
-            name_prefix = tmp[0]
-            name_suffix = tmp[1]
 
             # Main push
             Log.push(f'Base: {reference_path}')
 
-            reference = PropFile(config)
-            try:
-                reference.load(reference_path)
-            except (FileNotFoundError, SyntaxError) as load_base_ex:
-                Log.e(str(load_base_ex))
+            if job.load_error is not None:
+                Log.e(str(job.load_error))
+                TransTool._cancel_jobs(jobs)
                 Utils.abort()
 
-            # Validate base file.
-            checks_executed = 0
-            for _, checker_info in config.checks.items():
-                # Almost any check validates translation against reference file, so we cannot use all checks here,
-                # but there are some that process single file independently so they in fact do not need any reference
-                # file. For them we pass our base file as translation which will do the trick.
-                checker = checker_info.callable(checker_info.config)
-                if checker.is_single_file_check:
-                    # Each validator gets copy of the files, to prevent any potential destructive operation.
-                    reference_copy = copy.copy(reference)
-                    reference.report.add(checker.check(reference_copy))
-                    checks_executed += 1
-
+            reference = job.reference
+            if writer is not None:
+                writer.write_report(reference_path, None, reference.report)
             if reference.report.not_empty():
                 # There's something to fix, but not necessary critical.
                 reference.report.dump()
             else:
-                Log.v(f'Checks passed: {checks_executed}.')
+                Log.v(f'Checks passed: {job.checks_executed}.')
 
             # No reference files errors. Warnings are just fine, though.
-            for lang in config.languages:
-                translation_path = Path(reference_path.parent / f'{name_prefix}_{lang}.{name_suffix}')
-                translation = PropFile(config)
-
+            pending = job.pending
+            # Translations read in the background, while preceding ones are being checked.
+            prefetched: Dict[str, Future] = {}
+            for lang in job.languages:
+                translation_path = TransTool._get_translation_path(reference_path, lang)
                 trans_level_label = f'{lang.upper()}: {translation_path}'
 
                 if lang in config.languages_skip:
@@ -99,27 +193,43 @@ class TransTool(object):
                 Log.push(trans_level_label, deferred=True)
 
                 try:
-                    translation.load(translation_path, lang)
-                    # Validate loaded translation file and report any issue detected.
-                    if not translation.validate(reference):
+                    if lang not in job.translations:
+                        # Known to be missing, so no need to even try to load it.
+                        raise FileNotFoundError(f'File not found: {translation_path}')
+                    if executor is not None:
+                        translation = TransTool._get_result(pending.pop(lang))
+                    else:
+                        content = None
+                        if pipeline is not None:
+                            TransTool._prefetch(pipeline, config, job, lang, prefetched)
+                            content = prefetched.pop(lang).result()
+                        translation = TransTool._load_and_validate(config, job.reference_view, translation_path, lang,
+                                                                   content)
+
+                    # Report any issue detected in loaded translation file.
+                    if writer is not None:
+                        writer.write_report(translation_path, lang, translation.report)
+                    if translation.report.not_empty():
                         translation.report.dump()
                         errors += translation.report.errors
 
                     if config.write:
                         translation.update(reference)
-                        translation.save()
+                        translation.save(pipeline=pipeline)
 
                 except SyntaxError as load_trans_ex:
                     # We need to stop when loading failed due to syntax error
                     Log.e(str(load_trans_ex))
+                    TransTool._cancel_jobs(jobs)
                     return Const.RC.TRANSLATION_SYNTAX_ERROR
 
                 except FileNotFoundError:
                     # Missing translation file is not a big deal.
                     if config.write:
+                        translation = PropFile(config)
                         translation.update(reference)
                         Log.push('Creating new translation file')
-                        translation.save(translation_path)
+                        translation.save(translation_path, pipeline)
                         Log.pop()
                     else:
                         Log.e(f'File not found: {translation_path}')
@@ -127,8 +237,374 @@ class TransTool(object):
                 if Log.pop():
                     Log.i(f'%ok%{trans_level_label}: OK')
 
-        # Close main push.
-        Log.pop()
+            # Close main push.
+            Log.pop()
 
         # Done.
         return 100 if errors else 0
+
+    @staticmethod
+    def _watch(config: Config, index: FileIndex, max_cycles: Optional[int] = None) -> int:
+        """
+        Checks all the files, then keeps watching them and re-checks files that changed, until interrupted.
+        Checkers and loaded files are kept in memory, so only changed files are loaded again. If base file
+        changes, all its translations are checked again. Base files are the ones known at start.
+
+        :param config: Application config.
+        :param index: Index of translation files present on disk. Updated on each change.
+        :param max_cycles: Max number of polls to do. None means no limit (used by tests).
+        :return: Application return code, reflecting errors in all the watched files as of the last check.
+        """
+        base_files = [Path(file_str) for file_str in config.files]
+        watcher = FileWatcher([base_file.parent for base_file in base_files], config.file_suffix)
+        session = WatchSession()
+
+        rc = 0
+        cycles = 0
+        try:
+            rc = TransTool._check_changes(config, index, watcher, session, base_files)
+            Log.i('Watching for changes. Press Ctrl+C to quit.')
+            while max_cycles is None or cycles < max_cycles:
+                cycles += 1
+                time.sleep(config.watch_interval)
+                changed = watcher.poll()
+                if changed:
+                    Log.i(f'Changed: {", ".join(str(file) for file in sorted(changed))}')
+                    rc = TransTool._check_changes(config, index, watcher, session, base_files, changed)
+        except KeyboardInterrupt:
+            pass
+        return rc
+
+    @staticmethod
+    def _check_changes(config: Config, index: FileIndex, watcher: FileWatcher, session: 'WatchSession',
+                       base_files: List[Path], changed: Optional[Set[Path]] = None) -> int:
+        """
+        Validates files affected by given changes. Unlike _process_jobs(), problems with any of the files
+        are reported but do not stop the processing, as the files are likely being edited.
+
+        :param config: Application config.
+        :param index: Index of translation files present on disk.
+        :param watcher: FileWatcher that detected the changes.
+        :param session: Files loaded so far. Updated in place.
+        :param base_files: Base files to check.
+        :param changed: Files changed since previous check or None to check all the files.
+        :return: Application return code. Errors found in files not checked this time (as they did not
+                 change) are taken into account too.
+        """
+        for directory, file_names in watcher.file_names.items():
+            index.add_dir(directory, file_names)
+
+        for reference_path in base_files:
+            base_changed = changed is None or reference_path in changed or reference_path not in session.jobs
+            if base_changed:
+                job = TransTool._schedule_base_file(config, None, index, reference_path)
+                session.jobs[reference_path] = job
+                # All the translations are checked again (if possible), so earlier results no longer apply.
+                session.errors = {key: errors for key, errors in session.errors.items() if key[0] != reference_path}
+            else:
+                job = session.jobs[reference_path]
+                # Translations could have been added or removed.
+                job.translations = index.get_translations(reference_path)
+                if config.languages_auto and not config.languages:
+                    job.languages = list(job.translations)
+
+            languages = [lang for lang in job.languages
+                         if base_changed or TransTool._get_translation_path(reference_path, lang) in changed]
+            if not (base_changed or languages):
+                continue
+
+            if job.reference is None and not base_changed:
+                # Base file is still broken, so there's nothing to check translations against.
+                continue
+
+            Log.push(f'Base: {reference_path}')
+            if job.reference is None:
+                if len(reference_path.name.split('.')) != 2:
+                    Log.e('Base filename format invalid. Must be "prefix.suffix".')
+                else:
+                    Log.e(str(job.load_error))
+                session.errors[(reference_path, None)] = 1
+                Log.pop()
+                continue
+            if base_changed and job.reference.report.not_empty():
+                job.reference.report.dump()
+
+            for lang in languages:
+                if lang in config.languages_skip:
+                    continue
+                session.errors[(reference_path, lang)] = TransTool._check_translation(config, session, job, lang)
+            Log.pop()
+
+        return 100 if sum(session.errors.values()) else 0
+
+    @staticmethod
+    def _check_translation(config: Config, session: 'WatchSession', job: 'BaseFileJob', lang: str) -> int:
+        """
+        Validates translation of given language against (possibly changed) base file of the job.
+        Translation is loaded again only if it's not loaded yet or its file changed since it was loaded.
+
+        :param config: Application config.
+        :param session: Files loaded so far. Updated in place.
+        :param job: Base file job.
+        :param lang: Language of the translation.
+        :return: Number of errors found.
+        """
+        translation_path = TransTool._get_translation_path(job.reference_path, lang)
+        trans_level_label = f'{lang.upper()}: {translation_path}'
+        Log.push(trans_level_label, deferred=True)
+        errors = 0
+        try:
+            if lang not in job.translations:
+                session.translations.pop(translation_path, None)
+                raise FileNotFoundError(translation_path)
+
+            stamp = translation_path.stat().st_mtime_ns
+            loaded = session.translations.get(translation_path)
+            if loaded is None or loaded[0] != stamp:
+                translation = PropFile(config)
+                translation.load(translation_path, lang)
+                # Issues found while loading (i.e. duplicated keys), to be reported along with each validation.
+                loaded = (stamp, translation, translation.report)
+                session.translations[translation_path] = loaded
+            _, translation, load_report = loaded
+
+            translation.report = Report(config)
+            translation.report.merge(load_report)
+            translation.validate(job.reference_view)
+            if translation.report.not_empty():
+                translation.report.dump()
+                errors += translation.report.errors
+        except SyntaxError as load_trans_ex:
+            Log.e(str(load_trans_ex))
+            errors += 1
+        except FileNotFoundError:
+            # Missing translation file is not a big deal, same as in regular run. The file could also
+            # have been removed right before being loaded.
+            session.translations.pop(translation_path, None)
+            Log.e(f'File not found: {translation_path}')
+
+        if Log.pop():
+            Log.i(f'%ok%{trans_level_label}: OK')
+        return errors
+
+    @staticmethod
+    def _schedule_base_file(config: Config, executor: Optional[ProcessPoolExecutor], index: FileIndex,
+                            reference_path: Path) -> 'BaseFileJob':
+        """
+        Loads and validates given base file, then schedules checks of its translations in the process pool
+        (if there's any). This method does not produce any output on its own. Any problem with loading
+        the base file is recorded in returned job, to be reported once the job's turn comes.
+
+        :param config: Application config.
+        :param executor: Process pool to use or None.
+        :param index: Index of translation files present on disk.
+        :param reference_path: Path to base file.
+        """
+        job = BaseFileJob(reference_path)
+        if len(reference_path.name.split('.')) != 2:
+            # Will be reported while processing the job.
+            return job
+
+        job.translations = index.get_translations(reference_path)
+        if config.languages:
+            job.languages = config.languages
+        elif config.languages_auto:
+            job.languages = list(job.translations)
+
+        reference = PropFile(config)
+        try:
+            reference.load(reference_path)
+        except (FileNotFoundError, SyntaxError) as load_base_ex:
+            job.load_error = load_base_ex
+            return job
+
+        # Validate base file.
+        # Almost any check validates translation against reference file, so we cannot use all checks here,
+        # but there are some that process single file independently so they in fact do not need any reference
+        # file. For them we pass our base file as translation which will do the trick.
+        checkers = {checker_id: checker_info.checker for checker_id, checker_info in config.checks.items()
+                    if checker_info.checker.is_single_file_check}
+        # Checkers get read-only view of the file, to prevent any potential destructive operation.
+        # The same view is used to validate all the translations.
+        reference_view = reference.view()
+        if config.incremental:
+            state_file = IncrementalEngine.get_state_file(Path(config.cache_dir), reference_path)
+            results = IncrementalEngine(checkers).run_with_state(state_file, reference_view)
+        else:
+            results = CheckEngine(list(checkers.values()), ResultMemo.get_shared(config)).run(reference_view)
+        reference.add_results(checkers, results)
+
+        job.reference = reference
+        job.reference_view = reference_view
+        job.checks_executed = len(checkers)
+
+        languages = [lang for lang in job.languages if lang not in config.languages_skip and lang in job.translations]
+        job.pending = TransTool._submit_translations(executor, config, reference_view, reference_path, languages)
+        return job
+
+    @staticmethod
+    def _prefetch(pipeline: IoPipeline, config: Config, job: 'BaseFileJob', lang: str,
+                  prefetched: Dict[str, Future]) -> None:
+        """
+        Ensures translation of given language and the one to be loaded next are being read in the background.
+
+        :param pipeline: IoPipeline to read the files with.
+        :param config: Application config.
+        :param job: Base file job the translations belong to.
+        :param lang: Language of translation about to be loaded.
+        :param prefetched: Reads scheduled so far, keyed by language code. Updated in place.
+        """
+        languages = [job_lang for job_lang in job.languages
+                     if job_lang in job.translations and job_lang not in config.languages_skip]
+        lang_idx = languages.index(lang)
+        for prefetch_lang in languages[lang_idx:lang_idx + 2]:
+            if prefetch_lang not in prefetched:
+                prefetched[prefetch_lang] = pipeline.read(job.translations[prefetch_lang])
+
+    @staticmethod
+    def _cancel_jobs(jobs: Iterable['BaseFileJob']) -> None:
+        """
+        Cancels all the scheduled translation checks that did not start yet. Used when we are about to quit early.
+
+        :param jobs: Base file jobs. Only jobs already scheduled are affected.
+        """
+        # Jobs are scheduled lazily in sequential mode, so there's nothing pending. Do not iterate the
+        # generator then, or remaining base files would get loaded.
+        if isinstance(jobs, list):
+            for job in jobs:
+                TransTool._cancel_pending(job.pending)
+
+    @staticmethod
+    def _get_executor(config: Config) -> Optional[ProcessPoolExecutor]:
+        """
+        Returns process pool to run translation checks in, or None if checks are to be done sequentially.
+
+        :param config: Application config.
+        """
+        jobs = config.jobs if config.jobs > 0 else (os.cpu_count() or 1)
+        if jobs == 1:
+            return None
+        return ProcessPoolExecutor(max_workers=jobs)
+
+    @staticmethod
+    def _cancel_pending(pending: Dict[str, Future]) -> None:
+        """
+        Cancels all the translation checks that did not start yet. Used when we are about to quit early.
+
+        :param pending: Futures of translation checks whose results were not consumed yet.
+        """
+        for future in pending.values():
+            future.cancel()
+
+    @staticmethod
+    def _get_translation_path(reference_path: Path, lang: str) -> Path:
+        """
+        Returns path to the translation file of given language for given base file.
+
+        :param reference_path: Path to base file.
+        :param lang: Language code.
+        """
+        name_prefix, name_suffix = reference_path.name.split('.')
+        return Path(reference_path.parent / f'{name_prefix}_{lang}.{name_suffix}')
+
+    @staticmethod
+    def _submit_translations(executor: Optional[ProcessPoolExecutor], config: Config, reference: PropFileView,
+                             reference_path: Path, languages: List[str]) -> Dict[str, Future]:
+        """
+        Schedules loading and validation of translations of given base file in the process pool.
+        Results are meant to be collected in the original languages order, so output is the same
+        as in sequential mode.
+
+        :param executor: Process pool to use. If None, nothing is scheduled.
+        :param config: Application config.
+        :param reference: Read-only view of loaded base file.
+        :param reference_path: Path to base file.
+        :param languages: Languages to process.
+        :return: Dictionary of futures keyed by language code.
+        """
+        if executor is None:
+            return {}
+
+        task: Callable = TransTool._load_and_validate
+        if Profiler.get() is not None:
+            # Timings recorded in worker processes are passed back along with the results.
+            task = partial(Profiler.run_in_worker, task)
+
+        return {lang: executor.submit(task, config, reference, TransTool._get_translation_path(reference_path, lang), lang)
+                for lang in languages}
+
+    @staticmethod
+    def _get_result(future: Future) -> PropFile:
+        """
+        Waits for translation check scheduled by _submit_translations() and returns checked translation.
+
+        :param future: Future of the check.
+        """
+        result = future.result()
+        profiler = Profiler.get()
+        if profiler is None:
+            return result
+        translation, events = result
+        profiler.merge(events)
+        return translation
+
+    @staticmethod
+    def _load_and_validate(config: Config, reference: PropFileView, translation_path: Path, lang: str,
+                           content: Optional[bytes] = None) -> PropFile:
+        """
+        Loads given translation file and validates it against the reference. Any issue found is stored in
+        the translation's report. This method does not produce any output on its own, so it can be safely
+        run in a worker process.
+
+        :param config: Application config.
+        :param reference: Read-only view of loaded base file.
+        :param translation_path: Translation file to load.
+        :param lang: Language code of the translation.
+        :param content: Optional, already read content of the translation file.
+        :return: Loaded and validated translation file.
+
+        :raises FileNotFoundError: if translation file does not exist.
+        :raises SyntaxError: if translation file cannot be parsed.
+        """
+        # Worker processes do not necessarily inherit main process' state.
+        ReportGroup.configure(config)
+        translation = PropFile(config)
+        translation.load(translation_path, lang, content)
+        translation.validate(reference)
+        return translation
+
+
+class WatchSession(object):
+    """
+    Files loaded by TransTool._watch(), kept in memory between checks.
+    """
+
+    def __init__(self):
+        # Base file jobs keyed by base file path.
+        self.jobs: Dict[Path, BaseFileJob] = {}
+        # Translation file -> (its modification time when loaded, loaded file, report of issues found while loading).
+        self.translations: Dict[Path, Tuple[int, PropFile, Report]] = {}
+        # Number of errors found by the last check of each file, keyed by (base file, language code).
+        # Language is None for the base file itself.
+        self.errors: Dict[Tuple[Path, Optional[str]], int] = {}
+
+
+class BaseFileJob(object):
+    """
+    Base file loaded and validated by TransTool._schedule_base_file(), along with checks of its
+    translations scheduled in the process pool.
+    """
+
+    def __init__(self, reference_path: Path):
+        self.reference_path = reference_path
+        # Error raised while loading the base file, if any.
+        self.load_error: Optional[Exception] = None
+        self.reference: Optional[PropFile] = None
+        self.reference_view: Optional[PropFileView] = None
+        self.checks_executed: int = 0
+        # Languages to process.
+        self.languages: List[str] = []
+        # Translation files present on disk, keyed by language code.
+        self.translations: Dict[str, Path] = {}
+        # Futures of translation checks keyed by language code.
+        self.pending: Dict[str, Future] = {}
@@ -0,0 +1,199 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from simplelog.log import Log
+
+
+class ProfileTimer(object):
+    """
+    Accumulates wall-clock and CPU time of repeated calls, i.e. per-item checks of single checker.
+    """
+
+    __slots__ = ('wall', 'cpu', 'items')
+
+    def __init__(self):
+        self.wall: float = 0.0
+        self.cpu: float = 0.0
+        self.items: int = 0
+
+    def wrap(self, func: Callable) -> Callable:
+        """
+        Returns wrapper of given function, adding time of each call to this timer. Each call counts as one item.
+        """
+
+        def timed(*args, **kwargs):
+            wall = time.perf_counter()
+            cpu = time.thread_time()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.cpu += time.thread_time() - cpu
+                self.wall += time.perf_counter() - wall
+                self.items += 1
+
+        return timed
+
+
+class Profiler(object):
+    """
+    Collects timings of loading, checking, updating and saving files (see --profile). There's at most
+    one active profiler per process. Code being profiled checks Profiler.get() and records its timings
+    only if it returns an instance, so profiling costs nothing when disabled.
+    """
+
+    CATEGORY_LOAD = 'load'
+    CATEGORY_CHECK = 'check'
+    CATEGORY_UPDATE = 'update'
+    CATEGORY_SAVE = 'save'
+    CATEGORIES = [CATEGORY_LOAD, CATEGORY_CHECK, CATEGORY_UPDATE, CATEGORY_SAVE]
+
+    _active: Optional['Profiler'] = None
+
+    def __init__(self):
+        # Recorded events: (category, name, file, wall time, CPU time, calls, items).
+        self.events: List[Tuple[str, str, str, float, float, int, int]] = []
+
+    @staticmethod
+    def get() -> Optional['Profiler']:
+        """
+        Returns active profiler or None if profiling is disabled.
+        """
+        return Profiler._active
+
+    @staticmethod
+    def enable() -> 'Profiler':
+        """
+        Makes new profiler the active one and returns it.
+        """
+        Profiler._active = Profiler()
+        return Profiler._active
+
+    @staticmethod
+    def disable() -> None:
+        Profiler._active = None
+
+    @staticmethod
+    def run_in_worker(func: Callable, *args) -> Tuple[Any, List[Tuple]]:
+        """
+        Runs given function with profiling enabled. Meant to be run in worker process, so events
+        recorded there can be passed back and merged into main process' profiler.
+
+        :return: Tuple of (func's result, recorded events).
+        """
+        profiler = Profiler.enable()
+        try:
+            return func(*args), profiler.events
+        finally:
+            Profiler.disable()
+
+    # #################################################################################################
+
+    @staticmethod
+    def start() -> Tuple[float, float]:
+        """
+        Returns start point to be passed to stop().
+        """
+        return time.perf_counter(), time.thread_time()
+
+    def stop(self, started: Tuple[float, float], category: str, name: str, file: Optional[Union[Path, str]],
+             items: int = 0) -> None:
+        """
+        Records single event that lasted since `started`.
+
+        :param started: Value returned by start().
+        :param category: One of CATEGORIES.
+        :param name: Name of the event (i.e. checker ID).
+        :param file: File the event is related to.
+        :param items: Number of items processed.
+        """
+        wall = time.perf_counter() - started[0]
+        cpu = time.thread_time() - started[1]
+        self.events.append((category, name, str(file) if file is not None else '', wall, cpu, 1, items))
+
+    def add_timer(self, timer: ProfileTimer, category: str, name: str, file: Optional[Union[Path, str]]) -> None:
+        """
+        Records time accumulated by given timer as single event.
+        """
+        if timer.items:
+            self.events.append((category, name, str(file) if file is not None else '',
+                                timer.wall, timer.cpu, 1, timer.items))
+
+    def merge(self, events: List[Tuple]) -> None:
+        """
+        Adds events recorded by other profiler (i.e. in worker process).
+        """
+        self.events.extend(events)
+
+    # #################################################################################################
+
+    def get_summary(self) -> Dict[str, Dict[str, Dict[str, Dict[str, float]]]]:
+        """
+        Returns recorded timings summed per checker and per file:
+          {"checkers": {name: {"wall": .., "cpu": .., "calls": .., "items": ..}},
+           "files": {file: {category: {"wall": .., "cpu": .., "calls": .., "items": ..}}}}
+        """
+        checkers: Dict[str, Dict[str, float]] = {}
+        files: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for category, name, file, wall, cpu, calls, items in self.events:
+            targets = [files.setdefault(file, {}).setdefault(category, {})]
+            if category == self.CATEGORY_CHECK:
+                targets.append(checkers.setdefault(name, {}))
+            for target in targets:
+                target['wall'] = target.get('wall', 0.0) + wall
+                target['cpu'] = target.get('cpu', 0.0) + cpu
+                target['calls'] = target.get('calls', 0) + calls
+                target['items'] = target.get('items', 0) + items
+        return {'checkers': checkers, 'files': files}
+
+    def dump(self) -> None:
+        """
+        Writes summary tables to the log.
+        """
+        summary = self.get_summary()
+
+        Log.push('Profile: checkers (time in ms)')
+        Log.i(f'{"Checker":32} {"calls":>8} {"items":>10} {"wall":>10} {"cpu":>10} {"items/s":>12}')
+        checkers = sorted(summary['checkers'].items(), key=lambda entry: entry[1]['wall'], reverse=True)
+        for name, entry in checkers:
+            rate = entry['items'] / entry['wall'] if entry['wall'] > 0 else 0
+            Log.i(f'{name:32} {entry["calls"]:8} {entry["items"]:10} {entry["wall"] * 1000:10.1f} '
+                  f'{entry["cpu"] * 1000:10.1f} {rate:12,.0f}')
+        Log.pop()
+
+        Log.push('Profile: files (wall time in ms)')
+        header = ''.join(f' {category:>10}' for category in self.CATEGORIES)
+        Log.i(f'{"File":60}{header} {"total":>10} {"cpu":>10}')
+        files = sorted(summary['files'].items(), key=lambda entry: sum(cat['wall'] for cat in entry[1].values()),
+                       reverse=True)
+        for file, categories in files:
+            times = ''.join(f' {categories[category]["wall"] * 1000:10.1f}' if category in categories else f' {"-":>10}'
+                            for category in self.CATEGORIES)
+            total = sum(category['wall'] for category in categories.values())
+            cpu = sum(category['cpu'] for category in categories.values())
+            Log.i(f'{self._shorten(file, 60):60}{times} {total * 1000:10.1f} {cpu * 1000:10.1f}')
+        Log.pop()
+
+    @staticmethod
+    def _shorten(text: str, length: int) -> str:
+        return text if len(text) <= length else f'…{text[-(length - 1):]}'
+
+    def save(self, file: Path) -> None:
+        """
+        Writes summary (see get_summary()) and all the recorded events to given file as JSON.
+        """
+        events = [dict(zip(('category', 'name', 'file', 'wall', 'cpu', 'calls', 'items'), event))
+                  for event in self.events]
+        with open(file, 'w') as fh:
+            json.dump({**self.get_summary(), 'events': events}, fh, indent=2)
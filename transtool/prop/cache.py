@@ -0,0 +1,109 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from transtool.const import Const
+
+
+class ParseCache(object):
+    """
+    On-disk cache of loaded *.properties files. Each entry holds state of the PropFile right after
+    its file was loaded (items, keys etc.) and is valid as long as the file's path, size, modification
+    time and content hash match the ones recorded. Any problem with reading the cache entry (i.e. it is
+    corrupted or was written by another version of the app) is treated as cache miss.
+    """
+
+    # Bump if format of cache entries changes.
+    FORMAT_VERSION = 7
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+
+    def _get_entry_file(self, file: Path) -> Path:
+        name = hashlib.sha256(str(file.resolve()).encode('utf-8')).hexdigest()
+        return self.cache_dir / f'{name}.cache'
+
+    @staticmethod
+    def get_fingerprint(file: Path, content: Optional[bytes] = None) -> Tuple[str, int, int, str]:
+        """
+        Returns (path, size, mtime, content hash) tuple identifying current state of the file.
+        It should be obtained before the file is parsed, so any change made while parsing
+        invalidates the entry.
+
+        :param file: Source *.properties file.
+        :param content: Optional, already read content of the file, to hash instead of reading the file.
+        """
+        stat = file.stat()
+        digest = hashlib.sha256()
+        if content is not None:
+            # Describe the content that is actually parsed, even if the file was changed since it was read.
+            digest.update(content)
+            size = len(content)
+        else:
+            size = stat.st_size
+            with open(file, 'rb') as fh:
+                for chunk in iter(lambda: fh.read(1024 * 1024), b''):
+                    digest.update(chunk)
+        return str(file.resolve()), size, stat.st_mtime_ns, digest.hexdigest()
+
+    # #################################################################################################
+
+    def load(self, file: Path, fingerprint: Tuple[str, int, int, str]) -> Optional[Dict[str, Any]]:
+        """
+        Returns cached data for given file or None if there's no valid cache entry.
+
+        :param file: Source *.properties file.
+        :param fingerprint: Current fingerprint of the file, as returned by get_fingerprint().
+        """
+        entry_file = self._get_entry_file(file)
+        if not entry_file.exists():
+            return None
+
+        # noinspection PyBroadException
+        try:
+            with open(entry_file, 'rb') as fh:
+                version, app_version, cached_fingerprint, data = pickle.load(fh)
+            if version != self.FORMAT_VERSION or app_version != Const.APP_VERSION:
+                return None
+            if fingerprint != tuple(cached_fingerprint) or not isinstance(data, dict):
+                return None
+            return data
+        except Exception:
+            # Corrupted or otherwise unusable entry. It will be overwritten once the file is parsed.
+            return None
+
+    def save(self, file: Path, fingerprint: Tuple[str, int, int, str], data: Dict[str, Any]) -> None:
+        """
+        Stores data of given file in the cache. Failing to write the cache is not an error.
+
+        :param file: Source *.properties file.
+        :param fingerprint: Fingerprint of the file obtained before it was parsed.
+        :param data: Data to store.
+        """
+        payload = (self.FORMAT_VERSION, Const.APP_VERSION, fingerprint, data)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to temporary file first, so concurrent runs never see partially written entry.
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as fh:
+                    pickle.dump(payload, fh, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_name, self._get_entry_file(file))
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except OSError:
+            pass
@@ -0,0 +1,236 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+"""
+
+from array import array
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Union
+
+from transtool.config.config import Config
+from transtool.prop.items import Blank, Comment, FrozenBlank, FrozenComment, FrozenTranslation, PropItem, Translation
+
+
+class PropColumns(Sequence):
+    """
+    Columnar storage of PropFile items. Instead of keeping one object per item, each item is a row
+    in parallel arrays (item kind, value end offset, separator, source line number), while all the
+    values are kept in one shared string buffer. Keys are kept as references to (interned) key
+    strings, which are shared with file's key set and other files anyway. Items are materialized on
+    access only, so returned objects are detached snapshots: changing them does not alter the stored
+    data.
+
+    Rows can only be appended, so read-only snapshot (see freeze()) shares the arrays with its source.
+    """
+
+    KIND_BLANK = 0
+    KIND_COMMENT = 1
+    KIND_TRANSLATION = 2
+
+    # Line number stored if it is not known.
+    NO_LINE = -1
+
+    # Setters of item attributes (slots), used to build items directly, bypassing constructors and
+    # read-only guard of frozen items.
+    _set_value = PropItem.value.__set__
+    _set_key = PropItem.key.__set__
+    _set_separator = Translation.separator.__set__
+
+    def __init__(self) -> None:
+        self.kinds = array('b')
+        # Key of each row (None for non-translation rows).
+        self.keys: List[Optional[str]] = []
+        # Value end offset. Value starts where value of previous row ends.
+        self.value_ends = array('q')
+        # Index of the separator in Config.ALLOWED_SEPARATORS.
+        self.separators = array('b')
+        self.line_numbers = array('i')
+        # Rows with None value. Such values are stored as empty strings, and these are rare, so
+        # the set is consulted for rows with empty value only.
+        self.none_values: Set[int] = set()
+
+        # Shared buffer is built from parts and joined once needed.
+        self._parts: List[str] = []
+        self._buffer: str = ''
+        self._buffer_len: int = 0
+
+        # Number of rows of read-only snapshot, or None if rows can be appended.
+        self._frozen_len: Optional[int] = None
+        # Row kind -> class of materialized items.
+        self._item_classes: Dict[int, type] = {
+            self.KIND_BLANK: Blank,
+            self.KIND_COMMENT: Comment,
+            self.KIND_TRANSLATION: Translation,
+        }
+
+    # #################################################################################################
+
+    def append(self, item: PropItem, line_number: Optional[int] = None) -> None:
+        """
+        Adds given item as new row.
+
+        :param item: Item to store.
+        :param line_number: Optional source line number of the item.
+        """
+        if self._frozen_len is not None:
+            raise TypeError(f'{type(self).__name__} is read-only.')
+
+        if isinstance(item, Translation):
+            kind = self.KIND_TRANSLATION
+            key = item.key
+            separator = Config.ALLOWED_SEPARATORS.index(item.separator)
+        elif isinstance(item, Comment):
+            kind = self.KIND_COMMENT
+            key = None
+            separator = 0
+        elif isinstance(item, Blank):
+            kind = self.KIND_BLANK
+            key = None
+            separator = 0
+        else:
+            raise TypeError(f'Unsupported item type: {type(item)}.')
+
+        value = item.value
+        if value is None:
+            if kind != self.KIND_BLANK:
+                self.none_values.add(len(self.kinds))
+            value = ''
+        self._buffer_len += len(value)
+        self.kinds.append(kind)
+        self.keys.append(key)
+        self.value_ends.append(self._buffer_len)
+        self.separators.append(separator)
+        self.line_numbers.append(self.NO_LINE if line_number is None else line_number)
+        self._parts.append(value)
+
+    @property
+    def buffer(self) -> str:
+        """
+        Returns shared string buffer holding all the values.
+        """
+        if self._parts:
+            self._buffer = ''.join([self._buffer, *self._parts])
+            self._parts = []
+        return self._buffer
+
+    def freeze(self) -> 'PropColumns':
+        """
+        Returns read-only snapshot of the storage, materializing frozen items. As rows can only be
+        appended, the snapshot shares the arrays with its source and is not affected by rows appended
+        to the source later.
+        """
+        frozen = PropColumns()
+        frozen.kinds = self.kinds
+        frozen.keys = self.keys
+        frozen.value_ends = self.value_ends
+        frozen.separators = self.separators
+        frozen.line_numbers = self.line_numbers
+        # Rows are checked against the set only if they exist in the snapshot, so it can be shared too.
+        frozen.none_values = self.none_values
+        frozen._buffer = self.buffer  # noqa: WPS437
+        frozen._buffer_len = self._buffer_len  # noqa: WPS437
+        frozen._frozen_len = len(self)  # noqa: WPS437
+        frozen._item_classes = {  # noqa: WPS437
+            self.KIND_BLANK: FrozenBlank,
+            self.KIND_COMMENT: FrozenComment,
+            self.KIND_TRANSLATION: FrozenTranslation,
+        }
+        return frozen
+
+    # #################################################################################################
+
+    def get_key(self, idx: int) -> str:
+        """
+        Returns key stored in given row (empty string for non-translation rows), without materializing the item.
+        """
+        key = self.keys[idx]
+        return '' if key is None else key
+
+    def get_value(self, idx: int) -> Optional[str]:
+        """
+        Returns value stored in given row, without materializing the item.
+        """
+        value = self.buffer[self.value_ends[idx - 1] if idx else 0:self.value_ends[idx]]
+        return None if not value and idx in self.none_values else value
+
+    def translation_indices(self) -> Iterator[int]:
+        """
+        Yields indices of translation rows only, so these can be scanned without type dispatch.
+        """
+        kind = self.KIND_TRANSLATION
+        kinds = self.kinds
+        return (idx for idx in range(len(self)) if kinds[idx] == kind)
+
+    # #################################################################################################
+
+    def _materialize(self, idx: int) -> PropItem:
+        kind = self.kinds[idx]
+        item_cls = self._item_classes[kind]
+        if kind == self.KIND_BLANK:
+            # All blank items are the same, shared instance.
+            return item_cls()
+
+        # Stored items were valid when appended, so there's no need to validate them again by calling
+        # the constructor. Items are built directly instead, already frozen if needed, in single allocation.
+        item = object.__new__(item_cls)
+        self._set_value(item, self.get_value(idx))
+        self._set_key(item, self.keys[idx])
+        if kind == self.KIND_TRANSLATION:
+            self._set_separator(item, Config.ALLOWED_SEPARATORS[self.separators[idx]])
+        return item
+
+    def __getitem__(self, idx: Union[int, slice]) -> Union[PropItem, List[PropItem]]:
+        if isinstance(idx, slice):
+            return [self._materialize(single_idx) for single_idx in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError('Item index out of range.')
+        return self._materialize(idx)
+
+    def __iter__(self) -> Iterator[PropItem]:
+        # Same as _materialize(), inlined, as this is the hottest path.
+        kinds = self.kinds
+        keys = self.keys
+        value_ends = self.value_ends
+        separators = self.separators
+        none_values = self.none_values
+        buffer = self.buffer
+        blank = self._item_classes[self.KIND_BLANK]()
+        comment_cls = self._item_classes[self.KIND_COMMENT]
+        translation_cls = self._item_classes[self.KIND_TRANSLATION]
+        new = object.__new__
+        set_value = self._set_value
+        set_key = self._set_key
+        set_separator = self._set_separator
+        kind_translation = self.KIND_TRANSLATION
+        kind_comment = self.KIND_COMMENT
+        allowed_separators = Config.ALLOWED_SEPARATORS
+
+        value_start = 0
+        for idx in range(len(self)):
+            kind = kinds[idx]
+            value_end = value_ends[idx]
+            value = buffer[value_start:value_end]
+            if not value and idx in none_values:
+                value = None
+            if kind == kind_translation:
+                item = new(translation_cls)
+                set_value(item, value)
+                set_key(item, keys[idx])
+                set_separator(item, allowed_separators[separators[idx]])
+            elif kind == kind_comment:
+                item = new(comment_cls)
+                set_value(item, value)
+                set_key(item, None)
+            else:
+                item = blank
+            value_start = value_end
+            yield item
+
+    def __len__(self) -> int:
+        return len(self.kinds) if self._frozen_len is None else self._frozen_len
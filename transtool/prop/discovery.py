@@ -0,0 +1,131 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from transtool.config.config import Config
+
+
+class Discovery(object):
+    """
+    Finds base files in project's directory tree (i.e. Maven's or Gradle's `src/main/resources`).
+    Base file is a file named `prefix.suffix`. Files named `prefix_lang.suffix` are considered its
+    translations if such base file exists in the same directory and `lang` is valid language code
+    (see FileIndex.LANGUAGE_PATTERN). Any other file is a base file, so no file is skipped.
+    """
+
+    # Directories not to descend into, as these usually hold build artifacts (i.e. copies of the resources).
+    # Hidden directories are skipped as well.
+    SKIPPED_DIRS = {'build', 'node_modules', 'target'}
+
+    @staticmethod
+    def find_base_files(root: Path, file_suffix: str, index: Optional['FileIndex'] = None) -> List[Path]:
+        """
+        Returns base files found in given directory tree, sorted by path.
+
+        :param root: Directory to scan.
+        :param file_suffix: Suffix of translation files, including leading dot (i.e. ".properties").
+        :param index: Optional FileIndex to record listed directories in, so they are not listed again.
+        :raises NotADirectoryError: if root is not a directory.
+        """
+        if not root.is_dir():
+            raise NotADirectoryError(f'Not a directory: {root}')
+
+        base_files: List[Path] = []
+        for dir_path, dir_names, file_names in os.walk(root):
+            # Prune in place, so os.walk() does not descend there. Sorted for predictable order.
+            dir_names[:] = sorted(dir_name for dir_name in dir_names
+                                  if not dir_name.startswith('.') and dir_name not in Discovery.SKIPPED_DIRS)
+            if index is not None:
+                index.add_dir(Path(dir_path), file_names)
+            base_files.extend(Path(dir_path) / name for name in Discovery.get_base_names(file_names, file_suffix))
+        return sorted(base_files)
+
+    @staticmethod
+    def get_base_names(file_names: List[str], file_suffix: str) -> List[str]:
+        """
+        Returns names of base files found in given list of files of single directory.
+
+        :param file_names: Names of all the files in the directory.
+        :param file_suffix: Suffix of translation files, including leading dot.
+        """
+        prefixes = set()
+        for file_name in file_names:
+            if file_name.endswith(file_suffix):
+                prefix = file_name[:-len(file_suffix)]
+                # Base filename format must be "prefix.suffix".
+                if prefix and '.' not in prefix:
+                    prefixes.add(prefix)
+
+        # Anything named as translation of other base file is not a base file. The same rule is used
+        # by FileIndex to find translations, so each file is either checked as base file or as translation.
+        # Base file's prefix is always shorter than its translation's, so shorter prefixes are decided first.
+        base_prefixes: Set[str] = set()
+        for prefix in sorted(prefixes, key=len):
+            if not any(prefix[:pos] in base_prefixes and FileIndex.LANGUAGE_PATTERN.match(prefix[pos + 1:])
+                       for pos, char in enumerate(prefix) if char == '_'):
+                base_prefixes.add(prefix)
+        return [f'{prefix}{file_suffix}' for prefix in sorted(base_prefixes)]
+
+
+class FileIndex(object):
+    """
+    Index of translation files present on disk. Each directory is listed once, when first needed,
+    so looking up translations of a base file costs no filesystem access per language.
+    """
+
+    # Also used by Discovery.get_base_names().
+    LANGUAGE_PATTERN = re.compile(Config.LANGUAGE_REGEXP)
+
+    def __init__(self, file_suffix: str):
+        self.file_suffix = file_suffix
+        # Directory -> names of files in it.
+        self._dirs: Dict[Path, Set[str]] = {}
+
+    def add_dir(self, directory: Path, file_names: Iterable[str]) -> None:
+        """
+        Records content of already listed directory.
+
+        :param directory: Directory listed.
+        :param file_names: Names of the files in it.
+        """
+        self._dirs[directory] = set(file_names)
+
+    def _get_file_names(self, directory: Path) -> Set[str]:
+        file_names = self._dirs.get(directory)
+        if file_names is None:
+            try:
+                with os.scandir(directory) as entries:
+                    file_names = {entry.name for entry in entries if entry.is_file()}
+            except (FileNotFoundError, NotADirectoryError):
+                file_names = set()
+            self._dirs[directory] = file_names
+        return file_names
+
+    def get_translations(self, base_file: Path) -> Dict[str, Path]:
+        """
+        Returns translation files of given base file present on disk, keyed by language code (sorted).
+
+        :param base_file: Path to base file (named "prefix.suffix").
+        """
+        name_prefix, name_suffix = base_file.name.split('.')
+        start = f'{name_prefix}_'
+        end = f'.{name_suffix}'
+
+        translations = {}
+        for file_name in self._get_file_names(base_file.parent):
+            if file_name.startswith(start) and file_name.endswith(end):
+                lang = file_name[len(start):-len(end)]
+                if self.LANGUAGE_PATTERN.match(lang):
+                    translations[lang] = base_file.parent / file_name
+        return dict(sorted(translations.items()))
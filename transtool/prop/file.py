@@ -8,33 +8,56 @@
 #
 """
 
-import copy
+import os
 import re
+import stat
+import tempfile
 from pathlib import Path
-from typing import List, Union, Optional
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 from simplelog.log import Log
+from transtool.checks.base.check import Check
+from transtool.checks.base.engine import CheckEngine
+from transtool.checks.base.incremental import IncrementalEngine
+from transtool.checks.base.memo import ResultMemo
 from transtool.config.config import Config
+from transtool.profiler import Profiler
+from transtool.prop.cache import ParseCache
+from transtool.prop.columns import PropColumns
 from transtool.prop.items import Blank, Comment, PropItem, Translation
+from transtool.prop.ordered_set import OrderedSet
+from transtool.prop.parser import PropParser
+from transtool.prop.pipeline import IoPipeline
+from transtool.prop.view import PropFileView
 from transtool.report.group import ReportGroup
 from transtool.report.report import Report
 
 
 class PropFile(object):
+    # Permissions of newly created files. See _get_new_file_mode().
+    _new_file_mode: Optional[int] = None
+
     def __init__(self, config: Config, language: str = None):
         super().__init__()
 
         self.config: Config = config
 
-        self._items: List[PropItem] = []
+        # Plain list of items or, if enabled in config, columnar storage.
+        self._items: Union[List[PropItem], PropColumns] = []
 
         self.file: Optional[Path] = None
         self.loaded: bool = False
 
         # All the keys of 'regular' translations
-        self.keys: List[str] = []
+        self.keys: OrderedSet = OrderedSet()
         # All the keys in form `# ==> KEY =` that we found.
-        self.commented_out_keys: List[str] = []
+        self.commented_out_keys: OrderedSet = OrderedSet()
+        # Translation key to item position lookup table, kept in sync with `_items`.
+        self._index: Dict[str, int] = {}
+        # Number of items `_index` was built from. Used to detect changes made directly to `items` list.
+        self._index_items_cnt: int = 0
+        # Read-only view of the file, built on demand and dropped once the file is changed.
+        self._view: Optional[PropFileView] = None
 
         self.separator: str = config.separator
         self.report: Report = Report(config)
@@ -45,9 +68,12 @@ class PropFile(object):
         self.init_container(language)
 
     def init_container(self, language: str) -> None:
-        self._items = []
-        self.keys = []
-        self.commented_out_keys = []
+        self._items = PropColumns() if self.config.columnar else []
+        self.keys = OrderedSet()
+        self.commented_out_keys = OrderedSet()
+        self._index = {}
+        self._index_items_cnt = 0
+        self._view = None
         self.loaded = False
         self.report = Report(self.config)
         self.language = language
@@ -55,9 +81,23 @@ class PropFile(object):
     # #################################################################################################
 
     @property
-    def items(self) -> List[PropItem]:
+    def items(self) -> Union[List[PropItem], PropColumns]:
         return self._items
 
+    def view(self) -> PropFileView:
+        """
+        Returns read-only snapshot of the file, to be handed to checkers. The items are made read-only
+        in place (see PropItem.freeze_in_place()), so they cannot be modified once the view exists.
+        The view is reused until the file is changed.
+        """
+        # Length check catches changes made directly to `items` list, bypassing append().
+        if self._view is None or len(self._view.items) != len(self._items):
+            if not isinstance(self._items, PropColumns):
+                for position, item in enumerate(self._items):
+                    self._items[position] = item.freeze_in_place()
+            self._view = PropFileView(self)
+        return self._view
+
     # #################################################################################################
 
     def find_by_key(self, key: str) -> Optional[Translation]:
@@ -67,20 +107,31 @@ class PropFile(object):
         :param key: Translation key to look for.
         :return: Instance of PropTranslation or None.
         """
-        # noinspection PyTypeChecker
-        translations: List[Translation] = list(filter(lambda entry: isinstance(entry, Translation), self.items))
-        for item in translations:
-            if item.key == key:
-                return item
-        return None
+        if self._index_items_cnt != len(self._items):
+            # Items list was modified directly, bypassing append(), so we need to rebuild the index.
+            self._rebuild_index()
+        position = self._index.get(key)
+        return None if position is None else self._items[position]
+
+    def _rebuild_index(self) -> None:
+        """
+        Rebuilds key lookup table from scratch, using current content of the items list.
+        """
+        self._index = {}
+        for position, item in enumerate(self._items):
+            if isinstance(item, Translation):
+                self._index.setdefault(item.key, position)
+        self._index_items_cnt = len(self._items)
 
     # #################################################################################################
 
-    def append(self, items: Union[List[PropItem], PropItem]) -> None:
+    def append(self, items: Union[List[PropItem], PropItem], line_number: Optional[int] = None) -> None:
         """
         Appends given PropItem(s) to internal buffer.
 
         :param items: PropItem(s) to be added.
+        :param line_number: Optional source line number of the item, recorded by columnar storage.
+                            Used only if single item is appended.
         """
         if issubclass(type(items), PropItem):
             items = [items]
@@ -93,13 +144,20 @@ class PropFile(object):
                 raise TypeError(f'Item must be of PropItem, {type(single_item)} given.')
 
             if isinstance(single_item, Translation):
-                self.keys.append(single_item.key)
+                self.keys.add(single_item.key)
+                # In case of duplicated keys, the first occurrence wins.
+                self._index.setdefault(single_item.key, len(self._items))
             elif isinstance(single_item, Comment):
                 # Let's look for commented out keys.
                 match = re.compile(Config.COMMENTED_TRANS_REGEXP).match(single_item.value)
                 if match:
-                    self.commented_out_keys.append(match.group(1))
-            self._items.append(single_item)
+                    self.commented_out_keys.add(match.group(1))
+            if isinstance(self._items, PropColumns):
+                self._items.append(single_item, line_number if len(items) == 1 else None)
+            else:
+                self._items.append(single_item)
+            self._index_items_cnt += 1
+        self._view = None
 
     # #################################################################################################
 
@@ -114,6 +172,8 @@ class PropFile(object):
 
         :param reference:
         """
+        profiler = Profiler.get()
+        started = profiler.start() if profiler is not None else None
 
         tmp = PropFile(self.config)
 
@@ -125,9 +185,10 @@ class PropFile(object):
                 if self.config.write_reference:
                     # Write reference even if we have a translation (for. i.e. proofreading).
                     tmp.append(Comment(f'{self.config.comment_marker} {item.key} {self.config.separator} {item.value}'))
-                if item.key in self.keys:
+                translation = self.find_by_key(item.key)
+                if translation is not None:
                     # Write existing translation
-                    tmp.append(self.find_by_key(item.key))
+                    tmp.append(translation)
                 else:
                     # We do not have the translation yet.
                     if self.config.write_reference:
@@ -144,90 +205,164 @@ class PropFile(object):
         self._items = tmp.items
         self.keys = tmp.keys
         self.commented_out_keys = tmp.commented_out_keys
+        self._index = tmp._index  # noqa: WPS437
+        self._index_items_cnt = tmp._index_items_cnt  # noqa: WPS437
+        self._view = None
+
+        if profiler is not None:
+            profiler.stop(started, Profiler.CATEGORY_UPDATE, Profiler.CATEGORY_UPDATE, self.file, len(self._items))
 
     # #################################################################################################
 
-    def validate(self, reference_file: 'PropFile') -> bool:
+    def validate(self, reference_file: Union['PropFile', PropFileView]) -> bool:
         """
         Validates given PropFile against provided reference file.
 
-        :param reference_file:
+        :param reference_file: Reference file or its read-only view. When validating many translations
+                               against the same reference, pass its view to avoid building it each time.
         :return: True if file is valid, False if there were errors.
         """
         if not self.config.checks:
             raise RuntimeError('Checks config element cannot be empty.')
 
-        for _, checker_info in self.config.checks.items():
-            checker = checker_info.callable(checker_info.config)
-            # Each validator gets copy of the files, to prevent any potential destructive operation.
-            self.report.add(checker.check(copy.copy(self), copy.copy(reference_file)))
+        if not isinstance(reference_file, PropFileView):
+            reference_file = reference_file.view()
+
+        # Checkers get read-only views of the files, to prevent any potential destructive operation.
+        checkers = {checker_id: checker_info.checker for checker_id, checker_info in self.config.checks.items()}
+        if self.config.incremental and self.file is not None and reference_file.file is not None:
+            state_file = IncrementalEngine.get_state_file(Path(self.config.cache_dir), self.file, reference_file.file)
+            results = IncrementalEngine(checkers).run_with_state(state_file, self.view(), reference_file)
+        else:
+            engine = CheckEngine(list(checkers.values()), ResultMemo.get_shared(self.config))
+            results = engine.run(self.view(), reference_file)
+        self.add_results(checkers, results)
 
         return self.report.empty()
 
+    def add_results(self, checkers: Dict[str, Check], results: List[ReportGroup]) -> None:
+        """
+        Adds results of the checkers to the file's report, tagging each group with its checker's ID.
+
+        :param checkers: Checkers that were run, keyed by checker ID.
+        :param results: Report groups returned by the engine, in the same order as checkers.
+        """
+        for checker_id, report_group in zip(checkers, results):
+            report_group.checker_id = checker_id
+            self.report.add(report_group)
+
     # #################################################################################################
 
-    def load(self, file: Path, language: str = None):
+    def load(self, file: Path, language: str = None, content: Optional[bytes] = None):
         """
         Loads and parses *.properties file.
 
         :param file: File to load.
         :param language: Optional language code the loaded data if for.
+        :param content: Optional content of the file, if it was already read (see IoPipeline).
+                        File is not read again then.
         """
+        profiler = Profiler.get()
+        started = profiler.start() if profiler is not None else None
+
+        self._load(file, language, content)
 
-        if not file.exists():
+        if profiler is not None:
+            profiler.stop(started, Profiler.CATEGORY_LOAD, Profiler.CATEGORY_LOAD, file, len(self._items))
+
+    def _load(self, file: Path, language: str = None, content: Optional[bytes] = None) -> None:
+        """
+        Implementation of load().
+        """
+        if content is None and not file.exists():
             raise FileNotFoundError(f'File not found: {file}')
 
         self.init_container(language)
         self.file = file
 
-        with open(file, 'r') as fh:
-            line_number: int = 0
-
-            duplicated_keys = ReportGroup('Duplicated keys')
+        cache = ParseCache(Path(self.config.cache_dir)) if self.config.cache else None
+        fingerprint = None
+        if cache is not None:
+            fingerprint = cache.get_fingerprint(file, content)
+            if self._restore_from_cache(cache.load(file, fingerprint)):
+                return
 
-            while True:
-                line_number += 1
-                line: str = fh.readline()
-                if not line:
-                    break
+        duplicated_keys = ReportGroup('Duplicated keys')
+        for line_number, item in self._parse_file(file, content):
+            if isinstance(item, Translation) and item.key in self.keys:
+                duplicated_keys.error(line_number, 'Duplicated key.', item.key)
+                continue
+            self.append(item, line_number)
 
-                # remove CRLF
-                if line and line[-1] == '\n':  # LF
-                    line = line[:-1]
-                if line and line[-1] == '\r':  # CR
-                    line = line[:-1]
+        if not duplicated_keys.empty():
+            self.report.add(duplicated_keys)
 
-                # Skip empty lines
-                if line.strip() == '':
-                    self.append(Blank())
-                    continue
+        if cache is not None:
+            cache.save(file, fingerprint, self._get_cache_data(duplicated_keys))
 
-                if line[0] in Config.ALLOWED_COMMENT_MARKERS:
-                    self.append(Comment(line))
-                    continue
-
-                # Whatever left should be valid key[:=]val entry
-                tmp = Translation.parse_translation_line(line)
-                if not tmp:
-                    raise SyntaxError(f'Invalid syntax at line {line_number} of "{file}".')
+    def _get_cache_data(self, duplicated_keys: ReportGroup) -> Dict:
+        """
+        Returns state of freshly loaded file, to be stored in parse cache.
 
-                key = tmp[0].strip()
-                separator = tmp[1].strip()
-                val = tmp[2].lstrip()
-                if key in self.keys:
-                    duplicated_keys.error(line_number, 'Duplicated key.', key)
-                    continue
+        :param duplicated_keys: Report of duplicated keys found while parsing.
+        """
+        return {
+            'items': self._items,
+            'keys': self.keys,
+            'commented_out_keys': self.commented_out_keys,
+            'index': self._index,
+            'duplicated_keys': duplicated_keys,
+        }
+
+    def _restore_from_cache(self, data: Optional[Dict]) -> bool:
+        """
+        Restores state of loaded file from parse cache data.
 
-                self.append(Translation(key, val, separator))
+        :param data: Cached data or None.
+        :return: True if state was restored, False if data is not usable and the file needs to be parsed.
+        """
+        if data is None:
+            return False
+        # Entry could be created with other storage type.
+        if isinstance(data['items'], PropColumns) != self.config.columnar:
+            return False
+
+        self._items = data['items']
+        self.keys = data['keys']
+        self.commented_out_keys = data['commented_out_keys']
+        self._index = data['index']
+        self._index_items_cnt = len(self._items)
+        self._view = None
+        if not data['duplicated_keys'].empty():
+            self.report.add(data['duplicated_keys'])
+        return True
+
+    def _parse_file(self, file: Path, content: Optional[bytes] = None) -> Iterator[Tuple[int, PropItem]]:
+        """
+        Yields parsed items of given file, using loader mode set in config.
 
-            if not duplicated_keys.empty():
-                self.report.add(duplicated_keys)
+        :param file: File to parse.
+        :param content: Optional, already read content of the file.
+        """
+        parser = PropParser(file)
+        if content is not None:
+            yield from parser.parse(content)
+            return
+        if self.config.mmap:
+            yield from parser.parse_mapped(file)
+            return
+        with open(file, 'r', encoding=PropParser.ENCODING) as fh:
+            yield from parser.parse(fh)
 
     # #################################################################################################
 
-    def save(self, target_file_name: Optional[Union[Path, str]] = None) -> None:
+    def save(self, target_file_name: Optional[Union[Path, str]] = None, pipeline: Optional[IoPipeline] = None) -> None:
         """
         Saves content of the properties file.
+
+        :param target_file_name: File to write to. Defaults to the file the content was loaded from.
+        :param pipeline: Optional IoPipeline to write the file in the background with. Content is
+                         built right away, so the object can be altered once this method returns.
         """
         if isinstance(target_file_name, str):
             target_file_name = Path(target_file_name)
@@ -236,20 +371,82 @@ class PropFile(object):
             if not self.file:
                 raise ValueError('No target file name given.')
             target_file_name = self.file
-        elif isinstance(target_file_name, str):
-            target_file_name = Path(target_file_name)
 
-        content = []
-        for item in self.items:
-            content.append(item.to_string())
+        profiler = Profiler.get()
+        started = profiler.start() if profiler is not None else None
+
+        content = self.to_bytes()
+        if self._is_file_content(target_file_name, content):
+            # Do not touch the file, so its modification time is preserved.
+            Log.v(f'Unchanged: {target_file_name}')
+        else:
+            Log.i(f'Writing: {target_file_name}')
+            if pipeline is not None:
+                pipeline.write(self._write_file, target_file_name, content)
+            else:
+                self._write_file(target_file_name, content)
 
-        # If last line is empty line, we need to add LF manually as join() won't do that.
-        if self.items:
-            last_item_idx = len(self.items) - 1
-            if isinstance(self.items[last_item_idx], Blank) == '':
-                content.append('')
+        if profiler is not None:
+            # With pipeline, the write itself is done in the background and is not included.
+            profiler.stop(started, Profiler.CATEGORY_SAVE, Profiler.CATEGORY_SAVE, target_file_name, len(self.items))
 
-        Log.i(f'Writing: {target_file_name}')
-        with open(target_file_name, 'w') as fh:
-            # FIXME: LF/CRLF should configurable
-            fh.write('\n'.join(content))
+    def to_bytes(self) -> bytes:
+        """
+        Returns content of the file, as written by save(). Lines are separated using line ending set in config.
+        Note that trailing Blank item produces trailing line ending, as join() puts one in front of it.
+        """
+        line_ending = Config.LINE_ENDINGS[self.config.line_ending]
+        return line_ending.join([item.to_string() for item in self.items]).encode(PropParser.ENCODING)
+
+    @staticmethod
+    def _is_file_content(file: Path, content: bytes) -> bool:
+        """
+        Returns True if given file exists and already has given content.
+        """
+        try:
+            # Different size means different content, so there's no need to read the file.
+            if file.stat().st_size != len(content):
+                return False
+            with open(file, 'rb') as fh:
+                return fh.read() == content
+        except OSError:
+            return False
+
+    @staticmethod
+    def _write_file(target_file_name: Path, content: bytes) -> None:
+        """
+        Writes the file atomically: content is written to temporary file in the same directory, which
+        then replaces the target, so the target is never left partially written.
+        """
+        if target_file_name.is_symlink():
+            # Replace the file the link points to, not the link.
+            target_file_name = Path(os.path.realpath(target_file_name))
+        try:
+            mode = stat.S_IMODE(target_file_name.stat().st_mode)
+        except FileNotFoundError:
+            mode = PropFile._get_new_file_mode()
+
+        fd, tmp_name = tempfile.mkstemp(dir=target_file_name.parent, prefix=f'.{target_file_name.name}.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as fh:
+                fh.write(content)
+                fh.flush()
+                os.fsync(fh.fileno())
+            # Temporary files are created with owner-only permissions.
+            os.chmod(tmp_name, mode)
+            os.replace(tmp_name, target_file_name)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    @staticmethod
+    def _get_new_file_mode() -> int:
+        """
+        Returns permissions regular open() would create new file with, honoring process' umask.
+        """
+        if PropFile._new_file_mode is None:
+            # The only way to get umask is to set it.
+            umask = os.umask(0)
+            os.umask(umask)
+            PropFile._new_file_mode = 0o666 & ~umask
+        return PropFile._new_file_mode
@@ -8,7 +8,9 @@
 #
 """
 
-from typing import Tuple, Optional
+import re
+import sys
+from typing import Pattern, Tuple, Optional
 
 from transtool.config.config import Config
 from transtool.decorators.overrides import overrides
@@ -17,6 +19,9 @@ from transtool.decorators.overrides import overrides
 # #################################################################################################
 
 class PropItem(object):
+    # Items are the most numerous objects we deal with, so no per-instance __dict__.
+    __slots__ = ('value', 'key')
+
     def __init__(self, value: Optional[str] = None, key: Optional[str] = None):
         self.value = value
         self.key = key
@@ -24,6 +29,46 @@ class PropItem(object):
     def to_string(self) -> str:
         raise NotImplementedError
 
+    def freeze(self) -> 'PropItem':
+        """
+        Returns read-only copy of the item. The copy is still instance of the item's class.
+        """
+        if isinstance(self, FrozenItem):
+            return self
+        frozen = object.__new__(self._get_frozen_class())
+        for name in PropItem.get_slot_names(type(self)):
+            object.__setattr__(frozen, name, getattr(self, name))
+        return frozen
+
+    def freeze_in_place(self) -> 'PropItem':
+        """
+        Makes the item itself read-only by turning it into instance of its read-only counterpart.
+        Unlike freeze(), nothing is copied, so all the holders of the item are affected.
+
+        :return: Read-only item, to be used instead of the original one.
+        """
+        if not isinstance(self, FrozenItem):
+            object.__setattr__(self, '__class__', self._get_frozen_class())
+        return self
+
+    def _get_frozen_class(self) -> type:
+        frozen_cls = _FROZEN_CLASSES.get(type(self))
+        if frozen_cls is None:
+            raise TypeError(f'No read-only counterpart of {type(self)} available.')
+        return frozen_cls
+
+    @staticmethod
+    def get_slot_names(cls: type) -> Tuple[str, ...]:
+        """
+        Returns names of all the attributes (slots) instances of given PropItem subclass have.
+        """
+        names = []
+        for klass in cls.__mro__:
+            for name in getattr(klass, '__slots__', ()):
+                if name not in names:
+                    names.append(name)
+        return tuple(names)
+
 
 # #################################################################################################
 
@@ -32,6 +77,8 @@ class Translation(PropItem):
     Class representing a translation entry.
     """
 
+    __slots__ = ('separator',)
+
     MIN_LINE_LENGTH = 2
 
     def __init__(self, key: str, value: Optional[str] = None, separator: str = '=') -> None:
@@ -51,43 +98,39 @@ class Translation(PropItem):
         # TODO: default separators should be moved to consts
         if separator not in {':', '='}:
             raise ValueError(f'Invalid separator character: "{separator}".')
-        super().__init__(value, key)
-        self.separator = separator
+        # The same keys are present in reference and all the translation files, so let them share
+        # single string object. Separators are interned too, so all items share the same two objects.
+        super().__init__(value, sys.intern(key))
+        self.separator = sys.intern(separator)
 
     @overrides(PropItem)
     def to_string(self) -> str:
         return f'{self.key} {self.separator} {self.value}'
 
+    # Matches first separator character. Used by the fast path of parse_translation_line().
+    SEPARATOR_PATTERN: Pattern = re.compile('[' + re.escape(''.join(Config.ALLOWED_SEPARATORS)) + ']')
+
     @staticmethod
     def parse_translation_line(line: str) -> Optional[Tuple[str, str, str]]:
         # Min two chars (one letter key and separator)
         if len(line) < Translation.MIN_LINE_LENGTH:
             return None
 
-        # Find used separator first
-        separator = None
-        separator_pos = None
-        previous_char_backspace = False
-        for idx, char in enumerate(line):
-            if char == '\\':
-                if not previous_char_backspace:
-                    previous_char_backspace = True
-                continue
-            if char in Config.ALLOWED_SEPARATORS:
-                if previous_char_backspace:
-                    continue
-
-                separator = char
-                separator_pos = idx
-                break
-            else:
-                previous_char_backspace = False
+        # Find used separator first. In vast majority of lines there's no backslash preceding
+        # the separator, so no escaping can affect the result, and we can simply use the first
+        # separator found. Otherwise, we need to fall back to escape-aware scan.
+        match = Translation.SEPARATOR_PATTERN.search(line)
+        if not match:
+            return None
+        separator_pos = match.start()
+        if line.find('\\', 0, separator_pos) != -1:
+            separator_pos = Translation.find_separator(line)
+            if separator_pos is None:
+                return None
+        separator = line[separator_pos]
 
         # https://docs.oracle.com/javase/7/docs/api/java/util/Properties.html
 
-        if not separator:
-            return None
-
         key = line[:separator_pos].strip()
         sep = separator.strip()
         val = line[separator_pos + 1:].lstrip()
@@ -97,6 +140,28 @@ class Translation(PropItem):
 
         return key, sep, val
 
+    @staticmethod
+    def find_separator(line: str) -> Optional[int]:
+        """
+        Escape-aware lookup for the key/value separator.
+
+        :param line: Line to scan.
+        :return: Position of the separator or None if there's no unescaped separator in the line.
+        """
+        previous_char_backspace = False
+        for idx, char in enumerate(line):
+            if char == '\\':
+                if not previous_char_backspace:
+                    previous_char_backspace = True
+                continue
+            if char in Config.ALLOWED_SEPARATORS:
+                if previous_char_backspace:
+                    continue
+                return idx
+            else:
+                previous_char_backspace = False
+        return None
+
 
 # #################################################################################################
 
@@ -105,6 +170,8 @@ class Comment(PropItem):
     Class representing a comment line.
     """
 
+    __slots__ = ()
+
     def __init__(self, value: str = '', marker: str = None) -> None:
         if not marker:
             marker = Config.ALLOWED_COMMENT_MARKERS[0]
@@ -162,9 +229,86 @@ class Comment(PropItem):
 
 class Blank(PropItem):
     """
-    Class representing empty line.
+    Class representing empty line. As all blank lines are the same, Blank() always returns
+    the same, shared instance, so it is read-only.
     """
 
+    __slots__ = ()
+
+    def __new__(cls, *args, **kwargs) -> 'Blank':
+        # Look up own class' instance only, so subclasses get their own singletons.
+        instance = cls.__dict__.get('_instance')
+        if instance is None:
+            instance = super().__new__(cls)
+            object.__setattr__(instance, 'value', None)
+            object.__setattr__(instance, 'key', None)
+            cls._instance = instance
+        return instance
+
+    def __init__(self) -> None:
+        # Attributes are set once, by __new__()
+        pass
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f'{type(self).__name__} is read-only.')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'{type(self).__name__} is read-only.')
+
+    def __reduce__(self):
+        # Unpickled (or copied) blank is the shared instance too.
+        return type(self), ()
+
     @overrides(PropItem)
     def to_string(self) -> str:
         return ''
+
+    @overrides(PropItem)
+    def freeze(self) -> 'PropItem':
+        return FrozenBlank()
+
+    @overrides(PropItem)
+    def freeze_in_place(self) -> 'PropItem':
+        # Instance is shared, so we must not alter it. Its read-only counterpart is a singleton too.
+        return FrozenBlank()
+
+
+# #################################################################################################
+
+class FrozenItem(object):
+    """
+    Mixin making PropItem read-only. Instances are created by PropItem.freeze() or freeze_in_place() only.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f'{type(self).__name__} is read-only.')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'{type(self).__name__} is read-only.')
+
+    def __setstate__(self, state) -> None:
+        # Used by pickle, which would otherwise restore slots via (blocked) setattr().
+        _, slots = state
+        for name, value in slots.items():
+            object.__setattr__(self, name, value)
+
+
+class FrozenTranslation(FrozenItem, Translation):
+    __slots__ = ()
+
+
+class FrozenComment(FrozenItem, Comment):
+    __slots__ = ()
+
+
+class FrozenBlank(FrozenItem, Blank):
+    __slots__ = ()
+
+
+_FROZEN_CLASSES = {
+    Translation: FrozenTranslation,
+    Comment: FrozenComment,
+    Blank: FrozenBlank,
+}
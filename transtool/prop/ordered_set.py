@@ -0,0 +1,87 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional
+
+
+class OrderedSet(object):
+    """
+    Set of strings that remembers insertion order. Membership tests are O(1), while iteration
+    yields elements in the order they were added, so it can be used for reporting purposes.
+    """
+
+    def __init__(self, items: Optional[Iterable[str]] = None) -> None:
+        # Since Python 3.7 dict preserves insertion order, so we use its keys as our storage.
+        self._items: Dict[str, None] = {}
+        if items is not None:
+            for item in items:
+                self.add(item)
+
+    def add(self, item: str) -> None:
+        """
+        Adds given element to the set. Adding already present element is no-op and does not
+        change its position.
+
+        :param item: Element to add.
+        """
+        self._items[item] = None
+
+    def discard(self, item: str) -> None:
+        """
+        Removes given element from the set if present.
+
+        :param item: Element to remove.
+        """
+        self._items.pop(item, None)
+
+    def difference(self, *others: Iterable[str]) -> List[str]:
+        """
+        Returns list of elements (in insertion order) that are not present in any of given collections.
+
+        :param others: Collections to subtract. For best performance these should be sets or OrderedSets.
+        :return: List of remaining elements.
+        """
+        return [item for item in self._items if not any(item in other for other in others)]
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._items
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, OrderedSet):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({list(self._items)})'
+
+
+class FrozenOrderedSet(OrderedSet):
+    """
+    Immutable variant of OrderedSet.
+    """
+
+    def __init__(self, items: Optional[Iterable[str]] = None) -> None:
+        self._frozen = False
+        super().__init__(items)
+        self._frozen = True
+
+    def add(self, item: str) -> None:
+        if self._frozen:
+            raise TypeError(f'{type(self).__name__} is immutable.')
+        super().add(item)
+
+    def discard(self, item: str) -> None:
+        raise TypeError(f'{type(self).__name__} is immutable.')
@@ -0,0 +1,107 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+"""
+
+import io
+import mmap
+from pathlib import Path
+from typing import IO, Iterator, Optional, Tuple, Union
+
+from transtool.config.config import Config
+from transtool.prop.items import Blank, Comment, PropItem, Translation
+
+
+class PropParser(object):
+    """
+    Streaming *.properties parser. Items are parsed and yielded lazily, one source line at a time,
+    so the caller can process (i.e. check) them while the file is still being read, without the
+    need to keep the whole content in memory.
+    """
+
+    ENCODING = 'utf-8'
+
+    def __init__(self, file: Optional[Union[Path, str]] = None):
+        """
+        :param file: Optional name of the parsed file, used in error messages only.
+        """
+        self.file = file
+
+    def parse(self, source: Union[IO, bytes, bytearray, memoryview]) -> Iterator[Tuple[int, PropItem]]:
+        """
+        Parses given source, yielding its items one by one, together with source line numbers.
+
+        :param source: Open file handle (text or binary) or byte buffer with file content.
+        :return: Generator yielding tuples of (1-based line number, PropItem).
+        """
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            source = io.TextIOWrapper(io.BytesIO(source), encoding=self.ENCODING)
+        elif isinstance(source, (io.RawIOBase, io.BufferedIOBase)):
+            source = io.TextIOWrapper(source, encoding=self.ENCODING)
+
+        line_number: int = 0
+        for line in iter(source.readline, ''):
+            line_number += 1
+            yield line_number, self.parse_line(line, line_number)
+
+    def parse_mapped(self, file: Path) -> Iterator[Tuple[int, PropItem]]:
+        """
+        Parses given file using memory mapping instead of buffered reads. Lines are located directly
+        in the mapped buffer and each line is decoded only when its item is about to be yielded, so
+        no per-line read calls are made and there's no need for any read buffer.
+        Lines are split on LF, with trailing CR stripped, same as parse_line() does.
+
+        :param file: File to parse.
+        :return: Generator yielding tuples of (1-based line number, PropItem).
+        """
+        with open(file, 'rb') as fh:
+            # Empty files cannot be mapped.
+            if fh.seek(0, io.SEEK_END) == 0:
+                return
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                size = len(buffer)
+                line_number: int = 0
+                start = 0
+                while start < size:
+                    end = buffer.find(b'\n', start)
+                    end = size if end == -1 else end + 1
+                    line_number += 1
+                    line = buffer[start:end].decode(self.ENCODING)
+                    start = end
+                    yield line_number, self.parse_line(line, line_number)
+
+    def parse_line(self, line: str, line_number: Optional[int] = None) -> PropItem:
+        """
+        Parses single line of *.properties file.
+
+        :param line: Line to parse. Trailing LF/CRLF is stripped if present.
+        :param line_number: Optional line number, used in error messages only.
+        :return: Parsed item.
+        """
+        # remove CRLF
+        if line and line[-1] == '\n':  # LF
+            line = line[:-1]
+        if line and line[-1] == '\r':  # CR
+            line = line[:-1]
+
+        # Skip empty lines
+        if line.strip() == '':
+            return Blank()
+
+        if line[0] in Config.ALLOWED_COMMENT_MARKERS:
+            return Comment(line)
+
+        # Whatever left should be valid key[:=]val entry
+        tmp = Translation.parse_translation_line(line)
+        if not tmp:
+            raise SyntaxError(f'Invalid syntax at line {line_number} of "{self.file}".')
+
+        key = tmp[0].strip()
+        separator = tmp[1].strip()
+        val = tmp[2].lstrip()
+        return Translation(key, val, separator)
@@ -0,0 +1,112 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+
+class IoPipeline(object):
+    """
+    Runs file reads and writes in the background, so disk (or network filesystem) latency overlaps
+    with checking done in the main thread. Operations are scheduled on asyncio event loop running in
+    its own thread, which hands the blocking calls to its executor. Each operation returns concurrent
+    Future, so callers stay synchronous and consume results in whatever order they need.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        """
+        :param max_workers: Max number of I/O operations run at the same time.
+        """
+        if max_workers < 1:
+            raise ValueError('Number of workers must be positive.')
+        self.max_workers = max_workers
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._writes: List[Future] = []
+
+    def __enter__(self) -> 'IoPipeline':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close(raise_errors=exc_type is None)
+
+    def start(self) -> None:
+        """
+        Starts the event loop thread.
+        """
+        if self._loop is not None:
+            return
+        self._loop = asyncio.new_event_loop()
+        self._semaphore = asyncio.Semaphore(self.max_workers)
+        self._thread = threading.Thread(target=self._loop.run_forever, name='trans-tool-io', daemon=True)
+        self._thread.start()
+
+    def close(self, raise_errors: bool = True) -> None:
+        """
+        Waits for all the scheduled writes to complete and stops the event loop.
+
+        :param raise_errors: If True, re-raises first error any write failed with.
+        """
+        if self._loop is None:
+            return
+        errors = [write.exception() for write in self._writes]
+        self._writes = []
+        # Waits for any pending reads too.
+        asyncio.run_coroutine_threadsafe(self._loop.shutdown_default_executor(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+        self._thread = None
+
+        errors = [error for error in errors if error is not None]
+        if raise_errors and errors:
+            raise errors[0]
+
+    # #################################################################################################
+
+    async def _run(self, func: Callable, *args) -> Any:
+        async with self._semaphore:
+            return await self._loop.run_in_executor(None, func, *args)
+
+    def submit(self, func: Callable, *args) -> Future:
+        """
+        Schedules blocking I/O call. Returns Future with its result.
+
+        :param func: Function to call.
+        :param args: Arguments to call the function with.
+        """
+        if self._loop is None:
+            raise RuntimeError('Pipeline is not started.')
+        return asyncio.run_coroutine_threadsafe(self._run(func, *args), self._loop)
+
+    def read(self, file: Path) -> Future:
+        """
+        Schedules read of given file. Returns Future with file content (bytes).
+
+        :param file: File to read.
+        """
+        return self.submit(file.read_bytes)
+
+    def write(self, func: Callable, *args) -> Future:
+        """
+        Schedules blocking write call. Unlike submit(), close() waits for all the writes to complete.
+
+        :param func: Function to call.
+        :param args: Arguments to call the function with.
+        """
+        future = self.submit(func, *args)
+        self._writes.append(future)
+        return future
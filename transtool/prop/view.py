@@ -0,0 +1,118 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+"""
+
+import itertools
+from collections.abc import Sequence as SequenceABC
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Union
+
+from transtool.config.config import Config
+from transtool.prop.columns import PropColumns
+from transtool.prop.items import PropItem, Translation
+from transtool.prop.ordered_set import FrozenOrderedSet
+
+
+class ReadOnlyItems(SequenceABC):
+    """
+    Read-only window over the first `length` elements of the items list, so items appended to the
+    list later are not visible. Items are handed out as-is, so they must be read-only already.
+    """
+
+    __slots__ = ('_items', '_length')
+
+    def __init__(self, items: List[PropItem], length: int):
+        self._items = items
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[PropItem]:
+        return itertools.islice(self._items, self._length)
+
+    def __getitem__(self, position: Union[int, slice]):
+        if isinstance(position, slice):
+            return tuple(self._items[idx] for idx in range(*position.indices(self._length)))
+        if position < 0:
+            position += self._length
+        if not 0 <= position < self._length:
+            raise IndexError('Item index out of range.')
+        return self._items[position]
+
+
+# #################################################################################################
+
+# noinspection PyUnresolvedReferences
+class PropFileView(object):
+    """
+    Read-only snapshot of a PropFile, handed to checkers instead of the PropFile itself. Items are
+    read-only (see PropFile.view()), keys and commented out keys are immutable sets, so checkers
+    cannot alter the checked file (nor each other's input). The view is meant to be built once per
+    file and then shared by all the checkers.
+    """
+
+    config: Config
+    file: Optional[Path]
+    language: Optional[str]
+    loaded: bool
+    separator: str
+    keys: FrozenOrderedSet
+    commented_out_keys: FrozenOrderedSet
+
+    # Do NOT "fix" the PropFile reference and do not import it, or you step on circular dependency!
+    def __init__(self, prop_file: 'PropFile'):
+        items: Sequence[PropItem]
+        index: Dict[str, int] = {}
+        if isinstance(prop_file.items, PropColumns):
+            # Items are materialized (frozen) on access, so we do not want to touch them here.
+            items = prop_file.items.freeze()
+            for position in items.translation_indices():
+                index.setdefault(items.get_key(position), position)
+        else:
+            items = ReadOnlyItems(prop_file.items, len(prop_file.items))
+            for position, item in enumerate(items):
+                if isinstance(item, Translation):
+                    # In case of duplicated keys, the first occurrence wins.
+                    index.setdefault(item.key, position)
+
+        self._set('config', prop_file.config)
+        self._set('file', prop_file.file)
+        self._set('language', prop_file.language)
+        self._set('loaded', prop_file.loaded)
+        self._set('separator', prop_file.separator)
+        self._set('keys', FrozenOrderedSet(prop_file.keys))
+        self._set('commented_out_keys', FrozenOrderedSet(prop_file.commented_out_keys))
+        self._set('_items', items)
+        self._set('_index', index)
+
+    def _set(self, name: str, value) -> None:
+        object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f'{type(self).__name__} is read-only.')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'{type(self).__name__} is read-only.')
+
+    # #################################################################################################
+
+    @property
+    def items(self) -> Sequence[PropItem]:
+        return self._items
+
+    def find_by_key(self, key: str) -> Optional[Translation]:
+        """
+        Returns translation entry referenced by given key or None.
+
+        :param key: Translation key to look for.
+        :return: Instance of Translation or None.
+        """
+        position = self._index.get(key)
+        return None if position is None else self._items[position]
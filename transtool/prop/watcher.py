@@ -0,0 +1,59 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+class FileWatcher(object):
+    """
+    Detects changes of translation files in given directories (see --watch). Directories are polled:
+    each poll lists every directory once and compares modification time and size of the files with
+    ones seen by previous poll, which is cheap enough to be done many times per second.
+    """
+
+    def __init__(self, directories: Iterable[Path], file_suffix: str):
+        """
+        :param directories: Directories to watch. Subdirectories are not watched.
+        :param file_suffix: Suffix of watched files, including leading dot (i.e. ".properties").
+        """
+        self.directories = sorted(set(directories))
+        self.file_suffix = file_suffix
+        # Directory -> names of watched files in it, as of last poll.
+        self.file_names: Dict[Path, List[str]] = {}
+        # File -> (modification time, size), as of last poll.
+        self._stamps: Dict[Path, Tuple[int, int]] = self._scan()
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        stamps = {}
+        for directory in self.directories:
+            file_names = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(self.file_suffix) and entry.is_file():
+                            stat = entry.stat()
+                            stamps[directory / entry.name] = (stat.st_mtime_ns, stat.st_size)
+                            file_names.append(entry.name)
+            except (FileNotFoundError, NotADirectoryError):
+                # Directory can be gone for a while, i.e. while being replaced by VCS checkout.
+                pass
+            self.file_names[directory] = file_names
+        return stamps
+
+    def poll(self) -> Set[Path]:
+        """
+        Returns files created, modified or deleted since previous poll (or since the watcher was created).
+        """
+        stamps = self._scan()
+        changed = {file for file in stamps.keys() | self._stamps.keys() if stamps.get(file) != self._stamps.get(file)}
+        self._stamps = stamps
+        return changed
@@ -8,20 +8,72 @@
 #
 """
 
-from typing import Union, List, Optional
+from typing import Dict, Union, List, Optional
 
 from simplelog.log import Log
+from transtool.config.config import Config
 from transtool.report.items import Error, ReportItem, Warn
 
 
 # #################################################################################################
 
 class ReportGroup(list):
-    def __init__(self, label: str):
+    # Max number of items kept in each group. Issues above the limit are counted only. 0 means no limit.
+    # Set by configure().
+    _limit: int = 0
+
+    def __init__(self, label: str, checker_id: Optional[str] = None):
         super().__init__()
         self.label = label
+        # ID of the checker that produced the group, if any. Set by PropFile.add_results().
+        self.checker_id = checker_id
         self.warnings = 0
         self.errors = 0
+        # Number of issues counted but not kept due to the limit.
+        self.omitted = 0
+        # Report the group was added to. Its totals are kept up to date as issues are added to the group.
+        # Do NOT "fix" the Report reference and do not import it, or you step on circular dependency!
+        self._report: Optional['Report'] = None
+
+    def __getstate__(self) -> Dict:
+        # Group can be pickled on its own (i.e. by ParseCache), so the report is not pickled along.
+        # Report re-attaches its groups once unpickled.
+        state = self.__dict__.copy()
+        state['_report'] = None
+        return state
+
+    # Do NOT "fix" the Report reference and do not import it, or you step on circular dependency!
+    def attach(self, report: Optional['Report']) -> None:
+        """
+        Makes given report the one notified about issues added to this group from now on.
+        Used by Report.add().
+
+        :param report: Report to notify or None.
+        """
+        self._report = report
+
+    def _count(self, is_warning: bool) -> None:
+        if is_warning:
+            self.warnings += 1
+        else:
+            self.errors += 1
+        if self._report is not None:
+            self._report.count(is_warning)
+
+    @staticmethod
+    def configure(config: Config) -> None:
+        """
+        Applies group size limit set in config (see --report-limit) to all groups.
+
+        :param config: Application config.
+        """
+        ReportGroup._limit = config.report_limit
+
+    def is_full(self) -> bool:
+        """
+        Returns True if group holds as many items as the limit allows.
+        """
+        return 0 < self._limit <= len(self)
 
     def create(self, position: Optional[Union[str, int]], msg: str, trans_key: Optional[str] = None) -> None:
         """
@@ -55,11 +107,11 @@ class ReportGroup(list):
                 continue
             if not issubclass(type(item), ReportItem):
                 raise TypeError(f'Item must be subclass of ReportItem. "{type(item)}" given.')
-            self.append(item)
-            if isinstance(item, Warn):
-                self.warnings += 1
+            self._count(isinstance(item, Warn))
+            if self.is_full():
+                self.omitted += 1
             else:
-                self.errors += 1
+                self.append(item)
 
     @staticmethod
     def _to_list(line: Optional[Union[str, int]]) -> Optional[List[str]]:
@@ -79,6 +131,11 @@ class ReportGroup(list):
         return Warn(ReportGroup._to_list(line), msg, trans_key)
 
     def warn(self, line: Optional[Union[str, int]], msg: str, trans_key: Optional[str] = None) -> None:
+        if self.is_full():
+            # No need to build the item that would not be kept anyway.
+            self._count(True)
+            self.omitted += 1
+            return
         self.add(self.build_warn(line, msg, trans_key))
 
     @staticmethod
@@ -86,6 +143,11 @@ class ReportGroup(list):
         return Error(ReportGroup._to_list(line), msg, trans_key)
 
     def error(self, line: Optional[Union[str, int]], msg: str, trans_key: Optional[str] = None) -> None:
+        if self.is_full():
+            # No need to build the item that would not be kept anyway.
+            self._count(False)
+            self.omitted += 1
+            return
         self.add(self.build_error(line, msg, trans_key))
 
     def dump(self, show_warnings_as_errors: bool = False):
@@ -103,4 +165,10 @@ class ReportGroup(list):
                 Log.w(entry.to_string())
             else:
                 Log.e(entry.to_string())
+        if self.omitted > 0:
+            msg = f'…and {self.omitted} more.'
+            if show_warnings_as_errors or self.errors > 0:
+                Log.e(msg)
+            else:
+                Log.w(msg)
         Log.pop()
@@ -14,6 +14,9 @@ from typing import Union, Optional
 # #################################################################################################
 
 class ReportItem(object):
+    # Broken files can produce lots of issues, so no per-instance __dict__. Message is built by to_string() when needed.
+    __slots__ = ('position', 'msg', 'trans_key')
+
     def __init__(self, position: Optional[Union[str, int]], msg: str, trans_key: Optional[str] = None) -> None:
         if position is not None:
             if isinstance(position, int):
@@ -42,10 +45,10 @@ class ReportItem(object):
 # #################################################################################################
 
 class Error(ReportItem):
-    pass
+    __slots__ = ()
 
 
 # #################################################################################################
 
 class Warn(ReportItem):
-    pass
+    __slots__ = ()
@@ -8,7 +8,7 @@
 #
 """
 
-from typing import List
+from typing import Dict, Iterator, List
 
 from simplelog.log import Log
 
@@ -23,6 +23,15 @@ class Report(object):
     def __init__(self, config: Config):
         self._groups: List[ReportGroup] = []
         self.config = config
+        # Running totals of all the groups. Updated as groups are added and as issues are added to the groups.
+        self._errors = 0
+        self._warnings = 0
+
+    def __setstate__(self, state: Dict) -> None:
+        # Groups are pickled without reference to the report (see ReportGroup.__getstate__()).
+        self.__dict__.update(state)
+        for group in self._groups:
+            group.attach(self)
 
     @property
     def errors(self) -> int:
@@ -30,7 +39,7 @@ class Report(object):
         Returns cumulative number of errors in whole report.
         :return:
         """
-        return sum(group.errors for group in self._groups)
+        return self._errors
 
     @property
     def warnings(self) -> int:
@@ -38,7 +47,18 @@ class Report(object):
         Returns cumulative number of warnings in whole report.
         :return:
         """
-        return sum(group.warnings for group in self._groups)
+        return self._warnings
+
+    def count(self, is_warning: bool) -> None:
+        """
+        Updates the totals with single issue added to one of the groups. Called by ReportGroup.
+
+        :param is_warning: True for warning, False for error.
+        """
+        if is_warning:
+            self._warnings += 1
+        else:
+            self._errors += 1
 
     def is_ok(self) -> bool:
         return not self.is_fatal()
@@ -59,6 +79,24 @@ class Report(object):
         if skip_empty and report_group.empty():
             return
         self._groups.append(report_group)
+        self._errors += report_group.errors
+        self._warnings += report_group.warnings
+        # Group can belong to one report only. If it was added to other report before, that report's totals
+        # are no longer updated.
+        report_group.attach(self)
+
+    def merge(self, other: 'Report') -> None:
+        """
+        Adds all the groups of other report (i.e. one returned by worker process) to this report.
+        Groups are not copied, so issues added to them later count to this report only.
+
+        :param other: Report to merge.
+        """
+        for report_group in other:
+            self.add(report_group, skip_empty=False)
+
+    def __iter__(self) -> Iterator[ReportGroup]:
+        return iter(self._groups)
 
     def empty(self) -> bool:
         return len(self._groups) == 0  # noqa: WPS507
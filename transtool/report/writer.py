@@ -0,0 +1,259 @@
+"""
+#
+# trans-tool
+# The translation files checker and syncing tool.
+#
+# Copyright ©2021-2024 Marcin Orlowski <MarcinOrlowski.com>
+# https://github.com/MarcinOrlowski/trans-tool/
+#
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, TextIO
+
+from transtool.const import Const
+from transtool.report.group import ReportGroup
+from transtool.report.items import ReportItem, Warn
+from transtool.report.report import Report
+
+
+class ReportWriter(object):
+    """
+    Writes reported issues in machine-readable form (see --report-file). Issues are written as soon
+    as the report of each file is ready, one by one, so nothing is kept in memory once written.
+    """
+
+    # File name meaning standard output.
+    STDOUT = '-'
+
+    def __init__(self, target: TextIO, fatal: bool = False, close_target: bool = True):
+        """
+        :param target: Stream to write to.
+        :param fatal: If True, warnings are written as errors (as with --fatal).
+        :param close_target: If False, target is only flushed once writing is done (i.e. for standard output).
+        """
+        self.target = target
+        self.fatal = fatal
+        self.close_target = close_target
+
+    @staticmethod
+    def create(report_format: str, file_name: str, fatal: bool = False, stdout: Optional[TextIO] = None) -> 'ReportWriter':
+        """
+        Returns writer of given format, writing to given file.
+
+        :param report_format: One of Config.REPORT_FORMATS.
+        :param file_name: File to write to. Use "-" (STDOUT) to write to standard output.
+        :param fatal: If True, warnings are written as errors.
+        :param stdout: Stream to use as standard output. Defaults to sys.stdout.
+        """
+        writers = {
+            'jsonl': JsonLinesReportWriter,
+            'sarif': SarifReportWriter,
+        }
+        if report_format not in writers:
+            raise ValueError(f'Unsupported report format: {report_format}')
+        if file_name == ReportWriter.STDOUT:
+            return writers[report_format](stdout or sys.stdout, fatal, close_target=False)
+        return writers[report_format](open(file_name, 'w', encoding='utf-8'), fatal)  # noqa: WPS515
+
+    def __enter__(self) -> 'ReportWriter':
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def open(self) -> None:
+        """
+        Writes whatever needs to precede reported issues.
+        """
+
+    def close(self) -> None:
+        """
+        Writes whatever needs to follow reported issues and closes the target (unless told not to).
+        """
+        if self.close_target:
+            self.target.close()
+        else:
+            self.target.flush()
+
+    def write_report(self, file: Path, language: Optional[str], report: Report) -> None:
+        """
+        Writes all the issues of given report.
+
+        :param file: File the report is about.
+        :param language: Language code of the file or None for base file.
+        :param report: Report to write.
+        """
+        for group in report:
+            for item in group:
+                self.write_item(file, language, group, item)
+            if group.omitted:
+                self.write_omitted(file, language, group)
+
+    def write_item(self, file: Path, language: Optional[str], group: ReportGroup, item: ReportItem) -> None:
+        """
+        Writes single issue.
+
+        :param file: File the issue was found in.
+        :param language: Language code of the file or None for base file.
+        :param group: Report group the issue belongs to.
+        :param item: The issue.
+        """
+        raise NotImplementedError
+
+    def write_omitted(self, file: Path, language: Optional[str], group: ReportGroup) -> None:
+        """
+        Writes the number of issues of given group that were counted, but not kept due to --report-limit.
+
+        :param file: File the issues were found in.
+        :param language: Language code of the file or None for base file.
+        :param group: Report group with omitted issues.
+        """
+        raise NotImplementedError
+
+    # #################################################################################################
+
+    def _get_group_severity(self, group: ReportGroup) -> str:
+        return 'error' if group.errors > 0 or self.fatal else 'warning'
+
+    @staticmethod
+    def _get_omitted_message(group: ReportGroup) -> str:
+        return f'{group.omitted} more issue(s) not reported due to report limit.'
+
+    def _get_severity(self, item: ReportItem) -> str:
+        return 'warning' if isinstance(item, Warn) and not self.fatal else 'error'
+
+    @staticmethod
+    def _get_line(item: ReportItem) -> Optional[int]:
+        """
+        Returns line number the issue was reported at, if known. Position is either line number
+        or "line:column" string.
+        """
+        if item.position is None:
+            return None
+        line = item.position.split(':')[0]
+        return int(line) if line.isdigit() else None
+
+    @staticmethod
+    def _get_column(item: ReportItem) -> Optional[int]:
+        """
+        Returns column the issue was reported at, if known (i.e. position is "line:column" string).
+        """
+        if item.position is None or ':' not in item.position:
+            return None
+        column = item.position.split(':')[1]
+        return int(column) if column.isdigit() else None
+
+    @staticmethod
+    def _get_rule_id(group: ReportGroup) -> str:
+        # Groups not produced by checkers (i.e. duplicated keys found while loading) have no checker ID.
+        return group.checker_id if group.checker_id else group.label.title().replace(' ', '')
+
+
+class JsonLinesReportWriter(ReportWriter):
+    """
+    Writes each issue as separate JSON object, one per line.
+    """
+
+    def write_item(self, file: Path, language: Optional[str], group: ReportGroup, item: ReportItem) -> None:
+        record = {
+            'file': str(file),
+            'language': language,
+            'checker': self._get_rule_id(group),
+            'group': group.label,
+            'severity': self._get_severity(item),
+            'position': item.position,
+            'line': self._get_line(item),
+            'key': item.trans_key,
+            'message': item.msg,
+        }
+        self._write_record(record)
+
+    def write_omitted(self, file: Path, language: Optional[str], group: ReportGroup) -> None:
+        record = {
+            'file': str(file),
+            'language': language,
+            'checker': self._get_rule_id(group),
+            'group': group.label,
+            'severity': self._get_group_severity(group),
+            'position': None,
+            'line': None,
+            'key': None,
+            'message': self._get_omitted_message(group),
+            'omitted': group.omitted,
+        }
+        self._write_record(record)
+
+    def _write_record(self, record: Dict) -> None:
+        self.target.write(json.dumps(record, ensure_ascii=False))
+        self.target.write('\n')
+
+
+class SarifReportWriter(ReportWriter):
+    """
+    Writes issues as SARIF v2.1.0 log, as consumed by code scanning tools. The log is single JSON
+    document, but issues are still written one by one: document's head is written by open(), each
+    issue is appended to `results` list of the only run and the document is finished by close().
+    Numbers of issues omitted due to --report-limit are written by close() as tool execution
+    notifications of the run's invocation.
+    """
+
+    SARIF_VERSION = '2.1.0'
+    SARIF_SCHEMA = 'https://json.schemastore.org/sarif-2.1.0.json'
+
+    def __init__(self, target: TextIO, fatal: bool = False, close_target: bool = True):
+        super().__init__(target, fatal, close_target)
+        self._results_cnt = 0
+        self._notifications: List[Dict] = []
+
+    def open(self) -> None:
+        driver = {
+            'name': Const.APP_NAME,
+            'version': Const.APP_VERSION,
+            'informationUri': Const.APP_URL,
+        }
+        head = json.dumps({'$schema': self.SARIF_SCHEMA, 'version': self.SARIF_VERSION})
+        run = json.dumps({'tool': {'driver': driver}})
+        # Strip closing braces, so results can be appended.
+        self.target.write(f'{head[:-1]}, "runs": [{run[:-1]}, "results": [\n')
+
+    def close(self) -> None:
+        self.target.write('\n]')
+        if self._notifications:
+            invocation = {'executionSuccessful': True, 'toolExecutionNotifications': self._notifications}
+            self.target.write(f', "invocations": [{json.dumps(invocation, ensure_ascii=False)}]')
+        self.target.write('}]}\n')
+        super().close()
+
+    def write_omitted(self, file: Path, language: Optional[str], group: ReportGroup) -> None:
+        self._notifications.append({
+            'level': self._get_group_severity(group),
+            'message': {'text': self._get_omitted_message(group)},
+            'associatedRule': {'id': self._get_rule_id(group)},
+            'locations': [{'physicalLocation': {'artifactLocation': {'uri': Path(file).as_posix()}}}],
+            'properties': {'language': language, 'group': group.label, 'omitted': group.omitted},
+        })
+
+    def write_item(self, file: Path, language: Optional[str], group: ReportGroup, item: ReportItem) -> None:
+        location: Dict = {'artifactLocation': {'uri': Path(file).as_posix()}}
+        line = self._get_line(item)
+        if line is not None:
+            location['region'] = {'startLine': line}
+            column = self._get_column(item)
+            # SARIF columns are 1-based, same as columns reported by checkers.
+            if column is not None:
+                location['region']['startColumn'] = column
+        result = {
+            'ruleId': self._get_rule_id(group),
+            'level': self._get_severity(item),
+            'message': {'text': item.to_string()},
+            'locations': [{'physicalLocation': location}],
+            'properties': {'language': language, 'key': item.trans_key, 'group': group.label},
+        }
+        if self._results_cnt:
+            self.target.write(',\n')
+        self.target.write(json.dumps(result, ensure_ascii=False))
+        self._results_cnt += 1